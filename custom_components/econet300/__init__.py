@@ -1,35 +1,123 @@
 """The Example Integration integration."""
+
 from __future__ import annotations
 
+from datetime import datetime, timedelta
+import logging
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.helpers.event import async_track_time_interval
 
 from .api import make_api
-from .common import AuthError, EconetDataCoordinator
-from .const import DOMAIN, SERVICE_API, SERVICE_COORDINATOR
+from .common import AuthError, EconetConfigCoordinator, EconetDataCoordinator
+from .const import (
+    CONF_IDENTITY,
+    DATA_FLEET_SCHEDULER,
+    DOMAIN,
+    MEM_CACHE_SWEEP_INTERVAL,
+    SERVICE_API,
+    SERVICE_CONFIG_COORDINATOR,
+    SERVICE_COORDINATOR,
+)
+from .entity import forget_device_info
 from .mem_cache import MemCache
+from .scheduler import FleetScheduler
+from .snapshot import EconetSnapshot
+
+_LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR, Platform.NUMBER, Platform.SWITCH, Platform.SELECT, Platform.CLIMATE]
+PLATFORMS: list[Platform] = [
+    Platform.SENSOR,
+    Platform.BINARY_SENSOR,
+    Platform.NUMBER,
+    Platform.SWITCH,
+    Platform.SELECT,
+    Platform.CLIMATE,
+]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Econet300 Integration from a config entry."""
 
     hass.data.setdefault(DOMAIN, {})
+    # One scheduler for all entries, so their polls do not line up
+    scheduler = hass.data[DOMAIN].setdefault(DATA_FLEET_SCHEDULER, FleetScheduler())
 
     cache = MemCache()
 
     try:
-        api = await make_api(hass, cache, entry.data)
+        api = await make_api(hass, cache, entry.data, scheduler)
+
+        async def _async_close_api(event: Event | None = None) -> None:
+            await api.close()
+
+        # The api keeps its own connection pool to the controller, closed on
+        # stop while queued writes can still be sent
+        entry.async_on_unload(_async_close_api)
+        entry.async_on_unload(
+            hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_close_api)
+        )
+
+        entry.async_on_unload(scheduler.register(api.host()))
+
+        @callback
+        def _async_sweep_cache(now: datetime) -> None:
+            """Drop expired registry copies even while nothing reads the cache."""
+            cache.sweep()
+
+        entry.async_on_unload(
+            async_track_time_interval(
+                hass, _async_sweep_cache, timedelta(seconds=MEM_CACHE_SWEEP_INTERVAL)
+            )
+        )
+
+        config_coordinator = EconetConfigCoordinator(hass, api)
+        coordinator = EconetDataCoordinator(
+            hass, api, config_coordinator, scheduler=scheduler
+        )
+        snapshot = EconetSnapshot(hass, entry.entry_id, api.uid())
 
-        coordinator = EconetDataCoordinator(hass, api)
-        await coordinator.async_config_entry_first_refresh()
+        if (restored := await snapshot.async_load()) is not None:
+            # Entities come up with the last known values, refreshed in the background
+            _LOGGER.debug("Starting from the last saved snapshot")
+            coordinator.async_restore_snapshot(*restored)
+            entry.async_create_background_task(
+                hass,
+                _async_refresh(coordinator, config_coordinator),
+                f"{DOMAIN} first refresh",
+            )
+        else:
+            # regParams first, it carries the versions of the config registries
+            await coordinator.async_config_entry_first_refresh()
+            await config_coordinator.async_config_entry_first_refresh()
+
+        @callback
+        def _async_save_snapshot() -> None:
+            if coordinator.last_update_success and not coordinator.stale:
+                snapshot.async_schedule_save(*coordinator.snapshot_data())
+
+        entry.async_on_unload(coordinator.async_add_listener(_async_save_snapshot))
+
+        @callback
+        def _async_persist_identity() -> None:
+            """Store the identity revalidated from sysParams if it changed."""
+            if entry.data.get(CONF_IDENTITY) != api.identity():
+                hass.config_entries.async_update_entry(
+                    entry, data={**entry.data, CONF_IDENTITY: api.identity()}
+                )
+
+        _async_persist_identity()
+        entry.async_on_unload(
+            config_coordinator.async_add_listener(_async_persist_identity)
+        )
 
         hass.data[DOMAIN][entry.entry_id] = {
             SERVICE_API: api,
             SERVICE_COORDINATOR: coordinator,
+            SERVICE_CONFIG_COORDINATOR: config_coordinator,
         }
 
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -41,9 +129,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         raise ConfigEntryNotReady("Target not found") from timeout_error
 
 
+async def _async_refresh(
+    coordinator: EconetDataCoordinator, config_coordinator: EconetConfigCoordinator
+) -> None:
+    """Replace the restored snapshot with live data."""
+    # regParams first, it carries the versions of the config registries
+    await coordinator.async_refresh()
+    await config_coordinator.async_refresh()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        data = hass.data[DOMAIN].pop(entry.entry_id)
+        forget_device_info(data[SERVICE_API])
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the snapshot of a deleted config entry."""
+    await EconetSnapshot(hass, entry.entry_id, entry.data.get("uid", "")).async_remove()
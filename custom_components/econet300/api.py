@@ -1,33 +1,98 @@
 """Module provides the API functionality for ecoNET-300 Home Assistant Integration."""
+
 import asyncio
+from collections.abc import Awaitable, Callable, Mapping
+import contextlib
 from http import HTTPStatus
 import logging
+import random
+import time
 from typing import Any
 import aiohttp
-from aiohttp import BasicAuth, ClientSession
+from aiohttp import BasicAuth, ClientSession, TCPConnector
 
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
     # API_EDITABLE_PARAMS_LIMITS_DATA,
     # API_EDITABLE_PARAMS_LIMITS_URI,
     API_REG_PARAMS_PARAM_DATA,
+    API_REG_PARAMS_PARAM_SETTINGS_VER,
     API_REG_PARAMS_URI,
-    # API_REG_PARAMSDATA_URI,
-    # API_REG_PARAMSDATA_PARAM_DATA,
+    API_REG_PARAMSDATA_URI,
+    API_REG_PARAMSDATA_PARAM_DATA,
+    API_REG_PARAMSDATA_PARAM_VERSION,
     API_EDIT_PARAMS_URI,
     API_EDIT_PARAMS_DATA,
+    API_EDIT_PARAMS_VALUE,
+    API_CURRENT_DATA_PARAMS_EDITS_DATA,
+    API_CURRENT_DATA_PARAMS_EDITS_MAX,
+    API_CURRENT_DATA_PARAMS_EDITS_MIN,
+    API_CURRENT_DATA_PARAMS_EDITS_URI,
+    API_CONNECTION_DNS_CACHE_TTL,
+    API_CONNECTION_KEEPALIVE_TIMEOUT,
+    API_CONNECTION_LIMIT,
+    API_FETCH_MAX_CONCURRENCY,
+    API_FETCH_TIMEOUT,
+    API_JSON_EXECUTOR_THRESHOLD,
+    API_JSON_EXECUTOR_THRESHOLD_ORJSON,
+    API_REQUEST_TIMEOUT,
+    API_RETRY_BASE_DELAY,
+    API_RETRY_BUDGET,
+    API_RETRY_MAX_ATTEMPTS,
+    API_RETRY_MAX_DELAY,
+    API_WRITE_DEBOUNCE,
+    API_WRITE_FLUSH_TIMEOUT,
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_RESET_TIMEOUT,
+    API_SYS_PARAMS_KEYS,
+    API_SYS_PARAMS_MODULE_PREFIX,
     API_SYS_PARAMS_PARAM_HW_VER,
+    API_SYS_PARAMS_PARAM_MODEL_ID,
     API_SYS_PARAMS_PARAM_SW_REV,
     API_SYS_PARAMS_PARAM_UID,
+    API_SYS_PARAMS_SOFT_VER_SUFFIX,
     API_SYS_PARAMS_URI,
+    CONF_IDENTITY,
+    CURRENT_DATA_PARAMS_EDITS_MAPPING_TABLE,
     EDITABLE_PARAMS_MAPPING_TABLE,
+    REG_PARAMSDATA_PARAMS_MAPPING_TABLE,
+    VERSIONED_REFRESH_MAX_AGE,
+    VERSIONED_REFRESH_VERSION_KEYS,
 )
 from .mem_cache import MemCache
+from .registry import (
+    RegistryLayer,
+    RegistrySnapshot,
+    RegParamsDataIndex,
+    RegParamsDataValues,
+)
+from .scheduler import FleetScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
+try:
+    from orjson import loads as json_loads
+
+    JSON_EXECUTOR_THRESHOLD = API_JSON_EXECUTOR_THRESHOLD_ORJSON
+except ImportError:
+    from json import loads as json_loads
+
+    JSON_EXECUTOR_THRESHOLD = API_JSON_EXECUTOR_THRESHOLD
+
+
+def extract_sys_params(sys_params: dict[str, Any]) -> dict[str, Any]:
+    """Keep only the sysParams keys used by the integration."""
+    return {
+        key: value
+        for key, value in sys_params.items()
+        if key in API_SYS_PARAMS_KEYS
+        or (
+            key.startswith(API_SYS_PARAMS_MODULE_PREFIX)
+            and key.endswith(API_SYS_PARAMS_SOFT_VER_SUFFIX)
+        )
+    }
+
 
 def map_param(param_name):
     """Check params mapping in const.py."""
@@ -39,10 +104,12 @@ def map_param(param_name):
 
 class Limits:
     """Construct all the necessary attributes for the Limits object."""
-    def __init__(self, min_v: int | None, max_v: int | None):
+
+    def __init__(self, min_v: int | None, max_v: int | None, step: float | None = None):
         """Construct the necessary attributes for the Limits object."""
         self.minv = min_v
         self.maxv = max_v
+        self.step = step
 
     class AuthError(Exception):
         """Raised when authentication fails."""
@@ -60,25 +127,112 @@ class DataError(Exception):
     """Raised when there is an error with the data."""
 
 
+class CircuitOpenError(ApiError):
+    """Raised when requests are rejected because the controller is unreachable."""
+
+
+class CircuitBreaker:
+    """Fail fast after consecutive failed requests to the controller.
+
+    After the reset timeout a single trial request is let through (half-open),
+    its success closes the circuit and its failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_BREAKER_RESET_TIMEOUT,
+    ):
+        """Construct the necessary attributes for the CircuitBreaker object."""
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    def state(self) -> str:
+        """Get the circuit state."""
+        return self._state
+
+    def is_open(self) -> bool:
+        """Check if requests are currently rejected."""
+        return self._state != self.CLOSED and self.retry_in() > 0
+
+    def retry_in(self) -> float:
+        """Get the seconds left until the next trial request is allowed."""
+        return max(0.0, self._opened_at + self._reset_timeout - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """Check if a request may be sent, turning an expired open circuit half-open."""
+        if self._state == self.CLOSED:
+            return True
+
+        if self.retry_in() > 0:
+            return False
+
+        self._state = self.HALF_OPEN
+        self._opened_at = time.monotonic()
+        return True
+
+    def record_success(self) -> None:
+        """Close the circuit after the controller answered."""
+        if self._state != self.CLOSED:
+            _LOGGER.info("Controller reachable again, closing circuit")
+
+        self._state = self.CLOSED
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the circuit past the threshold."""
+        self._failures += 1
+
+        if self._state == self.HALF_OPEN or self._failures >= self._failure_threshold:
+            if self._state == self.CLOSED:
+                _LOGGER.warning(
+                    "Controller unreachable after %d failed requests, opening circuit for %d s",
+                    self._failures,
+                    self._reset_timeout,
+                )
+
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+
+
 class EconetClient:
     """Client for interacting with the ecoNET-300 API."""
 
     def __init__(
-        self, host: str, username: str, password: str, session: ClientSession
+        self,
+        host: str,
+        username: str,
+        password: str,
+        session: ClientSession | None = None,
+        executor_threshold: int = JSON_EXECUTOR_THRESHOLD,
     ) -> None:
-        """Initialize the EconetClient."""
+        """Initialize the EconetClient.
+
+        Without a session the client keeps its own keep-alive connection pool
+        to the controller, which has to be released with close().
+        """
 
         proto = ["http://", "https://"]
 
         not_contains = all(p not in host for p in proto)
 
         if not_contains:
-            #_LOGGER.warning("Manually adding 'http' to host")
+            # _LOGGER.warning("Manually adding 'http' to host")
             host = "http://" + host
 
         self._host = host
         self._session = session
+        self._owns_session = session is None
+        self._breaker = CircuitBreaker()
         self._auth = BasicAuth(username, password)
+        self._executor_threshold = executor_threshold
         self._model_id = "default-model-id"
         self._sw_revision = "default-sw-revision"
 
@@ -86,6 +240,32 @@ class EconetClient:
         """Get the host."""
         return self._host
 
+    def circuit_breaker(self) -> CircuitBreaker:
+        """Get the circuit breaker guarding requests to the controller."""
+        return self._breaker
+
+    def _get_session(self) -> ClientSession:
+        """Get the session, creating the dedicated connection pool on first use."""
+        if self._owns_session and (self._session is None or self._session.closed):
+            # The embedded web server of the module chokes on parallel
+            # sockets, so keep a small pool of long lived connections.
+            self._session = ClientSession(
+                connector=TCPConnector(
+                    limit=API_CONNECTION_LIMIT,
+                    limit_per_host=API_CONNECTION_LIMIT,
+                    keepalive_timeout=API_CONNECTION_KEEPALIVE_TIMEOUT,
+                    use_dns_cache=True,
+                    ttl_dns_cache=API_CONNECTION_DNS_CACHE_TTL,
+                )
+            )
+
+        return self._session
+
+    async def close(self) -> None:
+        """Close the dedicated connection pool."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
 
     async def set_param(self, key: str, value: str):
         """Set a parameter."""
@@ -93,7 +273,6 @@ class EconetClient:
         _LOGGER.debug("Set Param URL: %s", url)
         return await self._get(url)
 
-
     async def get_params(self, reg: str):
         """Get parameters for a given registry.
 
@@ -108,8 +287,14 @@ class EconetClient:
         return await self._get(url)
 
     async def _get(self, url):
+        if not self._breaker.allow_request():
+            raise CircuitOpenError(
+                f"Controller {self._host} unreachable, retrying in {self._breaker.retry_in():.0f} s"
+            )
+
         attempt = 1
-        max_attempts = 5
+        max_attempts = API_RETRY_MAX_ATTEMPTS
+        deadline = time.monotonic() + API_RETRY_BUDGET
 
         while attempt <= max_attempts:
             try:
@@ -119,8 +304,8 @@ class EconetClient:
                     self._model_id,
                     self._sw_revision,
                 )
-                async with await self._session.get(
-                    url, auth=self._auth, timeout=10
+                async with await self._get_session().get(
+                    url, auth=self._auth, timeout=API_REQUEST_TIMEOUT
                 ) as resp:
                     _LOGGER.debug("Received response with status: %s", resp.status)
                     if resp.status == HTTPStatus.UNAUTHORIZED:
@@ -133,6 +318,10 @@ class EconetClient:
                         except (aiohttp.ClientError, aiohttp.ClientResponseError) as e:
                             error_message = f"Could not retrieve error message: {e}"
 
+                        if resp.status >= HTTPStatus.INTERNAL_SERVER_ERROR:
+                            # Answering with errors only counts against the circuit
+                            self._breaker.record_failure()
+
                         _LOGGER.error(
                             "Failed to fetch data from URL: %s (Status: %s) - Response: %s",
                             url,
@@ -141,35 +330,110 @@ class EconetClient:
                         )
                         return None
 
-                    data = await resp.json()
+                    body = await resp.read()
+                    self._breaker.record_success()
+                    data = await self._decode(body)
                     _LOGGER.debug("Fetched data: %s", data)
                     return data
 
-            except TimeoutError:
-                _LOGGER.warning("Timeout error, retry(%i/%i)", attempt, max_attempts)
-                await asyncio.sleep(1)
+            except (TimeoutError, aiohttp.ClientError) as err:
+                # Exponential backoff with jitter, within the retry budget
+                delay = min(
+                    API_RETRY_MAX_DELAY, API_RETRY_BASE_DELAY * 2 ** (attempt - 1)
+                ) * random.uniform(0.5, 1)
+
+                if (
+                    attempt == max_attempts
+                    or time.monotonic() + delay + API_REQUEST_TIMEOUT > deadline
+                ):
+                    break
+
+                _LOGGER.warning(
+                    "%s error, retry(%i/%i) in %.1f s",
+                    type(err).__name__,
+                    attempt,
+                    max_attempts,
+                    delay,
+                )
+                await asyncio.sleep(delay)
             attempt += 1
-        _LOGGER.error(
-            "Failed to fetch data from %s after %d attempts", url, max_attempts
-        )
+
+        self._breaker.record_failure()
+        _LOGGER.error("Failed to fetch data from %s after %d attempts", url, attempt)
         return None
 
+    async def _decode(self, body: bytes) -> Any:
+        """Decode a JSON body, in the executor when it is large enough to stall the event loop."""
+        if len(body) < self._executor_threshold:
+            return json_loads(body)
+
+        return await asyncio.get_running_loop().run_in_executor(None, json_loads, body)
+
+
 class Econet300Api:
     """Client for interacting with the ecoNET-300 API."""
 
-    def __init__(self, client: EconetClient, cache: MemCache) -> None:
+    def __init__(
+        self,
+        client: EconetClient,
+        cache: MemCache,
+        versioned_refresh: bool = True,
+        concurrent_fetch: bool = True,
+        max_concurrent_fetches: int = API_FETCH_MAX_CONCURRENCY,
+        scheduler: FleetScheduler | None = None,
+    ) -> None:
         """Initialize the Econet300Api object with a client, cache, and default values for uid, sw_revision, and hw_version."""
         self._client = client
         self._cache = cache
+        self._versioned_refresh = versioned_refresh
+        self._concurrent_fetch = concurrent_fetch
+        self._fetch_semaphore = asyncio.Semaphore(max_concurrent_fetches)
+        self._scheduler = scheduler
+        self._in_flight: dict[str, asyncio.Future] = {}
+        self._limits: dict[str, Limits] = {}
+        self._limits_source: dict[str, Any] | None = None
+        self._limits_version: int | None = None
+        self._current_limits: dict[str, Limits] = {}
+        # editParams copy the current edits were fetched after
+        self._current_edits_base: dict[str, Any] | None = None
+        # Last current edits, kept when regParams does not version them
+        self._current_edits: RegistryLayer | None = None
+        self._current_edits_unsupported = False
+        self._last_good: dict[str, Any] = {}
+        self._reg_versions: dict[str, int] = {}
+        self._settings_version: int | None = None
+        self._reg_params_data_index: RegParamsDataIndex | None = None
+        self._reg_params_data_settings: int | None = None
+        self._collisions: dict[tuple[str, ...], dict[str, tuple[str, ...]]] = {}
+        self._write_listeners: list[Callable[[str, Any], None]] = []
+        self._pending_writes: dict[str, tuple[Any, list[asyncio.Future[bool]]]] = {}
+        self._write_task: asyncio.Task | None = None
+        # Set on close, the queued writes are sent without the debounce
+        self._flush_writes = asyncio.Event()
         self._uid = "default-uid"
         self._sw_revision = "default-sw-revision"
         self._hw_version = "default-hw-version"
+        self._model_id = "default-model-id"
 
     @classmethod
-    async def create(cls, client: EconetClient, cache: MemCache):
-        """Create an instance of Econet300Api."""
-        c = cls(client, cache)
-        await c.init()
+    async def create(
+        cls,
+        client: EconetClient,
+        cache: MemCache,
+        identity: dict[str, Any] | None = None,
+        scheduler: FleetScheduler | None = None,
+    ):
+        """Create an instance of Econet300Api.
+
+        With a persisted identity sysParams is not fetched up front, the
+        identity is revalidated by the first regular poll instead.
+        """
+        c = cls(client, cache, scheduler=scheduler)
+
+        if identity and identity.get(API_SYS_PARAMS_PARAM_UID):
+            c.update_identity(identity)
+        else:
+            await c.init()
 
         return c
 
@@ -177,18 +441,81 @@ class Econet300Api:
         """Get the host."""
         return self._client.host()
 
+    async def close(self) -> None:
+        """Send the queued writes and release the connections to the controller."""
+        if (task := self._write_task) is not None:
+            self._flush_writes.set()
+
+            try:
+                await asyncio.wait_for(asyncio.shield(task), API_WRITE_FLUSH_TIMEOUT)
+            except TimeoutError:
+                _LOGGER.warning(
+                    "Dropping %d queued writes not sent within %d s",
+                    len(self._pending_writes),
+                    API_WRITE_FLUSH_TIMEOUT,
+                )
+                task.cancel()
+
+        for _, futures in self._pending_writes.values():
+            for future in futures:
+                future.cancel()
+
+        self._pending_writes.clear()
+
+        for future in self._in_flight.values():
+            future.cancel()
+
+        await self._client.close()
+
+    def circuit_breaker(self) -> CircuitBreaker:
+        """Get the circuit breaker guarding requests to the controller."""
+        return self._client.circuit_breaker()
+
+    def cache_stats(self) -> dict[str, int]:
+        """Get the counters of the registry cache for diagnostics."""
+        return self._cache.stats()
+
     def uid(self) -> str:
         """Get the UID."""
         return self._uid
 
     def sw_rev(self) -> str:
         """Get the software revision."""
-        # Set a parameter value via the Econet 300 API.
+        return self._sw_revision
 
     def hw_ver(self) -> str:
         """Get the hardware version."""
         return self._hw_version
 
+    def model_id(self) -> str:
+        """Get the controller model."""
+        return self._model_id
+
+    def identity(self) -> dict[str, Any]:
+        """Get the identity fields of sysParams, to be persisted between restarts."""
+        return {
+            API_SYS_PARAMS_PARAM_UID: self._uid,
+            API_SYS_PARAMS_PARAM_SW_REV: self._sw_revision,
+            API_SYS_PARAMS_PARAM_HW_VER: self._hw_version,
+            API_SYS_PARAMS_PARAM_MODEL_ID: self._model_id,
+        }
+
+    def update_identity(self, sys_params: dict[str, Any]) -> bool:
+        """Update the identity from sysParams or a persisted copy, return True if it changed."""
+        previous = self.identity()
+        self._uid = sys_params.get(API_SYS_PARAMS_PARAM_UID, self._uid)
+        self._sw_revision = sys_params.get(
+            API_SYS_PARAMS_PARAM_SW_REV, self._sw_revision
+        )
+        self._hw_version = sys_params.get(API_SYS_PARAMS_PARAM_HW_VER, self._hw_version)
+        self._model_id = sys_params.get(API_SYS_PARAMS_PARAM_MODEL_ID, self._model_id)
+
+        if previous == self.identity():
+            return False
+
+        _LOGGER.debug("Controller identity: %s", self.identity())
+        return True
+
     async def init(self):
         """Initialize the Econet300Api."""
         sys_params = await self._client.get_params(API_SYS_PARAMS_URI)
@@ -217,21 +544,95 @@ class Econet300Api:
         else:
             self._hw_version = sys_params[API_SYS_PARAMS_PARAM_HW_VER]
 
+        self._model_id = sys_params.get(API_SYS_PARAMS_PARAM_MODEL_ID, self._model_id)
+
+    def add_write_listener(
+        self, listener: Callable[[str, Any], None]
+    ) -> Callable[[], None]:
+        """Register a listener called with (param, value) after every successful write."""
+        self._write_listeners.append(listener)
+
+        def remove_listener() -> None:
+            self._write_listeners.remove(listener)
+
+        return remove_listener
+
     async def set_param(self, param, value) -> bool:
         """Set a parameter value via the Econet 300 API."""
+        return await self.enqueue_param(param, value)
+
+    def enqueue_param(self, param, value) -> asyncio.Future[bool]:
+        """Queue a parameter write and return a future with its result.
+
+        Writes are sent one at a time. A write to a param which is still
+        waiting in the queue replaces the queued value (last value wins) and
+        all its callers share the result of the single request.
+        """
+        future: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+
+        if map_param(param) is None:
+            _LOGGER.warning(
+                "Requested param set for: '%s' but mapping for this param does not exist",
+                param,
+            )
+            future.set_result(False)
+            return future
+
+        if param in self._pending_writes:
+            _LOGGER.debug("Coalescing queued write of: %s", param)
+            futures = self._pending_writes[param][1]
+        else:
+            futures = []
+
+        futures.append(future)
+        self._pending_writes[param] = (value, futures)
+
+        if self._write_task is None:
+            self._write_task = asyncio.get_running_loop().create_task(
+                self._process_writes()
+            )
+
+        return future
+
+    async def _process_writes(self) -> None:
+        """Send queued writes to the controller one by one."""
+        try:
+            # Let a burst of writes settle before sending it, unless closing
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._flush_writes.wait(), API_WRITE_DEBOUNCE)
+
+            while self._pending_writes:
+                param = next(iter(self._pending_writes))
+                value, futures = self._pending_writes.pop(param)
+
+                try:
+                    result = await self._write_param(param, value)
+                except asyncio.CancelledError:
+                    for future in futures:
+                        future.cancel()
+                    raise
+                except Exception as err:  # noqa: BLE001
+                    for future in futures:
+                        if not future.done():
+                            future.set_exception(err)
+                    continue
+
+                for future in futures:
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            self._write_task = None
+
+    async def _write_param(self, param, value) -> bool:
+        """Write a single parameter value to the controller."""
         param_idx = map_param(param)
+        requested_value = value
 
         valuecheck = str(value).replace(".0", "")
         value = valuecheck
-        
-        if param_idx is None:
-            _LOGGER.warning(
-                "Requested param set for: '{param}' but mapping for this param does not exist"
-            )
-            return False
 
         data = await self._client.set_param(param_idx, value)
-            
+
         if data is None or "result" not in data:
             return False
 
@@ -240,73 +641,435 @@ class Econet300Api:
 
         self._cache.set(param, value)
 
+        for listener in list(self._write_listeners):
+            listener(param, requested_value)
+
         return True
 
+    def param_limits(self, param: str) -> Limits | None:
+        """Get the limits of a parameter, from the current edits if they report it, else from editParams."""
+        key = map_param(param)
+
+        return self._current_limits.get(key) or self._limits.get(key)
+
+    def restore_limits(self, data: RegistrySnapshot) -> None:
+        """Index the limits of restored editParams and current edits records until the first config refresh."""
+        if (edit_params := data.layer(API_EDIT_PARAMS_URI)) is not None:
+            self._index_limits(edit_params, None)
+
+        if (current_edits := data.layer(API_CURRENT_DATA_PARAMS_EDITS_URI)) is not None:
+            self._index_current_limits(current_edits)
+
+    def _index_limits(self, edit_params: dict[str, Any], version: int | None) -> None:
+        """Build the limits index once per editParams version."""
+        if edit_params is self._limits_source or (
+            version is not None and version == self._limits_version
+        ):
+            return
+
+        limits = {}
+        for key, param in edit_params.items():
+            if "minv" not in param or "maxv" not in param:
+                continue
+
+            # A fractional mult is the resolution of the value, e.g. 0.1. Larger
+            # ones scale raw units and enumerations (unit 31) abuse it as an
+            # int, those keep the step of the entity description.
+            mult = param.get("mult")
+            step = mult if isinstance(mult, float) and 0 < mult < 1 else None
+            limits[key] = Limits(param["minv"], param["maxv"], step)
+
+        _LOGGER.debug("Indexed limits of %d params, version: %s", len(limits), version)
+        self._limits = limits
+        self._limits_source = edit_params
+        self._limits_version = version
+
+    async def fetch_data(self) -> RegistrySnapshot:
+        """Fetch a snapshot of the reg_params, sys_params and edit_params data."""
+        if self._versioned_refresh:
+            # Versions of the other registries are read from regParams
+            live = await self.fetch_reg_params()
+            config = await self.fetch_config_data()
+
+            return self._snapshot(*live.layers(), *config.layers())
+
+        reg_data, sys_params, edit_params = await self._fetch_registries(
+            (API_REG_PARAMS_URI, None, None),
+            (API_SYS_PARAMS_URI, None, None),
+            (API_EDIT_PARAMS_URI, API_EDIT_PARAMS_DATA, None),
+        )
+        reg_params = self._parse_reg_params(reg_data)
+        self.update_identity(sys_params)
+        self._index_limits(edit_params, self._reg_versions.get(API_EDIT_PARAMS_URI))
 
-    async def get_param_limits(self, param: str):
-        """Fetch and return the limits for a particular parameter from the Econet 300 API, using a cache for efficient retrieval if available."""
-        if not self._cache.exists(API_EDIT_PARAMS_DATA):
-            limits = await self._fetch_reg_key(
-                API_EDIT_PARAMS_URI, API_EDIT_PARAMS_DATA
-            )
-            self._cache.set(API_EDIT_PARAMS_DATA, limits)
+        return self._snapshot(
+            *await self._live_layers(reg_params),
+            *self._config_layers(sys_params, edit_params),
+        )
 
-        limits = self._cache.get(API_EDIT_PARAMS_DATA)
-        param_idx = map_param(param)
-        
-        if param_idx is None:
-            _LOGGER.warning(
-                "Requested param limits for: '%s' but mapping for this param does not exist",
-                param,
+    async def fetch_reg_params(self) -> RegistrySnapshot:
+        """Fetch a snapshot of the live regParams data and remember the registry versions it carries."""
+        (reg_data,) = await self._fetch_registries((API_REG_PARAMS_URI, None, None))
+
+        return RegistrySnapshot(
+            await self._live_layers(self._parse_reg_params(reg_data))
+        )
+
+    async def fetch_reg_params_data(
+        self, reg_params: dict[str, Any]
+    ) -> RegParamsDataValues | None:
+        """Fetch the regParamsData values of the mapped ids regParams does not report.
+
+        The ids are resolved once per registry version. Without any, the
+        registry is not requested again until the settings version changes.
+        """
+        index = self._reg_params_data_index
+
+        if (
+            index is not None
+            and not index
+            and self._reg_params_data_settings == self._settings_version
+        ):
+            return None
+
+        try:
+            reg_data = await self._fetch_registry(API_REG_PARAMSDATA_URI, None, None)
+        except (ApiError, DataError, TimeoutError) as err:
+            if index and self._reg_params_data_settings == self._settings_version:
+                _LOGGER.warning(
+                    "Fetching %s failed (%r), reusing last fetched data",
+                    API_REG_PARAMSDATA_URI,
+                    err,
+                )
+                return self._last_good.get(API_REG_PARAMSDATA_URI)
+
+            # Not supported by every controller, tried again on the next version
+            _LOGGER.debug("Fetching %s failed: %s", API_REG_PARAMSDATA_URI, err)
+            self._reg_params_data_index = RegParamsDataIndex(None, {})
+            self._reg_params_data_settings = self._settings_version
+            return None
+
+        data = reg_data.get(API_REG_PARAMSDATA_PARAM_DATA) or {}
+        version = reg_data.get(API_REG_PARAMSDATA_PARAM_VERSION)
+
+        if index is None or version is None or index.version != version:
+            index = self._reg_params_data_index = RegParamsDataIndex(
+                version,
+                {
+                    param_id: name
+                    for param_id, name in REG_PARAMSDATA_PARAMS_MAPPING_TABLE.items()
+                    if param_id in data and name not in reg_params
+                },
             )
+            _LOGGER.debug(
+                "Resolved %d %s ids, version: %s",
+                len(index),
+                API_REG_PARAMSDATA_URI,
+                version,
+            )
+
+        self._reg_params_data_settings = self._settings_version
+
+        if not index:
             return None
 
-        if param_idx not in limits:
-            _LOGGER.warning(
-                "Requested param limits for: '%s(%s)' not in limits",
-                param,
-                param_idx,
+        values = index.values(data)
+        self._last_good[API_REG_PARAMSDATA_URI] = values
+
+        return values
+
+    async def fetch_config_data(self) -> RegistrySnapshot:
+        """Fetch a snapshot of the sys_params and edit_params data, reusing copies whose version is unchanged."""
+        sys_params, edit_params = await self._fetch_registries(
+            (
+                API_SYS_PARAMS_URI,
+                None,
+                self._reg_versions.get(API_SYS_PARAMS_URI),
+            ),
+            (
+                API_EDIT_PARAMS_URI,
+                API_EDIT_PARAMS_DATA,
+                self._reg_versions.get(API_EDIT_PARAMS_URI),
+            ),
+        )
+        self.update_identity(sys_params)
+        self._index_limits(edit_params, self._reg_versions.get(API_EDIT_PARAMS_URI))
+        layers = self._config_layers(sys_params, edit_params)
+
+        if self._versioned_refresh:
+            # A new editParams copy must not be shadowed by older current edits
+            layers += (
+                await self._fetch_current_edits(
+                    force=edit_params is not self._current_edits_base
+                ),
             )
+            self._current_edits_base = edit_params
+
+        return self._snapshot(*layers)
+
+    async def fetch_edit_params(self) -> RegistrySnapshot:
+        """Fetch the edit_params values bypassing the version check, e.g. to confirm a write."""
+        edit_data = await self._fetch_registry(API_EDIT_PARAMS_URI, None, None)
+
+        if API_EDIT_PARAMS_DATA not in edit_data:
+            _LOGGER.debug(edit_data)
+            raise DataError(f"Data for key: {API_EDIT_PARAMS_DATA} does not exist")
+
+        edit_params = edit_data[API_EDIT_PARAMS_DATA]
+        # editParams carries its own version, so the next poll can reuse it
+        version = edit_data.get(VERSIONED_REFRESH_VERSION_KEYS[API_EDIT_PARAMS_URI])
+
+        if self._versioned_refresh and version is not None:
+            self._cache.set(
+                (API_EDIT_PARAMS_URI, version),
+                edit_params,
+                VERSIONED_REFRESH_MAX_AGE[API_EDIT_PARAMS_URI],
+            )
+
+        self._last_good[API_EDIT_PARAMS_URI] = edit_params
+        self._index_limits(edit_params, version)
+
+        layers = [
+            RegistryLayer(API_EDIT_PARAMS_URI, edit_params, API_EDIT_PARAMS_VALUE)
+        ]
+
+        if self._versioned_refresh:
+            # Replaces the current edits layer, it must not shadow the new values
+            layers.append(await self._fetch_current_edits(force=True))
+            self._current_edits_base = edit_params
+
+        return RegistrySnapshot(layers)
+
+    async def fetch_current_edits(self) -> RegistrySnapshot | None:
+        """Fetch the value and limits of the most edited setpoints only, e.g. to confirm a write.
+
+        Returns None if the controller does not report them.
+        """
+        current_edits = await self._fetch_current_edits(force=True)
+
+        if not current_edits.data:
             return None
 
-        curr_limits = limits[param_idx]
-        
-        return Limits(curr_limits['minv'], curr_limits['maxv'])
+        return RegistrySnapshot((current_edits,))
+
+    async def _fetch_current_edits(self, force: bool) -> RegistryLayer:
+        """Fetch rmCurrentDataParamsEdits as an overlay of editParams, empty if it failed.
+
+        Records are keyed by their editParams key and their limits replace
+        the indexed editParams limits.
+        """
+        version = self._reg_versions.get(API_CURRENT_DATA_PARAMS_EDITS_URI)
+
+        if version is None:
+            # Without its counter in regParams it is fetched once and then
+            # only along with a new editParams copy, never again if it failed
+            if self._current_edits_unsupported:
+                return self._current_edits_layer({})
+
+            if not force and self._current_edits is not None:
+                return self._current_edits
+
+        try:
+            data = await self._fetch_registry(
+                API_CURRENT_DATA_PARAMS_EDITS_URI,
+                API_CURRENT_DATA_PARAMS_EDITS_DATA,
+                None if force else version,
+            )
+        except (ApiError, DataError, TimeoutError) as err:
+            # Not supported by every controller, editParams values are used
+            _LOGGER.debug(
+                "Fetching %s failed: %s", API_CURRENT_DATA_PARAMS_EDITS_URI, err
+            )
+            data = {}
+
+            if version is None:
+                _LOGGER.debug(
+                    "%s is not versioned by regParams, using editParams values only",
+                    API_CURRENT_DATA_PARAMS_EDITS_URI,
+                )
+                self._current_edits_unsupported = True
+
+        if (force or not data) and self._versioned_refresh and version is not None:
+            # An empty copy is cached too, so a failure is not retried until the version moves
+            self._cache.set(
+                (API_CURRENT_DATA_PARAMS_EDITS_URI, version),
+                data,
+                VERSIONED_REFRESH_MAX_AGE[API_CURRENT_DATA_PARAMS_EDITS_URI],
+            )
+
+        self._current_edits = self._current_edits_layer(data)
+
+        return self._current_edits
+
+    def _current_edits_layer(self, data: dict[str, Any]) -> RegistryLayer:
+        """Build the overlay layer of the current edits and index their limits."""
+        records = {
+            key: data[param_id]
+            for param_id, key in CURRENT_DATA_PARAMS_EDITS_MAPPING_TABLE.items()
+            if API_EDIT_PARAMS_VALUE in data.get(param_id, {})
+        }
+        self._index_current_limits(records)
+
+        return RegistryLayer(
+            API_CURRENT_DATA_PARAMS_EDITS_URI,
+            records,
+            API_EDIT_PARAMS_VALUE,
+            overlay=True,
+        )
 
+    def _index_current_limits(self, records: Mapping[str, Any]) -> None:
+        """Index the limits reported by the current edits, keyed by editParams key."""
+        self._current_limits = {
+            key: Limits(
+                record[API_CURRENT_DATA_PARAMS_EDITS_MIN],
+                record[API_CURRENT_DATA_PARAMS_EDITS_MAX],
+                getattr(self._limits.get(key), "step", None),
+            )
+            for key, record in records.items()
+            if API_CURRENT_DATA_PARAMS_EDITS_MIN in record
+            and API_CURRENT_DATA_PARAMS_EDITS_MAX in record
+        }
+
+    def config_outdated(self) -> bool:
+        """Check if regParams reports a version of a config registry that is not cached."""
+        if not self._versioned_refresh:
+            return False
 
-    async def fetch_data(self) -> dict[str, Any]:
-        """Fetch merged reg_params, sys_params and edit_params data."""
-        reg_params = await self._fetch_reg_key(
-            API_REG_PARAMS_URI, API_REG_PARAMS_PARAM_DATA
+        return any(
+            not self._cache.exists((reg, version))
+            for reg, version in self._reg_versions.items()
         )
-        # reg_paramsdata = await self._fetch_reg_key(
-        #     API_REG_PARAMSDATA_URI, API_REG_PARAMSDATA_PARAM_DATA
-        # )
-        sys_params = await self._fetch_reg_key(API_SYS_PARAMS_URI)
-        
-        edit_params = await self._fetch_reg_key(
-            API_EDIT_PARAMS_URI, API_EDIT_PARAMS_DATA
+
+    def _parse_reg_params(self, reg_data: dict[str, Any]) -> dict[str, Any]:
+        """Return the current values of regParams and store its registry versions."""
+        if API_REG_PARAMS_PARAM_DATA not in reg_data:
+            _LOGGER.debug(reg_data)
+            raise DataError(f"Data for key: {API_REG_PARAMS_PARAM_DATA} does not exist")
+
+        self._reg_versions = {
+            reg: reg_data[version_key]
+            for reg, version_key in VERSIONED_REFRESH_VERSION_KEYS.items()
+            if version_key in reg_data
+        }
+        self._settings_version = reg_data.get(API_REG_PARAMS_PARAM_SETTINGS_VER)
+
+        return reg_data[API_REG_PARAMS_PARAM_DATA]
+
+    async def _live_layers(
+        self, reg_params: dict[str, Any]
+    ) -> tuple[RegistryLayer, ...]:
+        """Return the regParams layer over the values regParamsData adds to it."""
+        reg_layer = RegistryLayer(API_REG_PARAMS_URI, reg_params)
+        reg_params_data = await self.fetch_reg_params_data(reg_params)
+
+        if reg_params_data is None:
+            return (reg_layer,)
+
+        return (RegistryLayer(API_REG_PARAMSDATA_URI, reg_params_data), reg_layer)
+
+    def _config_layers(
+        self, sys_params: dict[str, Any], edit_params: dict[str, Any]
+    ) -> tuple[RegistryLayer, ...]:
+        """Return the sys_params layer and the edit_params layer, which keeps the full records."""
+        return (
+            RegistryLayer(API_SYS_PARAMS_URI, sys_params),
+            RegistryLayer(API_EDIT_PARAMS_URI, edit_params, API_EDIT_PARAMS_VALUE),
         )
-        """ Edit Params values"""
-        for key, value in edit_params.items():
-            edit_params[key] = value['value']
-        
-        # _LOGGER.warning("Edits Params data: %s", edit_params)
-        return {**reg_params, **sys_params, **edit_params} # **reg_paramsdata, 
 
+    def _snapshot(self, *layers: RegistryLayer) -> RegistrySnapshot:
+        """Build a snapshot of the layers and report keys one registry shadows in another."""
+        snapshot = RegistrySnapshot(layers)
+        names = tuple(layer.name for layer in layers)
+        collisions = snapshot.collisions()
+
+        if collisions != self._collisions.get(names, {}):
+            self._collisions[names] = collisions
+            for key, registries in collisions.items():
+                _LOGGER.warning(
+                    "Key: %s exists in %s, using the value of %s",
+                    key,
+                    ", ".join(registries),
+                    registries[-1],
+                )
+
+        return snapshot
+
+    async def _fetch_registries(self, *specs: tuple[str, str | None, int | None]):
+        """Fetch (reg, data_key, version) registries, concurrently if enabled.
+
+        A failed sysParams or editParams fetch falls back to the last good
+        copy so one slow endpoint does not fail the whole poll.
+        """
+        fetches = [
+            self._fetch_registry(reg, data_key, version)
+            for reg, data_key, version in specs
+        ]
+
+        if self._concurrent_fetch:
+            results = await asyncio.gather(*fetches, return_exceptions=True)
+        else:
+            results = [await self._capture(fetch) for fetch in fetches]
+
+        data = []
+        for (reg, _, _), result in zip(specs, results, strict=True):
+            if isinstance(result, BaseException):
+                if (
+                    not isinstance(result, Exception)
+                    or isinstance(result, AuthError)
+                    or reg == API_REG_PARAMS_URI
+                    or reg not in self._last_good
+                ):
+                    raise result
+
+                _LOGGER.warning(
+                    "Fetching %s failed (%r), reusing last fetched data", reg, result
+                )
+                result = self._last_good[reg]
+            else:
+                self._last_good[reg] = result
+
+            data.append(result)
+
+        return data
+
+    @staticmethod
+    async def _capture(fetch: Awaitable[Any]) -> Any:
+        """Await a fetch and return its exception instead of raising it, like gather does."""
+        try:
+            return await fetch
+        except Exception as err:  # noqa: BLE001
+            return err
+
+    async def _fetch_registry(self, reg, data_key: str | None, version: int | None):
+        """Fetch a single registry within the per registry timeout."""
+        async with asyncio.timeout(API_FETCH_TIMEOUT):
+            return await self._fetch_versioned_reg_key(reg, data_key, version)
+
+    async def _fetch_versioned_reg_key(
+        self, reg, data_key: str | None, version: int | None
+    ):
+        """Fetch a registry only when its version in regParams changed, otherwise return the last parsed copy."""
+        if not self._versioned_refresh or version is None:
+            return await self._fetch_reg_key(reg, data_key)
+
+        # Cached per version, a new version is a miss
+        return await self._cache.get_or_fetch(
+            (reg, version),
+            lambda: self._fetch_reg_key(reg, data_key),
+            VERSIONED_REFRESH_MAX_AGE[reg],
+        )
 
     async def _fetch_reg_key(self, reg, data_key: str | None = None):
         """Fetch a key from the json-encoded data returned by the API for a given registry If key is None, then return whole data."""
-        data = await self._client.get_params(reg)
-
-        if 'error' in data:
-            #_LOGGER.warning("Error in DATA: %s", data)
-            """Retrive data again"""
-            data = await self._client.get_params(reg)
+        data = await self._get_params_shared(reg)
 
         if data is None:
             raise DataError(f"Data fetched by API for reg: {reg} is None")
 
+        if reg == API_SYS_PARAMS_URI:
+            # Dropped before the registry is cached or merged into the data
+            return extract_sys_params(data)
+
         if data_key is None:
             return data
 
@@ -316,14 +1079,69 @@ class Econet300Api:
 
         return data[data_key]
 
-async def make_api(hass: HomeAssistant, cache: MemCache, data: dict):
+    async def _get_params_shared(self, reg):
+        """Get a registry, sharing one request between concurrent callers.
+
+        The returned data is shared by every caller and must not be mutated.
+        """
+        future = self._in_flight.get(reg)
+
+        if future is None:
+            future = asyncio.ensure_future(self._get_params(reg))
+            self._in_flight[reg] = future
+            future.add_done_callback(lambda done: self._finish_in_flight(reg, done))
+        else:
+            _LOGGER.debug("Joining in flight request for: %s", reg)
+
+        # A cancelled caller must not cancel the request of the others
+        return await asyncio.shield(future)
+
+    def _finish_in_flight(self, reg, future: asyncio.Future) -> None:
+        if self._in_flight.get(reg) is future:
+            del self._in_flight[reg]
+
+        # Mark the error as retrieved when every caller gave up waiting
+        if not future.cancelled():
+            future.exception()
+
+    def _request_slot(self):
+        """Return the context holding a fleet wide request slot, if scheduled."""
+        if self._scheduler is None:
+            return contextlib.nullcontext()
+
+        return self._scheduler.slot(self.host())
+
+    async def _get_params(self, reg):
+        # The per controller cap first, so a controller queues at most that
+        # many requests for the fleet wide slots
+        async with self._fetch_semaphore, self._request_slot():
+            data = await self._client.get_params(reg)
+
+            if data is not None and "error" in data:
+                # _LOGGER.warning("Error in DATA: %s", data)
+                """Retrive data again"""
+                data = await self._client.get_params(reg)
+
+        return data
+
+
+async def make_api(
+    hass: HomeAssistant,
+    cache: MemCache,
+    data: dict,
+    scheduler: FleetScheduler | None = None,
+):
     """Create an Econet 300 API instance."""
-    return await Econet300Api.create(
-        EconetClient(
-            data["host"],
-            data["username"],
-            data["password"],
-            async_get_clientsession(hass),
-        ),
-        cache,
+    client = EconetClient(
+        data["host"],
+        data["username"],
+        data["password"],
     )
+
+    try:
+        return await Econet300Api.create(
+            client, cache, data.get(CONF_IDENTITY), scheduler
+        )
+    except BaseException:
+        await client.close()
+        raise
@@ -1,4 +1,5 @@
 """Base Climate for Econet300."""
+
 from dataclasses import dataclass
 import logging
 from typing import Any, Final
@@ -25,7 +26,7 @@ from .const import (
     DOMAIN,
     SERVICE_API,
     SERVICE_COORDINATOR,
-    AVAILABLE_NUMBER_OF_ECOSTERS
+    AVAILABLE_NUMBER_OF_ECOSTERS,
 )
 from .entity import EcosterThermEntity
 
@@ -33,6 +34,13 @@ from .entity import EcosterThermEntity
 _LOGGER = logging.getLogger(__name__)
 
 TEMPERATURE_STEP: Final = 0.1
+# Values of an ecoSTER thermostat its state is built from, suffixed by its index
+ECOSTER_STATE_VALUES: Final = (
+    "ecoSterTemp",
+    "ecoSterMode",
+    "ecoSterContacts",
+    "ecoSterSetTemp",
+)
 
 PRESET_SCHEDULE: Final = "Schedule"
 PRESET_ECO: Final = "Economy mode"
@@ -66,6 +74,7 @@ HA_PRESET_TO_EM_TEMP: Final[dict[str, str]] = {
     PRESET_ANTIFREEZE: "STER_TEMP_ANTIFREEZ_",
 }
 
+
 @dataclass(frozen=True, kw_only=True)
 class EconetClimateEntityDescription(ClimateEntityDescription):
     """Describes Climate entity."""
@@ -73,39 +82,58 @@ class EconetClimateEntityDescription(ClimateEntityDescription):
 
 class EconetClimate(EcosterThermEntity, ClimateEntity):
     """Econet Climate class."""
+
     _attr_hvac_mode = HVACMode.HEAT
     _attr_hvac_modes = [HVACMode.HEAT]
     _attr_precision = PRECISION_TENTHS
-    _attr_supported_features = (ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.PRESET_MODE)
+    _attr_supported_features = (
+        ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.PRESET_MODE
+    )
     _attr_preset_mode: str | None
     _attr_preset_modes = list(HA_TO_EM_MODE)
     _attr_target_temperature_name: str | None = None
     _attr_target_temperature_step = TEMPERATURE_STEP
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
+    _follow_live_tier = True
     entity_description: EconetClimateEntityDescription
 
-
     def __init__(
-            self,
-            description: EconetClimateEntityDescription,
-            coordinator: EconetDataCoordinator,
-            api: Econet300Api,
-            idx: int,
+        self,
+        description: EconetClimateEntityDescription,
+        coordinator: EconetDataCoordinator,
+        api: Econet300Api,
+        idx: int,
     ):
-            """Initialize a new instance of the EconetClimate class."""
-            self.idx = idx
-            super().__init__(description, coordinator, api, idx)
+        """Initialize a new instance of the EconetClimate class."""
+        self.idx = idx
+        super().__init__(description, coordinator, api, idx)
+
+    def _ecoster_key(self, name: str) -> str:
+        """Return the data key of a value of this thermostat, e.g. ecoSterTemp1."""
+        return f"{name}{self.idx}"
+
+    def _watched_keys(self) -> tuple[str, ...]:
+        """Return the data keys the state of the entity depends on."""
+        return (
+            self.entity_description.key,
+            *(self._ecoster_key(name) for name in ECOSTER_STATE_VALUES),
+            # Setpoints of the presets, the schedule preset is read from them
+            *(
+                self._ecoster_key(name)
+                for name in dict.fromkeys(HA_PRESET_TO_EM_TEMP.values())
+            ),
+        )
 
     def _sync_state(self, value):
         """Sync state."""
         data = self._coordinator.data
-        
-        value = data[f"ecoSterTemp{str(self.idx)}"]
-        mode = data[f"ecoSterMode{str(self.idx)}"]
-        
+
+        value = data[self._ecoster_key("ecoSterTemp")]
+        mode = data[self._ecoster_key("ecoSterMode")]
+
         preset_mode = EM_TO_HA_MODE[mode]
-        thermstate = self._coordinator.data[f"ecoSterContacts{str(self.idx)}"]
-        temperature = self._coordinator.data[f"ecoSterSetTemp{str(self.idx)}"]
+        thermstate = self._coordinator.data[self._ecoster_key("ecoSterContacts")]
+        temperature = self._coordinator.data[self._ecoster_key("ecoSterSetTemp")]
         if thermstate is True:
             self._attr_hvac_action = HVACAction.HEATING
         else:
@@ -130,7 +158,9 @@ class EconetClimate(EcosterThermEntity, ClimateEntity):
         assert isinstance(self.target_temperature_name, str)
 
         temperature = round(kwargs[ATTR_TEMPERATURE], 1)
-        await self._api.set_param(f"{self.target_temperature_name}{str(self.idx)}", temperature)
+        await self._api.set_param(
+            self._ecoster_key(self.target_temperature_name), temperature
+        )
         self._attr_target_temperature = temperature
         self.async_write_ha_state()
 
@@ -139,7 +169,7 @@ class EconetClimate(EcosterThermEntity, ClimateEntity):
         mode = HA_TO_EM_MODE[preset_mode]
         if mode == 133:
             mode = 5
-        
+
         await self._api.set_param(self.entity_description.key, mode)
         self._attr_preset_mode = preset_mode
         await self._async_update_target_temperature_attributes()
@@ -166,16 +196,19 @@ class EconetClimate(EcosterThermEntity, ClimateEntity):
 
         self._attr_target_temperature_name = target_temperature_name
 
-
     async def _async_get_current_schedule_preset(
         self, target_temp: float | None = None
     ) -> str:
         """Get current preset for the schedule mode."""
         if target_temp is None:
-            target_temp = self._coordinator.data[f"ecoSterSetTemp{str(self.idx)}"]
+            target_temp = self._coordinator.data[self._ecoster_key("ecoSterSetTemp")]
         target_temp = round(target_temp, 1)
-        comfort_temp = self._coordinator.data[f"{HA_PRESET_TO_EM_TEMP[PRESET_COMFORT]}{str(self.idx)}"]
-        eco_temp = self._coordinator.data[f"{HA_PRESET_TO_EM_TEMP[PRESET_ECO]}{str(self.idx)}"]
+        comfort_temp = self._coordinator.data[
+            self._ecoster_key(HA_PRESET_TO_EM_TEMP[PRESET_COMFORT])
+        ]
+        eco_temp = self._coordinator.data[
+            self._ecoster_key(HA_PRESET_TO_EM_TEMP[PRESET_ECO])
+        ]
 
         schedule_preset = PRESET_UNKNOWN
         if target_temp == comfort_temp and target_temp != eco_temp:
@@ -191,6 +224,7 @@ class EconetClimate(EcosterThermEntity, ClimateEntity):
         """Return the target temperature name."""
         return self._attr_target_temperature_name
 
+
 def can_add(desc: EconetClimateEntityDescription, coordinator: EconetDataCoordinator):
     """Check if it can add the key."""
     if desc.key not in coordinator.data:
@@ -198,12 +232,12 @@ def can_add(desc: EconetClimateEntityDescription, coordinator: EconetDataCoordin
         return False
     return coordinator.has_data(desc.key) and coordinator.data[desc.key] is not None
 
+
 def create_ecoster_climate(coordinator: EconetDataCoordinator, api: Econet300Api):
     """Create individual selects descriptions for ecoster."""
     entities = []
 
     for i in range(1, AVAILABLE_NUMBER_OF_ECOSTERS + 1):
-
         description = EconetClimateEntityDescription(
             key=f"STER_MODE_{i}",
             name=f"EcoSTER Thermostat {i}",
@@ -1,36 +1,452 @@
 """Common code for econet300 integration."""
+
+from collections.abc import Callable, Iterable, Mapping
 from datetime import timedelta
 import logging
+import time
+from typing import Any
 
+import aiohttp
 import async_timeout
 
+from homeassistant.core import CALLBACK_TYPE, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .api import ApiError, AuthError, Econet300Api
-from .const import DOMAIN
+from .api import ApiError, AuthError, DataError, Econet300Api, map_param
+from .const import (
+    API_SYS_PARAMS_PARAM_REG_REFRESH,
+    API_WRITE_CONFIRM_DELAY,
+    CURRENT_DATA_PARAMS_EDITS_KEYS,
+    DOMAIN,
+    OPERATION_MODES_ACTIVE,
+    OPERATION_MODES_IDLE,
+    SNAPSHOT_LAYER,
+    UPDATE_INTERVAL,
+    UPDATE_INTERVAL_CONFIG,
+    UPDATE_INTERVAL_FAST,
+    UPDATE_INTERVAL_FAST_AFTER_WRITE,
+    UPDATE_INTERVAL_SLOW,
+)
+from .registry import RegistrySnapshot
+from .scheduler import FleetScheduler
+from .transforms import TransformTable, ValueTransform
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class EconetDataCoordinator(DataUpdateCoordinator):
-    """My custom coordinator."""
+class EconetCoordinator(DataUpdateCoordinator):
+    """Base coordinator tracking which keys changed in the last refresh.
+
+    Listeners registered with a frozenset of data keys as context are only
+    called when one of those keys changed, through a single dispatching
+    listener, so an update costs O(changed keys) instead of O(entities).
+    The data is a RegistrySnapshot, never mutated, only replaced.
+    """
+
+    # None means every key has to be treated as changed
+    changed_keys: set[str] | None = None
+    # True while the data was restored from a snapshot and not refreshed yet
+    stale = False
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the coordinator."""
+        super().__init__(*args, **kwargs)
+        self._key_listeners: dict[str, dict[CALLBACK_TYPE, None]] = {}
+        self._unsub_dispatch: CALLBACK_TYPE | None = None
+        self._transforms: TransformTable | None = None
+        # Entity states of the keys with a transform, updated once per refresh
+        self.transformed: dict[str, Any] = {}
+
+    @callback
+    def async_add_transforms(self, transforms: Mapping[str, ValueTransform]) -> None:
+        """Add value transforms applied to every refresh."""
+        if self._transforms is None:
+            self._transforms = TransformTable(transforms)
+        else:
+            self._transforms = self._transforms.merge(transforms)
+
+        if self.data is not None:
+            self._apply_transforms(self.data, transforms.keys())
+
+    def _apply_transforms(
+        self, data: Mapping[str, Any], keys: Iterable[str] | None
+    ) -> None:
+        """Transform the values of the given keys, all of them if None, in one pass.
+
+        Keys missing from the data are dropped, so entities fall back to the
+        raw value instead of showing the last transformed one.
+        """
+        if self._transforms is None:
+            return
+
+        if keys is None:
+            self.transformed = self._transforms.apply(data)
+            return
+
+        for key in keys:
+            if key not in data:
+                self.transformed.pop(key, None)
+
+        self.transformed.update(self._transforms.apply(data, keys))
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates, of the given keys only if context is a frozenset of keys."""
+        if not isinstance(context, frozenset):
+            return super().async_add_listener(update_callback, context)
+
+        for key in context:
+            self._key_listeners.setdefault(key, {})[update_callback] = None
+
+        if self._unsub_dispatch is None:
+            # Keeps the coordinator polling while keyed listeners exist
+            self._unsub_dispatch = super().async_add_listener(
+                self._dispatch_key_listeners
+            )
+
+        @callback
+        def remove_listener() -> None:
+            for key in context:
+                listeners = self._key_listeners.get(key)
+
+                if listeners is not None:
+                    listeners.pop(update_callback, None)
+
+                    if not listeners:
+                        del self._key_listeners[key]
+
+            if not self._key_listeners and self._unsub_dispatch is not None:
+                self._unsub_dispatch()
+                self._unsub_dispatch = None
+
+        return remove_listener
+
+    @callback
+    def _dispatch_key_listeners(self) -> None:
+        """Call the listeners of the changed keys, each at most once."""
+        if self.changed_keys is None or not self.last_update_success:
+            self._call_key_listeners(self._key_listeners.keys())
+        else:
+            self._call_key_listeners(self.changed_keys)
+
+    @callback
+    def _call_key_listeners(self, keys: Iterable[str]) -> None:
+        """Call the listeners of the given keys, each at most once."""
+        listeners: dict[CALLBACK_TYPE, None] = {}
+        for key in self._key_listeners.keys() & keys:
+            listeners.update(self._key_listeners[key])
+
+        for update_callback in listeners:
+            update_callback()
+
+    def _track_changes(self, data: RegistrySnapshot) -> RegistrySnapshot:
+        """Compute the keys that differ from the previous data."""
+        if self.data is None or not self.last_update_success or self.stale:
+            self.changed_keys = None
+        else:
+            # Only compares the registry layers that were not reused
+            self.changed_keys = data.changed_keys(self.data)
+            _LOGGER.debug("%s changed keys: %s", self.name, self.changed_keys)
+
+        self._apply_transforms(data, self.changed_keys)
+
+        return data
+
+    def _track_refresh(self, data: RegistrySnapshot) -> RegistrySnapshot:
+        """Compute the changed keys of refreshed data, which is never stale."""
+        data = self._track_changes(data)
+        self.stale = False
+
+        return data
+
+    @callback
+    def async_restore(self, data: Mapping[str, Any]) -> None:
+        """Start from last known data, flagged stale until the first refresh."""
+        if not isinstance(data, RegistrySnapshot):
+            data = RegistrySnapshot.of(SNAPSHOT_LAYER, data)
+
+        self.data = data
+        self.stale = True
+        self.changed_keys = None
+        self._apply_transforms(data, None)
+
+    @callback
+    def async_merge_data(self, data: Mapping[str, Any]) -> None:
+        """Merge partial data outside of a refresh and notify the entities of changed keys.
+
+        The layers of a snapshot replace the layers of the same registry,
+        plain values replace the values of existing keys.
+        """
+        if self.data is None:
+            return
+
+        if isinstance(data, RegistrySnapshot):
+            merged = self.data.with_layers(*data.layers())
+        else:
+            merged = self.data.with_values(data)
+
+        self.data = self._track_changes(merged)
+        self.async_update_listeners()
+
+    def _check_circuit(self, api: Econet300Api) -> None:
+        """Fail fast instead of queueing requests to an unreachable controller."""
+        breaker = api.circuit_breaker()
+
+        if breaker.is_open():
+            raise UpdateFailed(
+                f"Controller unreachable, retrying in {breaker.retry_in():.0f} s"
+            )
+
+
+class EconetConfigCoordinator(EconetCoordinator):
+    """Coordinator for the rarely changing sysParams and editParams registries."""
 
     def __init__(self, hass, api: Econet300Api):
+        """Initialize the config coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_config",
+            update_interval=timedelta(seconds=UPDATE_INTERVAL_CONFIG),
+        )
+        self._api = api
+
+    async def _async_update_data(self):
+        """Fetch sysParams and editParams from API endpoint."""
+
+        _LOGGER.debug("Fetching config data from API")
+
+        self._check_circuit(self._api)
+
+        try:
+            async with async_timeout.timeout(90):
+                return self._track_refresh(await self._api.fetch_config_data())
+        except AuthError as err:
+            raise ConfigEntryAuthFailed from err
+        except ApiError as err:
+            raise UpdateFailed(f"Error communicating with API: {err}") from err
+
+
+class EconetDataCoordinator(EconetCoordinator):
+    """My custom coordinator.
+
+    Without a config coordinator every poll fetches all registries. With one,
+    this coordinator only polls the live regParams and merges in the data of
+    the config coordinator, which is refreshed at its own pace or as soon as
+    regParams reports a new registry version.
+    """
+
+    def __init__(
+        self,
+        hass,
+        api: Econet300Api,
+        config_coordinator: EconetConfigCoordinator | None = None,
+        adaptive_polling: bool = True,
+        scheduler: FleetScheduler | None = None,
+    ):
         """Initialize my coordinator."""
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             # Polling interval. Will only be polled if there are subscribers.
-            update_interval=timedelta(seconds=60),
+            update_interval=timedelta(seconds=UPDATE_INTERVAL),
         )
         self._api = api
+        self._config_coordinator = config_coordinator
+        self._live_data = RegistrySnapshot()
+        self._adaptive_polling = adaptive_polling
+        self._scheduler = scheduler
+        self._last_mode = None
+        self._last_write: float | None = None
+        self._unsub_confirm: Callable[[], None] | None = None
+        self._written_keys: set[str] = set()
+        # Released on shutdown, the api and the config coordinator may outlive it
+        self._unsubs: list[Callable[[], None]] = [
+            api.add_write_listener(self._handle_write)
+        ]
+
+        if config_coordinator is not None:
+            # Registered before any entity so the merged data is up to date
+            # by the time entities of the config tier are notified.
+            self._unsubs.append(
+                config_coordinator.async_add_listener(self._handle_config_update)
+            )
 
     def has_data(self, key: str):
-            """Check if the specified key exists in the data dictionary."""
-            _LOGGER.debug("Key from has_data: %s", key)
-            return key in self.data
+        """Check if the specified key exists in the data dictionary."""
+        _LOGGER.debug("Key from has_data: %s", key)
+        return key in self.data
+
+    def coordinator_for_key(self, key: str) -> DataUpdateCoordinator:
+        """Return the coordinator whose updates should refresh an entity of the given key."""
+        if (
+            self._config_coordinator is not None
+            and self._config_coordinator.data is not None
+            and key in self._config_coordinator.data
+        ):
+            return self._config_coordinator
+
+        return self
+
+    @callback
+    def async_restore_snapshot(
+        self, live_data: RegistrySnapshot, config_data: RegistrySnapshot
+    ) -> None:
+        """Start both tiers and the limits of the numbers from a snapshot until their first refresh."""
+        if self._config_coordinator is not None:
+            self._live_data = live_data
+            self._config_coordinator.async_restore(config_data)
+            self.async_restore(self._tiers_snapshot())
+        else:
+            self.async_restore(
+                RegistrySnapshot((*live_data.layers(), *config_data.layers()))
+            )
+
+        self._api.restore_limits(self._edit_params_coordinator().data)
+
+    def snapshot_data(self) -> tuple[Mapping[str, Any], Mapping[str, Any]]:
+        """Return the (live, config) data to persist."""
+        if self._config_coordinator is None:
+            return self.data or {}, {}
+
+        return self._live_data, self._config_coordinator.data or {}
+
+    @callback
+    def _handle_config_update(self) -> None:
+        """Merge fresh config data, notifying only the live tier entities watching changed config keys."""
+        config = self._config_coordinator
+
+        if self.data is None or config.data is None:
+            return
+
+        self.data = self._tiers_snapshot()
+        changed = config.changed_keys
+        self._apply_transforms(self.data, changed)
+
+        if config.last_update_success:
+            # E.g. a thermostat also watching its preset setpoints
+            self._call_key_listeners(config.data.keys() if changed is None else changed)
+
+    @callback
+    def _handle_write(self, param: str, value: Any) -> None:
+        """Show a written value at once and confirm it with a short delayed read."""
+        self._write_through(param, value)
+        self._written_keys.add(map_param(param))
+
+        if self._unsub_confirm is not None:
+            self._unsub_confirm()
+
+        self._unsub_confirm = async_call_later(
+            self.hass, API_WRITE_CONFIRM_DELAY, self._handle_confirm_writes
+        )
+
+        if not self._adaptive_polling:
+            return
+
+        # Poll fast for a while after a parameter was written
+        self._last_write = time.monotonic()
+        fast_interval = timedelta(seconds=self._fast_interval(self.data))
+
+        if self.update_interval != fast_interval:
+            self.update_interval = fast_interval
+            self._schedule_refresh()
+
+    def _edit_params_coordinator(self) -> EconetCoordinator:
+        """Return the coordinator holding the editParams values."""
+        return self._config_coordinator or self
+
+    @callback
+    def _write_through(self, param: str, value: Any) -> None:
+        """Merge a written value into the tiers holding the entity key or its editParams key and notify their entities.
+
+        E.g. the boiler switch writes "mode", a live key, through BOILER_CONTROL.
+        """
+        for key in dict.fromkeys((param, map_param(param))):
+            coordinator = self.coordinator_for_key(key)
+
+            if coordinator.data is None or key not in coordinator.data:
+                continue
+
+            if coordinator is self and key in self._live_data:
+                # Kept when the config tier is merged in again before the next poll
+                self._live_data = self._live_data.with_values({key: value})
+
+            coordinator.async_merge_data({key: value})
+
+    @callback
+    def _handle_confirm_writes(self, _now) -> None:
+        """Start the confirmation read of written values."""
+        self._unsub_confirm = None
+        self.hass.async_create_task(self._async_confirm_writes())
+
+    async def _async_confirm_writes(self) -> None:
+        """Read back the written setpoints only, or editParams, instead of refreshing every registry."""
+        written_keys, self._written_keys = self._written_keys, set()
+
+        try:
+            edit_params = None
+            if written_keys <= CURRENT_DATA_PARAMS_EDITS_KEYS:
+                edit_params = await self._api.fetch_current_edits()
+
+            if edit_params is None or not written_keys <= edit_params.keys():
+                edit_params = await self._api.fetch_edit_params()
+        except (
+            ApiError,
+            AuthError,
+            DataError,
+            TimeoutError,
+            aiohttp.ClientError,
+        ) as err:
+            # The next poll reads the values anyway
+            _LOGGER.debug("Confirming written values failed: %s", err)
+            return
+
+        self._edit_params_coordinator().async_merge_data(edit_params)
+
+    async def async_shutdown(self) -> None:
+        """Stop listening to the api and the config tier and cancel a pending confirmation read."""
+        while self._unsubs:
+            self._unsubs.pop()()
+
+        if self._unsub_confirm is not None:
+            self._unsub_confirm()
+            self._unsub_confirm = None
+
+        await super().async_shutdown()
+
+    def _fast_interval(self, data: dict[str, Any] | None) -> int:
+        """Return the fast polling interval, never shorter than the controller refresh hint."""
+        reg_refresh = (data or {}).get(API_SYS_PARAMS_PARAM_REG_REFRESH)
+
+        if not isinstance(reg_refresh, int):
+            return UPDATE_INTERVAL_FAST
+
+        return max(UPDATE_INTERVAL_FAST, reg_refresh)
+
+    def _next_interval(self, data: dict[str, Any]) -> int:
+        """Pick the next polling interval based on the controller state."""
+        mode = data.get("mode")
+        last_mode = self._last_mode
+        self._last_mode = mode
+
+        if (
+            self._last_write is not None
+            and time.monotonic() - self._last_write < UPDATE_INTERVAL_FAST_AFTER_WRITE
+        ):
+            return self._fast_interval(data)
+
+        if mode in OPERATION_MODES_ACTIVE:
+            return self._fast_interval(data)
+
+        if mode in OPERATION_MODES_IDLE and mode == last_mode:
+            return UPDATE_INTERVAL_SLOW
+
+        return UPDATE_INTERVAL
 
     async def _async_update_data(self):
         """Fetch data from API endpoint.
@@ -41,12 +457,56 @@ class EconetDataCoordinator(DataUpdateCoordinator):
 
         _LOGGER.debug("Fetching data from API")
 
+        self._check_circuit(self._api)
+
         try:
             # Note: asyncio.TimeoutError and aiohttp.ClientError are already
             # handled by the data update coordinator.
             async with async_timeout.timeout(90):
-                return await self._api.fetch_data()
+                if self._config_coordinator is None:
+                    data = await self._api.fetch_data()
+                else:
+                    data = await self._fetch_live_data()
         except AuthError as err:
             raise ConfigEntryAuthFailed from err
         except ApiError as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
+
+        interval = (
+            self._next_interval(data) if self._adaptive_polling else UPDATE_INTERVAL
+        )
+
+        if self._scheduler is not None:
+            # Aligned to the slot of the controller, away from the polls of the others
+            interval = self._scheduler.next_delay(self._api.host(), interval)
+            _LOGGER.debug(
+                "Poll queueing delay: %s", self._scheduler.stats(self._api.host())
+            )
+
+        if self._adaptive_polling or self._scheduler is not None:
+            self.update_interval = timedelta(seconds=interval)
+            _LOGGER.debug("Next poll in: %s", self.update_interval)
+
+        return self._track_refresh(data)
+
+    async def _fetch_live_data(self) -> RegistrySnapshot:
+        """Fetch regParams and merge it with the last config data."""
+        self._live_data = await self._api.fetch_reg_params()
+
+        config = self._config_coordinator
+
+        # Before its first refresh the config tier is fetched anyway
+        if config.data is not None and not config.stale and self._api.config_outdated():
+            _LOGGER.debug("Registry version changed, refreshing config data")
+            self.hass.async_create_task(config.async_request_refresh())
+
+        return self._tiers_snapshot()
+
+    def _tiers_snapshot(self) -> RegistrySnapshot:
+        """Layer the config data over the live data, without copying either."""
+        config = self._config_coordinator.data
+
+        if config is None:
+            return self._live_data
+
+        return RegistrySnapshot((*self._live_data.layers(), *config.layers()))
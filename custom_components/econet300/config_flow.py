@@ -1,4 +1,5 @@
 """Config flow for Example Integration integration."""
+
 from __future__ import annotations
 
 import logging
@@ -13,7 +14,7 @@ from homeassistant.exceptions import HomeAssistantError
 
 from .api import make_api
 from .common import AuthError
-from .const import CONF_ENTRY_DESCRIPTION, CONF_ENTRY_TITLE, DOMAIN
+from .const import CONF_ENTRY_DESCRIPTION, CONF_ENTRY_TITLE, CONF_IDENTITY, DOMAIN
 from .mem_cache import MemCache
 
 _LOGGER = logging.getLogger(__name__)
@@ -37,6 +38,8 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     try:
         api = await make_api(hass, cache, data)
         info["uid"] = api.uid()
+        info[CONF_IDENTITY] = api.identity()
+        await api.close()
     except AuthError as auth_error:
         raise InvalidAuth from auth_error
     except TimeoutError as timeout_error:
@@ -72,6 +75,8 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors["base"] = "unknown"
         else:
             user_input["uid"] = info["uid"]
+            # Saves fetching sysParams once more on every startup
+            user_input[CONF_IDENTITY] = info[CONF_IDENTITY]
 
             await self.async_set_unique_id(user_input["uid"])
             self._abort_if_unique_id_configured()
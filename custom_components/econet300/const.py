@@ -4,6 +4,7 @@ DOMAIN = "econet300"
 
 SERVICE_API = "api"
 SERVICE_COORDINATOR = "coordinator"
+SERVICE_CONFIG_COORDINATOR = "config_coordinator"
 
 DEVICE_INFO_MANUFACTURER = "PLUM"
 DEVICE_INFO_MODEL = "ecoNET300"
@@ -14,6 +15,8 @@ DEVICE_INFO_THERMOSTAT_NAME = "EcoSTER Thermostat"
 
 CONF_ENTRY_TITLE = "ecoNET300"
 CONF_ENTRY_DESCRIPTION = "PLUM Econet300"
+# Identity fields of sysParams persisted with the config entry
+CONF_IDENTITY = "identity"
 
 ## Sys params
 API_SYS_PARAMS_URI = "sysParams"
@@ -21,21 +24,174 @@ API_SYS_PARAMS_PARAM_UID = "uid"
 API_SYS_PARAMS_PARAM_MODEL_ID = "controllerID"
 API_SYS_PARAMS_PARAM_SW_REV = "softVer"
 API_SYS_PARAMS_PARAM_HW_VER = "routerType"
+API_SYS_PARAMS_PARAM_REG_REFRESH = "regRefresh"
+API_SYS_PARAMS_PARAM_SETTINGS_VER = "settingsVer"
+# Only these scalar keys and the module<X>SoftVer keys are kept from the
+# ~34 KB document, dropping tiles, schema, alarms, passwords etc.
+API_SYS_PARAMS_KEYS = frozenset(
+    {
+        API_SYS_PARAMS_PARAM_UID,
+        API_SYS_PARAMS_PARAM_MODEL_ID,
+        API_SYS_PARAMS_PARAM_SW_REV,
+        API_SYS_PARAMS_PARAM_HW_VER,
+        API_SYS_PARAMS_PARAM_REG_REFRESH,
+        API_SYS_PARAMS_PARAM_SETTINGS_VER,
+        "signal",
+        "quality",
+        "protocolType",
+    }
+)
+API_SYS_PARAMS_MODULE_PREFIX = "module"
+API_SYS_PARAMS_SOFT_VER_SUFFIX = "SoftVer"
 
 ## Reg params
 API_REG_PARAMS_URI = "regParams"
 API_REG_PARAMS_PARAM_DATA = "curr"
+API_REG_PARAMS_PARAM_SETTINGS_VER = "settingsVer"
+API_REG_PARAMS_PARAM_EDITABLE_PARAMS_VER = "editableParamsVer"
+API_REG_PARAMS_PARAM_SCHEDULES_VER = "schedulesVer"
+API_REG_PARAMS_PARAM_CURRENT_DATA_PARAMS_EDITS_VER = "currentDataParamsEditsVer"
 API_REG_PARAMSDATA_URI = "regParamsData"
 API_REG_PARAMSDATA_PARAM_DATA = "data"
+API_REG_PARAMSDATA_PARAM_VERSION = "version"
 
+## Reg params data
+# Names of the numeric regParamsData ids, as regParams reports them. Only
+# the ids whose name is missing from regParams are polled, the others and
+# the registry itself are skipped until the settings version changes.
+REG_PARAMSDATA_PARAMS_MAPPING_TABLE = {
+    "30": "tempBack",
+    "31": "tempFeeder",
+    "32": "tempExternalSensor",
+    "1024": "tempCO",
+    "1025": "tempCWU",
+    "1030": "tempFlueGas",
+    "1031": "mixerTemp1",
+    "1032": "mixerTemp2",
+    "1033": "mixerTemp3",
+    "1034": "mixerTemp4",
+    "1035": "mixerTemp5",
+}
 
 ## Edit params
 API_EDIT_PARAMS_URI = "editParams"
 API_EDIT_PARAMS_DATA = "data"
+API_EDIT_PARAMS_VALUE = "value"
+
+## Current data params edits
+# ~600 B endpoint with the value and limits of the most edited setpoints,
+# versioned by currentDataParamsEditsVer of regParams
+API_CURRENT_DATA_PARAMS_EDITS_URI = "rmCurrentDataParamsEdits"
+API_CURRENT_DATA_PARAMS_EDITS_DATA = "data"
+API_CURRENT_DATA_PARAMS_EDITS_MIN = "min"
+API_CURRENT_DATA_PARAMS_EDITS_MAX = "max"
+# editParams keys of the ids it reports. Ids 2048 and 2049 are left out
+# until their keys are confirmed against a controller.
+CURRENT_DATA_PARAMS_EDITS_MAPPING_TABLE = {
+    "1280": "CO_TEMP_SET",
+    "1281": "CWU_SET_TEMP",
+}
+CURRENT_DATA_PARAMS_EDITS_KEYS = frozenset(
+    CURRENT_DATA_PARAMS_EDITS_MAPPING_TABLE.values()
+)
+
+## Version gated refresh
+# editParams, sysParams and rmCurrentDataParamsEdits are downloaded again
+# only when their version counter in regParams moves or the cached copy is
+# older than max age
+# (sysParams also carries live values like wifi signal and quality).
+VERSIONED_REFRESH_VERSION_KEYS = {
+    API_SYS_PARAMS_URI: API_REG_PARAMS_PARAM_SETTINGS_VER,
+    API_EDIT_PARAMS_URI: API_REG_PARAMS_PARAM_EDITABLE_PARAMS_VER,
+    API_CURRENT_DATA_PARAMS_EDITS_URI: API_REG_PARAMS_PARAM_CURRENT_DATA_PARAMS_EDITS_VER,
+}
+VERSIONED_REFRESH_MAX_AGE = {
+    API_SYS_PARAMS_URI: 600,
+    API_EDIT_PARAMS_URI: 3600,
+    API_CURRENT_DATA_PARAMS_EDITS_URI: 600,
+}
+
+## Adaptive polling (seconds)
+# Polls run fast while the boiler is active or right after a write and
+# back off while it stays turned off or in supervision. The controller
+# refresh hint (regRefresh) is a lower bound for the fast interval.
+UPDATE_INTERVAL = 60
+UPDATE_INTERVAL_FAST = 15
+UPDATE_INTERVAL_SLOW = 180
+UPDATE_INTERVAL_FAST_AFTER_WRITE = 120
+# sysParams and editParams are polled by their own, slower coordinator
+UPDATE_INTERVAL_CONFIG = 300
+
+OPERATION_MODES_ACTIVE = (2, 3, 8)  # FIRE UP, WORK, ALARM
+OPERATION_MODES_IDLE = (0, 4)  # TURNED OFF, SUPERVISION
+
+## Registry fetching
+# Registries are requested concurrently, but weak controllers choke on
+# parallel sockets so the number of requests in flight is capped.
+API_FETCH_MAX_CONCURRENCY = 2
+API_FETCH_TIMEOUT = 30
+
+## Fleet scheduling
+# Shared by all config entries in hass.data[DOMAIN]. Polls of the
+# controllers are spread over the interval and at most this many requests
+# are in flight across all of them.
+DATA_FLEET_SCHEDULER = "fleet_scheduler"
+FLEET_MAX_IN_FLIGHT = 8
+# Seconds a request may wait for a slot before it is logged
+FLEET_QUEUE_DELAY_WARNING = 10
+
+## JSON decoding
+# Bodies of at least this many bytes, like sysParams and editParams, are
+# decoded in the executor instead of on the event loop
+API_JSON_EXECUTOR_THRESHOLD = 16384
+# orjson decodes them faster than a round trip to the executor takes
+API_JSON_EXECUTOR_THRESHOLD_ORJSON = 262144
+
+## Connection pool
+# One dedicated keep-alive pool per controller host
+API_CONNECTION_LIMIT = 2
+API_CONNECTION_KEEPALIVE_TIMEOUT = 90
+API_CONNECTION_DNS_CACHE_TTL = 300
+
+## Retries and circuit breaker
+API_REQUEST_TIMEOUT = 10
+API_RETRY_MAX_ATTEMPTS = 4
+API_RETRY_BASE_DELAY = 1
+API_RETRY_MAX_DELAY = 8
+# Retries of a single request stop once this many seconds passed
+API_RETRY_BUDGET = 30
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 3
+CIRCUIT_BREAKER_RESET_TIMEOUT = 60
+
+## Write queue
+# Seconds a burst of writes may settle before it is sent to the controller
+API_WRITE_DEBOUNCE = 0.3
+# Seconds after the last write before editParams is read back to confirm it
+API_WRITE_CONFIRM_DELAY = 5
+# Seconds closing the api waits for the queued writes to be sent
+API_WRITE_FLUSH_TIMEOUT = 10
+
+## Memory cache
+MEM_CACHE_MAX_ENTRIES = 128
+# Seconds between sweeps of expired cache entries
+MEM_CACHE_SWEEP_INTERVAL = 60
+
+## Warm start snapshot
+# Entities start from the last good data while the first refresh runs,
+# flagged by the stale state attribute
+ATTR_STALE = "stale"
+# 2 keeps the registry layers, so editParams records restore the limits
+SNAPSHOT_STORE_VERSION = 2
+# Seconds between writes of the snapshot to disk
+SNAPSHOT_SAVE_DELAY = 300
+# Snapshots older than this many seconds are ignored
+SNAPSHOT_MAX_AGE = 86400
+# Registry layer name of the restored data
+SNAPSHOT_LAYER = "snapshot"
 
 ## Editable params limits
 # API_EDIT_PARAM_URI = "rmCurrNewParam"
-# other data params edits 
+# other data params edits
 # API_EDITABLE_PARAMS_LIMITS_URI = "rmCurrentDataParamsEdits"
 # API_EDITABLE_PARAMS_LIMITS_URI = "editParams"
 # API_EDITABLE_PARAMS_LIMITS_DATA = "data"
@@ -100,7 +256,7 @@ EDITABLE_PARAMS_MAPPING_TABLE = {
     "CTRL_WEATHER_MIX_2": "CTRL_WEATHER_MIX_2",
     "CTRL_WEATHER_MIX_3": "CTRL_WEATHER_MIX_3",
     "CTRL_WEATHER_MIX_4": "CTRL_WEATHER_MIX_4",
-    "CTRL_WEATHER_MIX_5": "CTRL_WEATHER_MIX_5"
+    "CTRL_WEATHER_MIX_5": "CTRL_WEATHER_MIX_5",
 }
 
 AVAILABLE_NUMBER_OF_MIXERS = 5
@@ -134,7 +290,7 @@ ENTITY_MAX_VALUE = {
     "CO_TEMP_SET": 85,
     "CALORIFIC_KWH_KG": 25,
     "CWU_SET_TEMP": 70,
-    "FUEL_KG_H":25,
+    "FUEL_KG_H": 25,
     "EXTERN_BOILER_TEMP": 60,
     "MIX_HEAT_CURVE_4": 4.0,
     "MIX_HEAT_CURVE_5": 4.0,
@@ -152,7 +308,6 @@ ENTITY_MAX_VALUE = {
     "STER_TEMP_NIGHT_3": 35,
     "MIX_SET_TEMP_4": 50,
     "MIX_SET_TEMP_5": 70,
-
 }
 
 # Switch states
@@ -202,6 +357,12 @@ ECOSTER_MODE_NAMES = {
     11: "Turn off heating",
 }
 
+LAMBDA_STATUS_NAMES = {
+    0: "STOP",
+    1: "START",
+    2: "Working",
+}
+
 
 # add constants to future
 PRODUCT_TYPE = {
@@ -227,7 +388,7 @@ REG_PARAM_PRECICION = {
     "tempCWU": 1,
     "tempCWUSet": 0,
     "tempUpperBuffer": 0,
-     "tempLowerBuffer": 0,
+    "tempLowerBuffer": 0,
     "tempOpticalSensor": 0,
 }
 
@@ -288,5 +449,5 @@ ALARMS_NAMES = {
     53: "Clogged auger Alarm",
     54: "Temperature above maximum for the thermocouple.",
     55: "Thermocouple wired improperly.",
-    255: "Alarm unknown"
+    255: "Alarm unknown",
 }
@@ -0,0 +1,20 @@
+"""Diagnostics support for the econet300 integration."""
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, SERVICE_API
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return the runtime counters of a config entry, without its credentials."""
+    api = hass.data[DOMAIN][entry.entry_id][SERVICE_API]
+
+    return {
+        "circuit_breaker": api.circuit_breaker().state(),
+        "cache": api.cache_stats(),
+    }
@@ -1,5 +1,7 @@
 """Base econet entity class."""
+
 import logging
+from typing import Any
 
 from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo, EntityDescription
@@ -8,6 +10,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .api import Econet300Api
 from .common import EconetDataCoordinator
 from .const import (
+    ATTR_STALE,
     DEVICE_INFO_CONTROLLER_NAME,
     DEVICE_INFO_MANUFACTURER,
     DEVICE_INFO_MIXER_NAME,
@@ -19,83 +22,164 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+DEVICE_KIND_CONTROLLER = "controller"
+DEVICE_KIND_MIXER = "mixer"
+DEVICE_KIND_ECOSTER = "ecoster"
+DEVICE_KIND_ECOSTER_THERM = "ecostertherm"
+
+# Per controller uid, dropped when its config entry unloads. Shared by all
+# entities of a device, must not be mutated.
+_DEVICE_INFO: dict[
+    str, dict[tuple[str, int | None], tuple[tuple[str, ...], DeviceInfo]]
+] = {}
+
+
+def device_info(api: Econet300Api, kind: str, idx: int | None = None) -> DeviceInfo:
+    """Return the DeviceInfo of a device, built once per (uid, kind, idx) and identity."""
+    infos = _DEVICE_INFO.get(api.uid())
+    if infos is None:
+        infos = _DEVICE_INFO[api.uid()] = {}
+
+    key = (kind, idx)
+    cached = infos.get(key)
+    # Everything the DeviceInfo is built from, e.g. a new IP in configuration_url
+    identity = (api.sw_rev(), api.hw_ver(), api.model_id(), api.host())
+
+    if cached is not None and cached[0] == identity:
+        return cached[1]
+
+    info = _build_device_info(api, kind, idx)
+    infos[key] = (identity, info)
+
+    return info
+
+
+def forget_device_info(api: Econet300Api) -> None:
+    """Drop the cached DeviceInfo of a controller, e.g. when its entry unloads."""
+    _DEVICE_INFO.pop(api.uid(), None)
+
+
+def _build_device_info(api: Econet300Api, kind: str, idx: int | None) -> DeviceInfo:
+    if kind == DEVICE_KIND_CONTROLLER:
+        return DeviceInfo(
+            identifiers={(DOMAIN, api.uid())},
+            name=DEVICE_INFO_CONTROLLER_NAME,
+            manufacturer=DEVICE_INFO_MANUFACTURER,
+            model=DEVICE_INFO_MODEL,
+            configuration_url=api.host(),
+            sw_version=api.sw_rev(),
+            hw_version=api.hw_ver(),
+        )
+
+    if kind == DEVICE_KIND_MIXER:
+        name = f"{DEVICE_INFO_MIXER_NAME}{idx}"
+    elif kind == DEVICE_KIND_ECOSTER:
+        name = f"{DEVICE_INFO_ECOSTER_NAME} {idx}"
+    else:
+        name = f"{DEVICE_INFO_THERMOSTAT_NAME} {idx}"
+
+    return DeviceInfo(
+        identifiers={(DOMAIN, f"{api.uid()}-{kind}-{idx}")},
+        name=name,
+        manufacturer=DEVICE_INFO_MANUFACTURER,
+        model=DEVICE_INFO_MODEL,
+        configuration_url=api.host(),
+        sw_version=api.sw_rev(),
+        via_device=(DOMAIN, api.uid()),
+    )
+
 
 class EconetEditParamsValue:
     """Read value param from the JSON payload with param value: ."""
+
     def __init__(self, editvalue: float):
         """Construct the necessary attributes for the Limits object."""
         self.editval = editvalue
 
+
 class EconetEntity(CoordinatorEntity):
     """Representes EconetEntity."""
 
+    # Entities reading several live keys follow the live tier whatever their key is
+    _follow_live_tier = False
+    _device_kind = DEVICE_KIND_CONTROLLER
+    _idx: int | None = None
+
     def __init__(
         self,
         description: EntityDescription,
         coordinator: EconetDataCoordinator,
         api: Econet300Api,
     ):
-        super().__init__(coordinator)
+        # Listen only to the coordinator tier that holds the entity key,
+        # values are always read from the merged data of the main coordinator.
+        super().__init__(
+            coordinator
+            if self._follow_live_tier
+            else coordinator.coordinator_for_key(description.key)
+        )
 
         self.entity_description = description
         self._api = api
         self._coordinator = coordinator
-
-    @property
-    def unique_id(self) -> str | None:
-        """Return the unique_id of the entity."""
-        return f"{self._api.uid()}-{self.entity_description.key}"
+        self._attr_unique_id = f"{api.uid()}-{description.key}"
 
     @property
     def device_info(self) -> DeviceInfo | None:
         """Return device info of the entity."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._api.uid())},
-            name=DEVICE_INFO_CONTROLLER_NAME,
-            manufacturer=DEVICE_INFO_MANUFACTURER,
-            model=DEVICE_INFO_MODEL,
-            configuration_url=self._api.host(),
-            sw_version=self._api.sw_rev(),
-            hw_version=self._api.hw_ver(),
-        )
+        return device_info(self._api, self._device_kind, self._idx)
 
     @property
     def name(self) -> str:
         """Return the name of the entity."""
         return self.entity_description.name
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Flag values restored from the snapshot until the first refresh."""
+        if self.coordinator.stale:
+            return {ATTR_STALE: True}
+
+        return None
+
+    def _watched_keys(self) -> tuple[str, ...]:
+        """Return the data keys the state of the entity depends on."""
+        return (self.entity_description.key,)
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         _LOGGER.debug(
-            "Update EconetEntity, entity name: %s : %s,", 
+            "Update EconetEntity, entity name: %s : %s,",
             self.entity_description.name,
-            self.entity_description.key
+            self.entity_description.key,
         )
-        
+
         if self._coordinator.data[self.entity_description.key] is None:
             _LOGGER.warning(
                 "Data key: %s was expected to exist but it doesn't",
                 self.entity_description.key,
             )
             return
-            
+
         value = self._coordinator.data[self.entity_description.key]
-        
+
         # _LOGGER.debug("handle coordinator data value: %s", value)
         self._sync_state(value)
 
     async def async_added_to_hass(self):
         """Handle added to hass."""
+        # Only called back by the coordinator when a watched key changed
+        self.coordinator_context = frozenset(self._watched_keys())
 
         if self._coordinator.data[self.entity_description.key] is None:
             _LOGGER.warning(
                 "Data key: %s was expected to exist but it doesn't",
                 self.entity_description.key,
             )
-            
+
             return
-            
+
         value = self._coordinator.data[self.entity_description.key]
 
         await super().async_added_to_hass()
@@ -105,6 +189,8 @@ class EconetEntity(CoordinatorEntity):
 class MixerEntity(EconetEntity):
     """Represents MixerEntity."""
 
+    _device_kind = DEVICE_KIND_MIXER
+
     def __init__(
         self,
         description: EntityDescription,
@@ -116,23 +202,12 @@ class MixerEntity(EconetEntity):
 
         self._idx = idx
 
-    @property
-    def device_info(self) -> DeviceInfo | None:
-        """Return device info of the entity."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._api.uid()}-mixer-{self._idx}")},
-            name=f"{DEVICE_INFO_MIXER_NAME}{self._idx}",
-            manufacturer=DEVICE_INFO_MANUFACTURER,
-            model=DEVICE_INFO_MODEL,
-            configuration_url=self._api.host(),
-            sw_version=self._api.sw_rev(),
-            via_device=(DOMAIN, self._api.uid()),
-        )
-
 
 class EcosterEntity(EconetEntity):
     """Represents EcosterEntity."""
 
+    _device_kind = DEVICE_KIND_ECOSTER
+
     def __init__(
         self,
         description: EntityDescription,
@@ -144,22 +219,12 @@ class EcosterEntity(EconetEntity):
 
         self._idx = idx
 
-    @property
-    def device_info(self) -> DeviceInfo | None:
-        """Return device info of the entity."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._api.uid()}-ecoster-{self._idx}")},
-            name=f"{DEVICE_INFO_ECOSTER_NAME} {self._idx}",
-            manufacturer=DEVICE_INFO_MANUFACTURER,
-            model=DEVICE_INFO_MODEL,
-            configuration_url=self._api.host(),
-            sw_version=self._api.sw_rev(),
-            via_device=(DOMAIN, self._api.uid()),
-        )
 
 class EcosterThermEntity(EconetEntity):
     """Represents EcosterClimateEntity."""
 
+    _device_kind = DEVICE_KIND_ECOSTER_THERM
+
     def __init__(
         self,
         description: EntityDescription,
@@ -169,16 +234,3 @@ class EcosterThermEntity(EconetEntity):
     ):
         super().__init__(description, coordinator, api)
         self._idx = idx
-
-    @property
-    def device_info(self) -> DeviceInfo | None:
-        """Return device info of the entity."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._api.uid()}-ecostertherm-{self._idx}")},
-            name=f"{DEVICE_INFO_THERMOSTAT_NAME} {self._idx}",
-            manufacturer=DEVICE_INFO_MANUFACTURER,
-            model=DEVICE_INFO_MODEL,
-            configuration_url=self._api.host(),
-            sw_version=self._api.sw_rev(),
-            via_device=(DOMAIN, self._api.uid()),
-        )
@@ -1,61 +1,162 @@
-
 """Module provides a memory cache implementation."""
+
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 import logging
 import time
+from typing import Any
 
-_LOGGER = logging.getLogger(__name__)
+from .const import MEM_CACHE_MAX_ENTRIES, MEM_CACHE_SWEEP_INTERVAL
 
+_LOGGER = logging.getLogger(__name__)
 
+_MISSING = object()
 
 
 class MemCacheItem:
     """Class representing an item in the memory cache."""
 
-    def __init__(self, key, value, duration: int):
+    __slots__ = ("_key", "_value", "_expiry")
+
+    def __init__(self, key, value, duration: float):
         """Initialize a MemCacheItem object."""
-        
+
         self._key = key
         self._value = value
-        self._expiry = time.time() + duration
+        # Monotonic, so wall clock corrections do not expire entries early or late
+        self._expiry = time.monotonic() + duration
 
     def value(self):
         """Get the value of the cache item."""
         return self._value
 
     def expiry(self):
-        """Get the expiry time of the cache item."""
+        """Get the monotonic expiry time of the cache item."""
         return self._expiry
 
+    def expired(self, now: float | None = None) -> bool:
+        """Check if the cache item expired."""
+        return self._expiry <= (time.monotonic() if now is None else now)
+
     def __repr__(self):
         """Return a string representation of the cache item."""
         return "<MemCacheItem {{{}:{}}} expires at: {}, expired: {}>".format(
             self._key,
             self._value,
             self.expiry(),
-            self.expiry() < time.time(),
+            self.expired(),
         )
 
-class MemCache:
-    """Class representing a memory cache."""
 
-    def __init__(self):
+class MemCache:
+    """Class representing a memory cache.
+
+    Entries expire after their duration and the least recently used entry is
+    evicted once max_entries is exceeded. Expired entries are swept at most
+    every sweep_interval seconds on access, so they do not pile up.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = MEM_CACHE_MAX_ENTRIES,
+        sweep_interval: float = MEM_CACHE_SWEEP_INTERVAL,
+    ):
         """Initialize an empty cache."""
-        self._data = {}
+        self._data: OrderedDict[Any, MemCacheItem] = OrderedDict()
+        self._max_entries = max_entries
+        self._sweep_interval = sweep_interval
+        self._next_sweep = time.monotonic() + sweep_interval
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def __len__(self) -> int:
+        """Return the number of entries, including expired ones not swept yet."""
+        return len(self._data)
 
     def exists(self, key):
-        """Check if the specified key exists in the cache."""
-        return self.get(key) is not None
+        """Check if the specified key holds an unexpired entry, even a cached None."""
+        item = self._data.get(key)
+        return item is not None and not item.expired()
 
-    def get(self, key):
+    def get(self, key, default=None):
         """Get the value of the specified key from the cache."""
-        if key not in self._data or self._data[key].expiry() < time.time():
+        now = time.monotonic()
+        self._maybe_sweep(now)
+        item = self._data.get(key)
+
+        if item is None or item.expired(now):
+            if item is not None:
+                del self._data[key]
+                self._expirations += 1
+
+            self._misses += 1
             _LOGGER.debug("Cache entry missing for key: '%s'", key)
-            return None
+            return default
 
-        return self._data[key].value()
+        self._hits += 1
+        self._data.move_to_end(key)
 
+        return item.value()
 
-    def set(self, key, value, duration: int = 30):
+    def set(self, key, value, duration: float = 30):
         """Set the value of the specified key in the cache."""
         _LOGGER.debug("Caching value for: '%s'", key)
+        now = time.monotonic()
+        self._maybe_sweep(now)
         self._data[key] = MemCacheItem(key, value, duration)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self._max_entries:
+            evicted, _ = self._data.popitem(last=False)
+            self._evictions += 1
+            _LOGGER.debug("Evicted least recently used cache entry: '%s'", evicted)
+
+    async def get_or_fetch(
+        self, key, fetch: Callable[[], Awaitable[Any]], duration: float = 30
+    ):
+        """Get the value of the specified key with one lookup, fetching and caching it when missing."""
+        value = self.get(key, _MISSING)
+
+        if value is _MISSING:
+            value = await fetch()
+            self.set(key, value, duration)
+
+        return value
+
+    def delete(self, key) -> None:
+        """Remove the specified key from the cache."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        self._data.clear()
+
+    def sweep(self) -> int:
+        """Remove all expired entries and return how many were removed."""
+        now = time.monotonic()
+        self._next_sweep = now + self._sweep_interval
+        expired = [key for key, item in self._data.items() if item.expired(now)]
+
+        for key in expired:
+            del self._data[key]
+
+        self._expirations += len(expired)
+
+        return len(expired)
+
+    def stats(self) -> dict[str, int]:
+        """Get the hit, miss and eviction counters for diagnostics."""
+        return {
+            "size": len(self._data),
+            "max_entries": self._max_entries,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+        }
+
+    def _maybe_sweep(self, now: float) -> None:
+        if now >= self._next_sweep:
+            self.sweep()
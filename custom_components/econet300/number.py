@@ -1,4 +1,5 @@
 """Base Number for Econet300."""
+
 from dataclasses import dataclass
 import logging
 
@@ -24,8 +25,7 @@ from .const import (
     ENTITY_MAX_VALUE,
     EDITABLE_PARAMS_MAPPING_TABLE,
     AVAILABLE_NUMBER_OF_MIXERS,
-    AVAILABLE_NUMBER_OF_ECOSTERS
-
+    AVAILABLE_NUMBER_OF_ECOSTERS,
 )
 from .entity import EconetEntity, MixerEntity, EcosterEntity
 from enum import StrEnum
@@ -37,6 +37,7 @@ _LOGGER = logging.getLogger(__name__)
 class EconetNumberEntityDescription(NumberEntityDescription):
     """Describes Econet number entity."""
 
+
 class UnitOfVolumeFlowRates(StrEnum):
     """Volume flow rate units."""
 
@@ -95,7 +96,7 @@ NUMBER_TYPES: tuple[EconetNumberEntityDescription, ...] = (
         max_value=55,
         native_step=1,
     ),
-        EconetNumberEntityDescription(
+    EconetNumberEntityDescription(
         key="EXTERN_BOILER_TEMP",
         name="Outer boiler turn-off temperature",
         translation_key="extern_boiler_temp",
@@ -107,9 +108,9 @@ NUMBER_TYPES: tuple[EconetNumberEntityDescription, ...] = (
         max_value=60,
         native_step=1,
     ),
-
 )
 
+
 class EconetNumber(EconetEntity, NumberEntity):
     """Describes Econet number sensor entity."""
 
@@ -124,30 +125,28 @@ class EconetNumber(EconetEntity, NumberEntity):
 
     def _sync_state(self, value):
         """Sync state."""
-        map_key = EDITABLE_PARAMS_MAPPING_TABLE.get(self.entity_description.key)
         self._attr_native_value = value
-        self._attr_native_min_value = ENTITY_MIN_VALUE.get(map_key)
-        self._attr_native_max_value = ENTITY_MAX_VALUE.get(map_key)
-
-        self.async_write_ha_state()
-        #self.hass.async_create_task(self.async_set_limits_values()) 
+        limits = self._api.param_limits(self.entity_description.key)
 
-    async def async_set_limits_values(self):
-        """Async Sync number limits."""
-        limits = await self._api.get_param_limits(self.entity_description.key)
-        if limits is None:
-            _LOGGER.warning(
-                "Cannot add number entity: %s, numeric limits for this entity is None",
-                self.entity_description.key,
-            )
-        else:
+        if limits is not None:
             self._attr_native_min_value = limits.minv
             self._attr_native_max_value = limits.maxv
-            self.async_write_ha_state()
+            self._attr_native_step = (
+                limits.step
+                if limits.step is not None
+                else self.entity_description.native_step
+            )
+        else:
+            # The controller does not report limits of this param
+            map_key = EDITABLE_PARAMS_MAPPING_TABLE.get(self.entity_description.key)
+            self._attr_native_min_value = ENTITY_MIN_VALUE.get(map_key)
+            self._attr_native_max_value = ENTITY_MAX_VALUE.get(map_key)
+
+        self.async_write_ha_state()
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        
+
         if value == self._attr_native_value:
             return
 
@@ -166,13 +165,16 @@ class EconetNumber(EconetEntity, NumberEntity):
             )
             return
         if "MIX_SET_TEMP" in self.entity_description.key:
-            if self.entity_description.key == f"MIX_SET_TEMP_{str(self._idx)}" and self._coordinator.data[f"CTRL_WEATHER_MIX_{str(self._idx)}"] == 1:
-                _LOGGER.warning(f"Weather control for MIXER {str(self._idx)} is used to set the temperature.")
-                raise ServiceValidationError(f"Weather control for MIXER {str(self._idx)} is used to set the temperature.")
-                return
-        else:
-            if not await self._api.set_param(self.entity_description.key, value):
-                _LOGGER.warning("Setting value failed")
+            if (
+                self.entity_description.key == f"MIX_SET_TEMP_{str(self._idx)}"
+                and self._coordinator.data[f"CTRL_WEATHER_MIX_{str(self._idx)}"] == 1
+            ):
+                _LOGGER.warning(
+                    f"Weather control for MIXER {str(self._idx)} is used to set the temperature."
+                )
+                raise ServiceValidationError(
+                    f"Weather control for MIXER {str(self._idx)} is used to set the temperature."
+                )
                 return
 
         if not await self._api.set_param(self.entity_description.key, value):
@@ -182,31 +184,34 @@ class EconetNumber(EconetEntity, NumberEntity):
         self._attr_native_value = value
         self.async_write_ha_state()
 
+
 class MixerNumber(MixerEntity, EconetNumber):
     """Mixer sensor class."""
 
     def __init__(
-            self,
-            description: EconetNumberEntityDescription,
-            coordinator: EconetDataCoordinator,
-            api: Econet300Api,
-            idx: int,
-        ):
-            """Initialize a new instance of the EconetSensor class."""
-            super().__init__(description, coordinator, api, idx)
+        self,
+        description: EconetNumberEntityDescription,
+        coordinator: EconetDataCoordinator,
+        api: Econet300Api,
+        idx: int,
+    ):
+        """Initialize a new instance of the EconetSensor class."""
+        super().__init__(description, coordinator, api, idx)
+
 
 class EcosterNumber(EcosterEntity, EconetNumber):
     """Mixer sensor class."""
 
     def __init__(
-            self,
-            description: EconetNumberEntityDescription,
-            coordinator: EconetDataCoordinator,
-            api: Econet300Api,
-            idx: int,
-        ):
-            """Initialize a new instance of the EconetSensor class."""
-            super().__init__(description, coordinator, api, idx)
+        self,
+        description: EconetNumberEntityDescription,
+        coordinator: EconetDataCoordinator,
+        api: Econet300Api,
+        idx: int,
+    ):
+        """Initialize a new instance of the EconetSensor class."""
+        super().__init__(description, coordinator, api, idx)
+
 
 def create_mixer_numbers(coordinator: EconetDataCoordinator, api: Econet300Api):
     """Create individual sensor descriptions for mixer sensors."""
@@ -227,7 +232,7 @@ def create_mixer_numbers(coordinator: EconetDataCoordinator, api: Econet300Api):
         )
         if can_add(description, coordinator):
             entities.append(MixerNumber(description, coordinator, api, i))
-            
+
         else:
             _LOGGER.debug(
                 "Availability key: %s does not exist, entity will not be added",
@@ -311,6 +316,7 @@ def create_mixer_numbers(coordinator: EconetDataCoordinator, api: Econet300Api):
             )
     return entities
 
+
 def create_ecoster_numbers(coordinator: EconetDataCoordinator, api: Econet300Api):
     """Create individual sensor descriptions for mixer sensors."""
     entities = []
@@ -356,34 +362,23 @@ def create_ecoster_numbers(coordinator: EconetDataCoordinator, api: Econet300Api
             )
     return entities
 
-def can_add_number(
-    desc: str, coordinator: EconetDataCoordinator
-):
-    return (
-        coordinator.has_data(desc)
-        and coordinator.data[desc] is not None
-    )
+
+def can_add_number(desc: str, coordinator: EconetDataCoordinator):
+    return coordinator.has_data(desc) and coordinator.data[desc] is not None
+
 
 def can_add(desc: EconetNumberEntityDescription, coordinator: EconetDataCoordinator):
     """Check if a given entity can be added based on the availability of data in the coordinator."""
-    _LOGGER 
+    _LOGGER
     return coordinator.has_data(desc.key) and coordinator.data[desc.key]
 
+
 def create_controller_numbers(coordinator: EconetDataCoordinator, api: Econet300Api):
     """Add key."""
     entities = []
 
     for description in NUMBER_TYPES:
-        # number_limits = await api.get_param_limits(description.key)
-
-        # if number_limits is None:
-        #     _LOGGER.warning(
-        #         "Cannot add entity: {}, numeric limits for this entity is None"
-        #     )
-        #     continue
-
         if can_add(description, coordinator):
-            # apply_limits(description, number_limits)
             entities.append(EconetNumber(description, coordinator, api))
         else:
             _LOGGER.debug(
@@ -392,6 +387,7 @@ def create_controller_numbers(coordinator: EconetDataCoordinator, api: Econet300
             )
     return entities
 
+
 def apply_limits(desc: EconetNumberEntityDescription, limits: Limits):
     """Set the native minimum and maximum values for the given entity description."""
     desc.native_min_value = limits.minv
@@ -412,5 +408,5 @@ async def async_setup_entry(
     entities = entities + create_controller_numbers(coordinator, api)
     entities = entities + create_mixer_numbers(coordinator, api)
     entities = entities + create_ecoster_numbers(coordinator, api)
-    
+
     return async_add_entities(entities)
@@ -0,0 +1,281 @@
+"""Immutable layered view of the registries fetched from the controller."""
+
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+_MISSING = object()
+
+
+@dataclass(frozen=True, eq=False)
+class RegistryLayer:
+    """Parsed data of one registry, referenced and never copied or mutated.
+
+    With a field, the data holds records and the value of a key is the
+    given field of its record, e.g. the value of an editParams record.
+    An overlay layer is meant to update values of the layers below, its
+    keys are not reported as collisions.
+    """
+
+    name: str
+    data: Mapping[str, Any]
+    field: str | None = None
+    overlay: bool = False
+
+    def reuses(self, other: "RegistryLayer | None") -> bool:
+        """Check if the layer references the same data as another one."""
+        return (
+            other is not None and other.data is self.data and other.field == self.field
+        )
+
+    def value(self, key: str) -> Any:
+        """Return the value of a key present in the layer."""
+        value = self.data[key]
+        return value if self.field is None else value[self.field]
+
+    def changed_keys(self, old: "RegistryLayer") -> set[str]:
+        """Return the keys whose value, or whole record for a field, differs from the old layer."""
+        old_data = old.data
+
+        if self.field == old.field:
+            # Records are compared whole, a change of their limits counts too
+            changed = {
+                key
+                for key, value in self.data.items()
+                if old_data.get(key, _MISSING) != value
+            }
+        else:
+            changed = {
+                key
+                for key in self.data
+                if key not in old_data or old.value(key) != self.value(key)
+            }
+
+        return changed | (old_data.keys() - self.data.keys())
+
+    def with_values(self, values: Mapping[str, Any]) -> "RegistryLayer":
+        """Return a layer with the given values of existing keys replaced."""
+        if self.field is None:
+            return RegistryLayer(
+                self.name, {**self.data, **values}, overlay=self.overlay
+            )
+
+        data = dict(self.data)
+        for key, value in values.items():
+            data[key] = {**data[key], self.field: value}
+
+        return RegistryLayer(self.name, data, self.field, self.overlay)
+
+
+class RegistrySnapshot(Mapping[str, Any]):
+    """Read only mapping over registry layers, the last layer of a key wins.
+
+    Building a snapshot is O(layers) whatever the number of keys, lookups
+    check the layers from the top. Snapshots sharing a layer object share
+    its data, which lets change tracking skip the layers that were reused.
+    """
+
+    __slots__ = ("_layers", "_keys", "_collisions")
+
+    def __init__(self, layers: Iterable[RegistryLayer] = ()) -> None:
+        """Initialize the snapshot from layers, lowest priority first."""
+        self._layers = tuple(layers)
+        self._keys: dict[str, None] | None = None
+        self._collisions: dict[str, tuple[str, ...]] | None = None
+
+    @classmethod
+    def of(cls, name: str, data: Mapping[str, Any]) -> "RegistrySnapshot":
+        """Return a snapshot of a single plain layer."""
+        return cls((RegistryLayer(name, data),))
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the value of the topmost layer holding the key."""
+        for layer in reversed(self._layers):
+            if key in layer.data:
+                return layer.value(key)
+
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value of a key or the default."""
+        for layer in reversed(self._layers):
+            if key in layer.data:
+                return layer.value(key)
+
+        return default
+
+    def __contains__(self, key: object) -> bool:
+        """Check if any layer holds the key."""
+        return any(key in layer.data for layer in self._layers)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys of all layers."""
+        return iter(self._key_index())
+
+    def __len__(self) -> int:
+        """Return the number of distinct keys."""
+        return len(self._key_index())
+
+    def __repr__(self) -> str:
+        """Return the layer names and sizes."""
+        layers = ", ".join(f"{layer.name}={len(layer.data)}" for layer in self._layers)
+        return f"RegistrySnapshot({layers})"
+
+    def layers(self) -> tuple[RegistryLayer, ...]:
+        """Return the layers, lowest priority first."""
+        return self._layers
+
+    def layer(self, name: str) -> Mapping[str, Any] | None:
+        """Return the unprojected data of a layer, e.g. the full editParams records."""
+        for layer in self._layers:
+            if layer.name == name:
+                return layer.data
+
+        return None
+
+    def with_layers(self, *layers: RegistryLayer) -> "RegistrySnapshot":
+        """Return a snapshot with layers of the same name replaced, others added on top."""
+        replaced = {layer.name: layer for layer in layers}
+        kept = tuple(replaced.pop(layer.name, layer) for layer in self._layers)
+
+        return RegistrySnapshot(kept + tuple(replaced.values()))
+
+    def with_values(self, values: Mapping[str, Any]) -> "RegistrySnapshot":
+        """Return a snapshot with the values of existing keys replaced in their topmost layer.
+
+        Only the layers holding one of the keys are copied.
+        """
+        by_layer: dict[int, dict[str, Any]] = {}
+        for key, value in values.items():
+            for idx in range(len(self._layers) - 1, -1, -1):
+                if key in self._layers[idx].data:
+                    by_layer.setdefault(idx, {})[key] = value
+                    break
+
+        return RegistrySnapshot(
+            layer.with_values(by_layer[idx]) if idx in by_layer else layer
+            for idx, layer in enumerate(self._layers)
+        )
+
+    def collisions(self) -> dict[str, tuple[str, ...]]:
+        """Return the keys held by several layers with the names of those layers."""
+        if self._collisions is None:
+            seen: dict[str, list[str]] = {}
+            for idx, layer in enumerate(self._layers):
+                for other in self._layers[idx + 1 :]:
+                    if other.overlay:
+                        continue
+
+                    for key in layer.data.keys() & other.data.keys():
+                        names = seen.setdefault(key, [layer.name])
+                        if other.name not in names:
+                            names.append(other.name)
+
+            self._collisions = {key: tuple(names) for key, names in seen.items()}
+
+        return self._collisions
+
+    def changed_keys(self, previous: Mapping[str, Any]) -> set[str]:
+        """Return the keys whose value or records differ from the previous data.
+
+        A key also changed when only the other fields of one of its records,
+        e.g. the editParams limits, changed. Against a snapshot of the same
+        registries only the layers that were replaced are compared.
+        """
+        if not isinstance(previous, RegistrySnapshot):
+            return {key for key in self if previous.get(key, _MISSING) != self[key]} | (
+                previous.keys() - self._key_index().keys()
+            )
+
+        if [layer.name for layer in previous.layers()] != [
+            layer.name for layer in self._layers
+        ]:
+            changed = self._key_index().keys() | previous._key_index().keys()  # noqa: SLF001
+        else:
+            changed = set()
+            for old, new in zip(previous.layers(), self._layers, strict=True):
+                if not new.reuses(old):
+                    changed |= new.changed_keys(old)
+
+        # Only few keys change per poll, the layers above or below a changed
+        # layer may still shadow or provide the same value
+        return {
+            key
+            for key in changed
+            if self._state(key) != previous._state(key)  # noqa: SLF001
+        }
+
+    def _state(self, key: str) -> Any:
+        """Return the value of a key with the records of the field layers holding it."""
+        value = _MISSING
+        records = []
+
+        for layer in reversed(self._layers):
+            if key in layer.data:
+                if value is _MISSING:
+                    value = layer.value(key)
+                if layer.field is not None:
+                    records.append(layer.data[key])
+
+        return value if not records else (value, records)
+
+    def _key_index(self) -> dict[str, None]:
+        if self._keys is None:
+            keys: dict[str, None] = {}
+            for layer in self._layers:
+                keys.update(dict.fromkeys(layer.data))
+
+            self._keys = keys
+
+        return self._keys
+
+
+class RegParamsDataIndex:
+    """Names of the regParamsData ids, resolved once per registry version.
+
+    The values of a poll are stored in a list in the order of the ids, so
+    polls of the same version only fill a list instead of building a dict.
+    """
+
+    __slots__ = ("version", "ids", "slots")
+
+    def __init__(self, version: int | None, names: Mapping[str, str]) -> None:
+        """Index the id -> name mapping of the given version."""
+        self.version = version
+        self.ids = tuple(names)
+        self.slots = {name: slot for slot, name in enumerate(names.values())}
+
+    def __len__(self) -> int:
+        """Return the number of indexed ids."""
+        return len(self.ids)
+
+    def values(self, data: Mapping[str, Any]) -> "RegParamsDataValues":
+        """Return the values of the indexed ids in the data of a poll."""
+        return RegParamsDataValues(self, [data.get(param_id) for param_id in self.ids])
+
+
+class RegParamsDataValues(Mapping[str, Any]):
+    """Read only name -> value mapping over the values of one poll."""
+
+    __slots__ = ("_index", "_values")
+
+    def __init__(self, index: RegParamsDataIndex, values: list[Any]) -> None:
+        """Initialize the values, ordered like the ids of the index."""
+        self._index = index
+        self._values = values
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the value of a name."""
+        return self._values[self._index.slots[key]]
+
+    def __contains__(self, key: object) -> bool:
+        """Check if the name is indexed."""
+        return key in self._index.slots
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the names."""
+        return iter(self._index.slots)
+
+    def __len__(self) -> int:
+        """Return the number of names."""
+        return len(self._values)
@@ -0,0 +1,200 @@
+"""Poll scheduler shared by every controller of the integration."""
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+import contextlib
+import logging
+import time
+
+from .const import FLEET_MAX_IN_FLIGHT, FLEET_QUEUE_DELAY_WARNING
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class QueueDelay:
+    """Time the requests of one controller waited for a slot."""
+
+    __slots__ = ("requests", "queued", "total", "max", "last")
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.requests = 0
+        self.queued = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def record(self, delay: float) -> None:
+        """Count a request that waited the given seconds."""
+        self.requests += 1
+        if delay > 0:
+            self.queued += 1
+        self.total += delay
+        self.max = max(self.max, delay)
+        self.last = delay
+
+
+class FleetScheduler:
+    """Spread the polls of all controllers over the interval and cap the requests in flight.
+
+    Every controller gets a phase, the fraction of the polling interval its
+    polls are aligned to, taken in the middle of the largest free gap so a
+    new controller never moves the others. Requests over the global cap wait
+    in one queue per controller and the queues are served round robin, so a
+    controller with many pending requests does not hold back the others.
+    """
+
+    def __init__(self, max_in_flight: int = FLEET_MAX_IN_FLIGHT) -> None:
+        """Initialize the scheduler."""
+        self._max_in_flight = max_in_flight
+        self._in_flight = 0
+        self._phases: dict[str, float] = {}
+        # Insertion order is the round robin order
+        self._waiting: dict[str, deque[asyncio.Future[None]]] = {}
+        self._delays: dict[str, QueueDelay] = {}
+
+    def register(self, controller: str) -> Callable[[], None]:
+        """Assign a phase to a controller, returns the callback unregistering it."""
+        if controller not in self._phases:
+            self._phases[controller] = self._free_phase()
+            self._delays[controller] = QueueDelay()
+
+        _LOGGER.debug(
+            "Polling %s at phase %.3f of the interval",
+            controller,
+            self._phases[controller],
+        )
+
+        def unregister() -> None:
+            self._phases.pop(controller, None)
+            self._delays.pop(controller, None)
+
+        return unregister
+
+    def phase(self, controller: str) -> float | None:
+        """Get the phase of a controller, None if not registered."""
+        return self._phases.get(controller)
+
+    def next_delay(self, controller: str, interval: float) -> float:
+        """Get the seconds until the next poll slot of a controller.
+
+        The slot is at least half an interval away, so a late poll does not
+        run twice in a row and an early one does not skip its slot.
+        """
+        phase = self._phases.get(controller)
+
+        if phase is None:
+            return interval
+
+        delay = (phase * interval - time.monotonic()) % interval
+
+        if delay < interval / 2:
+            delay += interval
+
+        return delay
+
+    def in_flight(self) -> int:
+        """Get the number of requests holding a slot."""
+        return self._in_flight
+
+    def stats(self, controller: str) -> dict[str, float]:
+        """Get the queueing delay of the requests of a controller for diagnostics."""
+        delay = self._delays.get(controller) or QueueDelay()
+
+        return {
+            "requests": delay.requests,
+            "queued": delay.queued,
+            "mean_delay": delay.total / delay.requests if delay.requests else 0.0,
+            "max_delay": delay.max,
+            "last_delay": delay.last,
+        }
+
+    @contextlib.asynccontextmanager
+    async def slot(self, controller: str) -> AsyncIterator[None]:
+        """Hold one of the global request slots, waiting in the queue of the controller."""
+        if self._in_flight < self._max_in_flight and not self._waiting:
+            self._in_flight += 1
+            delay = 0.0
+        else:
+            start = time.monotonic()
+            future = asyncio.get_running_loop().create_future()
+            self._waiting.setdefault(controller, deque()).append(future)
+
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.cancelled():
+                    self._discard(controller, future)
+                else:
+                    # The slot was handed over just before the cancellation
+                    self._release()
+                raise
+
+            delay = time.monotonic() - start
+
+        self._record_delay(controller, delay)
+
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _free_phase(self) -> float:
+        """Return the middle of the largest gap between the phases in use."""
+        phases = sorted(self._phases.values())
+
+        if not phases:
+            return 0.0
+
+        gaps = [
+            (end - start, start)
+            for start, end in zip(phases, [*phases[1:], phases[0] + 1])
+        ]
+        size, start = max(gaps, key=lambda gap: gap[0])
+
+        return (start + size / 2) % 1
+
+    def _release(self) -> None:
+        """Hand the slot to the next controller in turn, or free it."""
+        while self._waiting:
+            controller = next(iter(self._waiting))
+            queue = self._waiting.pop(controller)
+            future = queue.popleft()
+
+            if queue:
+                # Back at the end of the round
+                self._waiting[controller] = queue
+
+            if not future.done():
+                future.set_result(None)
+                return
+
+        self._in_flight -= 1
+
+    def _discard(self, controller: str, future: asyncio.Future[None]) -> None:
+        """Remove a cancelled waiter from the queue of its controller."""
+        queue = self._waiting.get(controller)
+
+        if queue is None:
+            return
+
+        with contextlib.suppress(ValueError):
+            queue.remove(future)
+
+        if not queue:
+            del self._waiting[controller]
+
+    def _record_delay(self, controller: str, delay: float) -> None:
+        delays = self._delays.get(controller)
+
+        if delays is not None:
+            delays.record(delay)
+
+        if delay >= FLEET_QUEUE_DELAY_WARNING:
+            _LOGGER.warning(
+                "Request to %s waited %.1f s for one of %d slots",
+                controller,
+                delay,
+                self._max_in_flight,
+            )
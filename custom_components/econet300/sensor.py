@@ -1,8 +1,9 @@
 """Sensor for Econet300."""
-from collections.abc import Callable
+
 from dataclasses import dataclass
 import logging
-from typing import Any
+import time
+from typing import Final
 from enum import StrEnum
 
 from homeassistant.components.sensor import (
@@ -29,20 +30,46 @@ from .const import (
     DOMAIN,
     OPERATION_MODE_NAMES,
     ECOSTER_MODE_NAMES,
+    LAMBDA_STATUS_NAMES,
     REG_PARAM_PRECICION,
     SERVICE_API,
     SERVICE_COORDINATOR,
 )
 from .entity import EconetEntity, MixerEntity, EcosterEntity
+from .transforms import (
+    ValueTransform,
+    bool_map,
+    compile_transforms,
+    enum_lookup,
+    round_to,
+    scale,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+TEMPERATURE_DEADBAND: Final = 0.2
+DEADBAND_MAX_SILENCE: Final = 900
+
 
 @dataclass
 class EconetSensorEntityDescription(SensorEntityDescription):
-    """Describes Econet sensor entity."""
+    """Describes Econet sensor entity.
+
+    The transform turning the raw value into the state is applied by the
+    coordinator for all sensors at once, None keeps the raw value.
+
+    A numeric sensor with a deadband publishes a new state only when its value
+    moved by at least the absolute deadband or the relative deadband (a
+    fraction of the last published value), whichever is larger. Smaller
+    changes are still published once max_silence seconds passed since the
+    last published state.
+    """
+
+    transform: ValueTransform | None = None
+    deadband: float | None = None
+    deadband_relative: float | None = None
+    max_silence: int | None = None
 
-    process_val: Callable[[Any], Any] = lambda x: x
 
 class UnitOfVolumeFlowRates(StrEnum):
     """Volume flow rate units."""
@@ -59,7 +86,7 @@ SENSOR_TYPES: tuple[EconetSensorEntityDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.POWER_FACTOR,
-        process_val=lambda x: round(x),
+        transform=round_to(),
     ),
     EconetSensorEntityDescription(
         key="tempCO",
@@ -70,7 +97,9 @@ SENSOR_TYPES: tuple[EconetSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
         suggested_display_precision=REG_PARAM_PRECICION["tempCO"],
-        process_val=lambda x: round(x, 1),
+        transform=round_to(1),
+        deadband=TEMPERATURE_DEADBAND,
+        max_silence=DEADBAND_MAX_SILENCE,
     ),
     EconetSensorEntityDescription(
         key="tempCOSet",
@@ -80,7 +109,7 @@ SENSOR_TYPES: tuple[EconetSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
-        process_val=lambda x: round(x, 2),
+        transform=round_to(2),
     ),
     EconetSensorEntityDescription(
         key="tempOpticalSensor",
@@ -91,7 +120,7 @@ SENSOR_TYPES: tuple[EconetSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.POWER_FACTOR,
         suggested_display_precision=0,
-        process_val=lambda x: round(x),
+        transform=round_to(),
     ),
     EconetSensorEntityDescription(
         key="tempFeeder",
@@ -102,7 +131,8 @@ SENSOR_TYPES: tuple[EconetSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
         suggested_display_precision=REG_PARAM_PRECICION["tempFeeder"],
-        process_val=lambda x: x,
+        deadband=TEMPERATURE_DEADBAND,
+        max_silence=DEADBAND_MAX_SILENCE,
     ),
     EconetSensorEntityDescription(
         key="tempFlueGas",
@@ -113,7 +143,8 @@ SENSOR_TYPES: tuple[EconetSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
         suggested_display_precision=REG_PARAM_PRECICION["tempFlueGas"],
-        process_val=lambda x: x,
+        deadband=TEMPERATURE_DEADBAND,
+        max_silence=DEADBAND_MAX_SILENCE,
     ),
     EconetSensorEntityDescription(
         key="tempBack",
@@ -123,7 +154,9 @@ SENSOR_TYPES: tuple[EconetSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
-        process_val=lambda x: round(x, 1),
+        transform=round_to(1),
+        deadband=TEMPERATURE_DEADBAND,
+        max_silence=DEADBAND_MAX_SILENCE,
     ),
     EconetSensorEntityDescription(
         key="tempCWU",
@@ -134,7 +167,9 @@ SENSOR_TYPES: tuple[EconetSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
         suggested_display_precision=REG_PARAM_PRECICION["tempCWU"],
-        process_val=lambda x: round(x, 1),
+        transform=round_to(1),
+        deadband=TEMPERATURE_DEADBAND,
+        max_silence=DEADBAND_MAX_SILENCE,
     ),
     EconetSensorEntityDescription(
         key="tempCWUSet",
@@ -145,7 +180,6 @@ SENSOR_TYPES: tuple[EconetSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
         suggested_display_precision=REG_PARAM_PRECICION["tempCWUSet"],
-        process_val=lambda x: x,
     ),
     EconetSensorEntityDescription(
         key="tempExternalSensor",
@@ -156,7 +190,8 @@ SENSOR_TYPES: tuple[EconetSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
         suggested_display_precision=REG_PARAM_PRECICION["tempExternalSensor"],
-        process_val=lambda x: x,
+        deadband=TEMPERATURE_DEADBAND,
+        max_silence=DEADBAND_MAX_SILENCE,
     ),
     EconetSensorEntityDescription(
         key="boilerPower",
@@ -167,7 +202,6 @@ SENSOR_TYPES: tuple[EconetSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.POWER_FACTOR,
         suggested_display_precision=REG_PARAM_PRECICION["boilerPower"],
-        process_val=lambda x: x,
     ),
     EconetSensorEntityDescription(
         key="boilerPowerKW",
@@ -178,7 +212,6 @@ SENSOR_TYPES: tuple[EconetSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.POWER,
         suggested_display_precision=REG_PARAM_PRECICION["boilerPowerKW"],
-        process_val=lambda x: x,
     ),
     EconetSensorEntityDescription(
         key="fuelLevel",
@@ -187,17 +220,17 @@ SENSOR_TYPES: tuple[EconetSensorEntityDescription, ...] = (
         icon="mdi:gas-station",
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
-        process_val=lambda x: round(x, 1),
+        transform=round_to(1),
     ),
     EconetSensorEntityDescription(
         key="fuelStream",
         translation_key="fuel_Stream",
         name="Fuel Stream",
         icon="mdi:gauge-low",
-        native_unit_of_measurement=UnitOfVolumeFlowRates.KILOGRAMM_PER_HOUR, # custom unit of measurement
+        native_unit_of_measurement=UnitOfVolumeFlowRates.KILOGRAMM_PER_HOUR,  # custom unit of measurement
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=REG_PARAM_PRECICION["fuelStream"],
-        process_val=lambda x: round(x, 1),
+        transform=round_to(1),
     ),
     EconetSensorEntityDescription(
         key="mode",
@@ -205,7 +238,7 @@ SENSOR_TYPES: tuple[EconetSensorEntityDescription, ...] = (
         name="Operation mode",
         icon="mdi:sync",
         device_class="DEVICE_CLASS_OPERATION_MODE",  # custom class for boiler status
-        process_val=lambda x: OPERATION_MODE_NAMES.get(x, "Unknown"),
+        transform=enum_lookup(OPERATION_MODE_NAMES),
     ),
     EconetSensorEntityDescription(
         key="lambdaSet",
@@ -214,7 +247,7 @@ SENSOR_TYPES: tuple[EconetSensorEntityDescription, ...] = (
         icon="mdi:lambda",
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
-        process_val=lambda x: x / 10,
+        transform=scale(10),
     ),
     EconetSensorEntityDescription(
         key="lambdaLevel",
@@ -223,25 +256,21 @@ SENSOR_TYPES: tuple[EconetSensorEntityDescription, ...] = (
         icon="mdi:lambda",
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
-        process_val=lambda x: x / 10,
+        transform=scale(10),
     ),
     EconetSensorEntityDescription(
         key="thermostat",
         translation_key="thermostat",
         name="Boiler thermostat",
         icon="mdi:thermostat",
-        process_val=lambda x: "ON"
-        if str(x).strip() == "1"
-        else ("OFF" if str(x).strip() == "0" else None),
+        transform=bool_map("ON", "OFF"),
     ),
     EconetSensorEntityDescription(
         key="lambdaStatus",
         translation_key="lambda_status",
         name="Lamda status",
         icon="mdi:lambda",
-        process_val=lambda x: "STOP"
-        if x == 0
-        else ("START" if x == 1 else ("Working" if x == 2 else "Unknown")),
+        transform=enum_lookup(LAMBDA_STATUS_NAMES),
     ),
     EconetSensorEntityDescription(
         key="tempUpperBuffer",
@@ -252,9 +281,8 @@ SENSOR_TYPES: tuple[EconetSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
         suggested_display_precision=REG_PARAM_PRECICION["tempUpperBuffer"],
-        process_val=lambda x: x,
     ),
-      EconetSensorEntityDescription(
+    EconetSensorEntityDescription(
         key="tempLowerBuffer",
         translation_key="temp_lower_buffer",
         name="Lower buffer temperature",
@@ -263,7 +291,6 @@ SENSOR_TYPES: tuple[EconetSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
         suggested_display_precision=REG_PARAM_PRECICION["tempLowerBuffer"],
-        process_val=lambda x: x,
     ),
     EconetSensorEntityDescription(
         key="signal",
@@ -350,6 +377,10 @@ SENSOR_TYPES: tuple[EconetSensorEntityDescription, ...] = (
 class EconetSensor(SensorEntity):
     """Econet Sensor."""
 
+    _last_published: float = 0.0
+    _published_available: bool | None = None
+    _published_stale = False
+
     def __init__(self, entity_description, name, unique_id):
         """Initialize the sensor."""
         super().__init__(name=name, unique_id=unique_id)
@@ -360,10 +391,51 @@ class EconetSensor(SensorEntity):
         """Sync state."""
         _LOGGER.debug("Update EconetSensor entity: %s", self.entity_description.name)
 
-        self._attr_native_value = self.entity_description.process_val(value)
+        native_value = self._coordinator.transformed.get(
+            self.entity_description.key, value
+        )
+
+        if not self._significant_change(native_value):
+            return
+
+        self._attr_native_value = native_value
+        self._last_published = time.monotonic()
+        self._published_available = self.available
+        self._published_stale = self.coordinator.stale
 
         self.async_write_ha_state()
 
+    def _significant_change(self, value) -> bool:
+        """Check if the value moved past the deadband of the sensor."""
+        desc = self.entity_description
+        last = self._attr_native_value
+
+        if desc.deadband is None and desc.deadband_relative is None:
+            return True
+
+        if (
+            self.available != self._published_available
+            or self.coordinator.stale != self._published_stale
+        ):
+            return True
+
+        if any(
+            not isinstance(val, (int, float)) or isinstance(val, bool)
+            for val in (value, last)
+        ):
+            return True
+
+        if (
+            desc.max_silence is not None
+            and time.monotonic() - self._last_published >= desc.max_silence
+        ):
+            return True
+
+        threshold = max(desc.deadband or 0, abs(last) * (desc.deadband_relative or 0))
+
+        return abs(value - last) >= threshold
+
+
 class ControllerSensor(EconetEntity, EconetSensor):
     """class controller."""
 
@@ -376,31 +448,34 @@ class ControllerSensor(EconetEntity, EconetSensor):
         """Initialize a new instance of the EconetSensor class."""
         super().__init__(description, coordinator, api)
 
+
 class MixerSensor(MixerEntity, EconetSensor):
     """Mixer sensor class."""
 
     def __init__(
-            self,
-            description: EconetSensorEntityDescription,
-            coordinator: EconetDataCoordinator,
-            api: Econet300Api,
-            idx: int,
-        ):
-            """Initialize a new instance of the EconetSensor class."""
-            super().__init__(description, coordinator, api, idx)
+        self,
+        description: EconetSensorEntityDescription,
+        coordinator: EconetDataCoordinator,
+        api: Econet300Api,
+        idx: int,
+    ):
+        """Initialize a new instance of the EconetSensor class."""
+        super().__init__(description, coordinator, api, idx)
+
 
 class EcosterSensor(EcosterEntity, EconetSensor):
     """Mixer sensor class."""
 
     def __init__(
-            self,
-            description: EconetSensorEntityDescription,
-            coordinator: EconetDataCoordinator,
-            api: Econet300Api,
-            idx: int,
-        ):
-            """Initialize a new instance of the EconetSensor class."""
-            super().__init__(description, coordinator, api, idx)
+        self,
+        description: EconetSensorEntityDescription,
+        coordinator: EconetDataCoordinator,
+        api: Econet300Api,
+        idx: int,
+    ):
+        """Initialize a new instance of the EconetSensor class."""
+        super().__init__(description, coordinator, api, idx)
+
 
 def can_add(desc: EconetSensorEntityDescription, coordinator: EconetDataCoordinator):
     """Check if it can add the key."""
@@ -425,6 +500,7 @@ def create_controller_sensors(coordinator: EconetDataCoordinator, api: Econet300
 
     return entities
 
+
 def create_mixer_sensors(coordinator: EconetDataCoordinator, api: Econet300Api):
     """Create individual sensor descriptions for mixer sensors."""
     entities = []
@@ -439,7 +515,8 @@ def create_mixer_sensors(coordinator: EconetDataCoordinator, api: Econet300Api):
             state_class=SensorStateClass.MEASUREMENT,
             device_class=SensorDeviceClass.TEMPERATURE,
             suggested_display_precision=0,
-            process_val=lambda x: x,
+            deadband=TEMPERATURE_DEADBAND,
+            max_silence=DEADBAND_MAX_SILENCE,
         )
         if can_add(description, coordinator):
             entities.append(MixerSensor(description, coordinator, api, i))
@@ -457,7 +534,6 @@ def create_mixer_sensors(coordinator: EconetDataCoordinator, api: Econet300Api):
             state_class=SensorStateClass.MEASUREMENT,
             device_class=SensorDeviceClass.TEMPERATURE,
             suggested_display_precision=0,
-            process_val=lambda x: x,
         )
 
         if can_add(description, coordinator) and can_add(description2, coordinator):
@@ -476,7 +552,6 @@ def create_mixer_sensors(coordinator: EconetDataCoordinator, api: Econet300Api):
         #     state_class=SensorStateClass.MEASUREMENT,
         #     device_class=SensorDeviceClass.POWER_FACTOR,
         #     suggested_display_precision=0,
-        #     process_val=lambda x: x,
         # )
 
         # if can_add(description, coordinator) and can_add(description3, coordinator):
@@ -488,6 +563,7 @@ def create_mixer_sensors(coordinator: EconetDataCoordinator, api: Econet300Api):
         #     )
     return entities
 
+
 def create_ecoster_sensors(coordinator: EconetDataCoordinator, api: Econet300Api):
     """Create individual sensor descriptions for ecoster sensors."""
     entities = []
@@ -502,7 +578,9 @@ def create_ecoster_sensors(coordinator: EconetDataCoordinator, api: Econet300Api
             state_class=SensorStateClass.MEASUREMENT,
             device_class=SensorDeviceClass.TEMPERATURE,
             suggested_display_precision=1,
-            process_val=lambda x: round(x, 1),
+            transform=round_to(1),
+            deadband=TEMPERATURE_DEADBAND,
+            max_silence=DEADBAND_MAX_SILENCE,
         )
         if can_add(description, coordinator):
             entities.append(EcosterSensor(description, coordinator, api, i))
@@ -520,7 +598,7 @@ def create_ecoster_sensors(coordinator: EconetDataCoordinator, api: Econet300Api
             state_class=SensorStateClass.MEASUREMENT,
             device_class=SensorDeviceClass.TEMPERATURE,
             suggested_display_precision=1,
-            process_val=lambda x: round(x, 1),
+            transform=round_to(1),
         )
 
         if can_add(description, coordinator) and can_add(description2, coordinator):
@@ -536,7 +614,7 @@ def create_ecoster_sensors(coordinator: EconetDataCoordinator, api: Econet300Api
             translation_key=f"ecoster_{i}_mode",
             icon="mdi:sync",
             device_class="DEVICE_CLASS_OPERATION_MODE",  # custom class for boiler status
-            process_val=lambda x: ECOSTER_MODE_NAMES.get(x, "Unknown"),
+            transform=enum_lookup(ECOSTER_MODE_NAMES),
         )
 
         if can_add(description, coordinator) and can_add(description3, coordinator):
@@ -548,6 +626,7 @@ def create_ecoster_sensors(coordinator: EconetDataCoordinator, api: Econet300Api
             )
     return entities
 
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -563,4 +642,8 @@ async def async_setup_entry(
     entities = entities + create_mixer_sensors(coordinator, api)
     entities = entities + create_ecoster_sensors(coordinator, api)
 
+    coordinator.async_add_transforms(
+        compile_transforms(entity.entity_description for entity in entities)
+    )
+
     return async_add_entities(entities)
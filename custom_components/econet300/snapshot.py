@@ -0,0 +1,121 @@
+"""Persisted snapshot of the coordinator data for warm starts."""
+
+from collections.abc import Mapping
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    SNAPSHOT_LAYER,
+    SNAPSHOT_MAX_AGE,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_STORE_VERSION,
+)
+from .registry import RegistryLayer, RegistrySnapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _SnapshotStore(Store[dict[str, Any]]):
+    """Store dropping snapshots of older versions."""
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: dict
+    ) -> dict[str, Any]:
+        """Return an empty snapshot, it is replaced by the first refresh anyway."""
+        return {}
+
+
+class EconetSnapshot:
+    """Last good data of both coordinator tiers, stored per config entry."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, uid: str):
+        """Initialize the snapshot store."""
+        self._store = _SnapshotStore(
+            hass, SNAPSHOT_STORE_VERSION, f"{DOMAIN}.{entry_id}.snapshot"
+        )
+        self._uid = uid
+        self._live_data: Mapping[str, Any] = {}
+        self._config_data: Mapping[str, Any] = {}
+        self._last_scheduled: float | None = None
+
+    async def async_load(self) -> tuple[RegistrySnapshot, RegistrySnapshot] | None:
+        """Load the (live, config) data, None if missing, outdated or of another controller."""
+        snapshot = await self._store.async_load()
+
+        if snapshot is None:
+            return None
+
+        if snapshot.get("uid") != self._uid:
+            _LOGGER.debug("Ignoring snapshot of another controller")
+            return None
+
+        age = time.time() - snapshot.get("saved_at", 0)
+
+        if age > SNAPSHOT_MAX_AGE:
+            _LOGGER.debug("Ignoring snapshot saved %d s ago", age)
+            return None
+
+        return _load_layers(snapshot["live"]), _load_layers(snapshot["config"])
+
+    @callback
+    def async_schedule_save(
+        self, live_data: Mapping[str, Any], config_data: Mapping[str, Any]
+    ) -> None:
+        """Save the data after a delay, at most once per delay."""
+        self._live_data = live_data
+        self._config_data = config_data
+        now = time.monotonic()
+
+        # The pending save writes the latest data, rescheduling it would only
+        # postpone it as the store restarts its delay on every call.
+        if (
+            self._last_scheduled is not None
+            and now - self._last_scheduled < SNAPSHOT_SAVE_DELAY
+        ):
+            return
+
+        self._last_scheduled = now
+        self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Remove the snapshot from disk."""
+        await self._store.async_remove()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "uid": self._uid,
+            "saved_at": time.time(),
+            # Copies the registry layers, only when actually writing
+            "live": _dump_layers(self._live_data),
+            "config": _dump_layers(self._config_data),
+        }
+
+
+def _dump_layers(data: Mapping[str, Any]) -> list[dict[str, Any]]:
+    """Return the layers of the data, field layers with their full records, e.g. the editParams limits."""
+    if not isinstance(data, RegistrySnapshot):
+        data = RegistrySnapshot.of(SNAPSHOT_LAYER, data)
+
+    return [
+        {
+            "name": layer.name,
+            "data": dict(layer.data),
+            "field": layer.field,
+            "overlay": layer.overlay,
+        }
+        for layer in data.layers()
+    ]
+
+
+def _load_layers(layers: list[dict[str, Any]]) -> RegistrySnapshot:
+    """Return the snapshot of the saved layers."""
+    return RegistrySnapshot(
+        RegistryLayer(layer["name"], layer["data"], layer["field"], layer["overlay"])
+        for layer in layers
+    )
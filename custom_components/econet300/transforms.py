@@ -0,0 +1,117 @@
+"""Value transforms applied by the coordinator in one pass per refresh."""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+TRANSFORM_ROUND = "round"
+TRANSFORM_SCALE = "scale"
+TRANSFORM_ENUM = "enum"
+TRANSFORM_BOOL = "bool"
+
+
+@dataclass(frozen=True)
+class ValueTransform:
+    """Typed operation turning a raw controller value into the entity state."""
+
+    op: str
+    arg: Any = None
+    default: Any = None
+    # Compared by op and arg only, so equal transforms of one key do not clash
+    mapping: Mapping[Any, Any] = field(default_factory=dict, compare=False)
+
+
+def round_to(digits: int | None = None) -> ValueTransform:
+    """Round to the given number of digits, to an int without digits."""
+    return ValueTransform(TRANSFORM_ROUND, digits)
+
+
+def scale(divisor: float) -> ValueTransform:
+    """Divide the raw value, e.g. by 10 for values sent in tenths."""
+    return ValueTransform(TRANSFORM_SCALE, divisor)
+
+
+def enum_lookup(names: Mapping[Any, Any], default: Any = "Unknown") -> ValueTransform:
+    """Look the raw value up in a table of names."""
+    return ValueTransform(TRANSFORM_ENUM, id(names), default, names)
+
+
+def bool_map(on: Any, off: Any) -> ValueTransform:
+    """Map a raw 1/0 value (int or padded string) to on/off, anything else to None."""
+    return ValueTransform(TRANSFORM_BOOL, (on, off), None, {"1": on, "0": off})
+
+
+class TransformTable:
+    """Transforms of all keys, grouped by operation to apply them in batches."""
+
+    def __init__(self, transforms: Mapping[str, ValueTransform]) -> None:
+        """Compile the key -> transform mapping."""
+        self._transforms = dict(transforms)
+        self._rounds = self._group(TRANSFORM_ROUND, lambda t: t.arg)
+        self._scales = self._group(TRANSFORM_SCALE, lambda t: t.arg)
+        self._lookups = self._group(TRANSFORM_ENUM, lambda t: (t.mapping, t.default))
+        self._bools = self._group(TRANSFORM_BOOL, lambda t: t.mapping)
+
+    def __contains__(self, key: str) -> bool:
+        """Check if the key has a transform."""
+        return key in self._transforms
+
+    def keys(self):
+        """Return the keys with a transform."""
+        return self._transforms.keys()
+
+    def merge(self, transforms: Mapping[str, ValueTransform]) -> "TransformTable":
+        """Return a table with the given transforms added."""
+        return TransformTable({**self._transforms, **transforms})
+
+    def apply(
+        self, data: Mapping[str, Any], keys: Iterable[str] | None = None
+    ) -> dict[str, Any]:
+        """Transform the values of the given keys, all of them if None, present in data."""
+        selected = self._transforms.keys() if keys is None else set(keys)
+        values: dict[str, Any] = {}
+
+        for key, digits in self._rounds:
+            if key in selected and key in data:
+                value = data[key]
+                values[key] = None if value is None else round(value, digits)
+
+        for key, divisor in self._scales:
+            if key in selected and key in data:
+                value = data[key]
+                values[key] = None if value is None else value / divisor
+
+        for key, (names, default) in self._lookups:
+            if key in selected and key in data:
+                values[key] = names.get(data[key], default)
+
+        for key, states in self._bools:
+            if key in selected and key in data:
+                values[key] = states.get(str(data[key]).strip())
+
+        return values
+
+    def _group(self, op: str, arg) -> list[tuple[str, Any]]:
+        return [
+            (key, arg(transform))
+            for key, transform in self._transforms.items()
+            if transform.op == op
+        ]
+
+
+def compile_transforms(descriptions: Iterable[Any]) -> dict[str, ValueTransform]:
+    """Collect the transforms of entity descriptions, keyed by data key."""
+    transforms: dict[str, ValueTransform] = {}
+
+    for description in descriptions:
+        transform = getattr(description, "transform", None)
+
+        if transform is None:
+            continue
+
+        if transforms.get(description.key, transform) != transform:
+            raise ValueError(f"Conflicting transforms for key: {description.key}")
+
+        transforms[description.key] = transform
+
+    return transforms
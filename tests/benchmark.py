@@ -0,0 +1,506 @@
+"""Offline benchmarks of the polling path against the fake ecoNET-300 server.
+
+Run from the repository root with:
+
+    python -m tests.benchmark --polls 50 --latency 0.05 --jitter 0.02
+
+Numbers are only comparable between runs on the same machine.
+"""
+
+import argparse
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+import contextlib
+import json
+import multiprocessing
+from multiprocessing.connection import Connection
+import statistics
+import sys
+import time
+from unittest import mock
+
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from custom_components.econet300 import api as api_module
+from custom_components.econet300.api import Econet300Api, EconetClient
+from custom_components.econet300.common import EconetCoordinator
+from custom_components.econet300.const import (
+    API_EDIT_PARAMS_DATA,
+    API_EDIT_PARAMS_URI,
+    API_FETCH_MAX_CONCURRENCY,
+    API_JSON_EXECUTOR_THRESHOLD,
+    API_REG_PARAMS_URI,
+    API_SYS_PARAMS_URI,
+    FLEET_MAX_IN_FLIGHT,
+)
+from custom_components.econet300.entity import (
+    DEVICE_KIND_CONTROLLER,
+    DEVICE_KIND_ECOSTER,
+    DEVICE_KIND_MIXER,
+    _build_device_info,
+    device_info,
+)
+from custom_components.econet300.mem_cache import MemCache
+from custom_components.econet300.scheduler import FleetScheduler
+
+from .common import FIXTURES_DIR, fixture_names, load_fixture
+from .fake_server import FakeEconetServer
+
+BENCHMARKS: dict[str, Callable[[argparse.Namespace], Awaitable[None]]] = {}
+
+
+def benchmark(func):
+    """Register a benchmark under the name of its function."""
+    BENCHMARKS[func.__name__.removeprefix("bench_")] = func
+    return func
+
+
+def report(name: str, samples: list[float], unit: str = "ms") -> None:
+    """Print the summary of a list of samples given in seconds."""
+    scale = 1000 if unit == "ms" else 1_000_000
+    samples = sorted(sample * scale for sample in samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    print(
+        f"  {name:<32} n={len(samples):<6} "
+        f"mean={statistics.fmean(samples):9.3f} {unit}  "
+        f"median={statistics.median(samples):9.3f} {unit}  "
+        f"p95={p95:9.3f} {unit}"
+    )
+
+
+class FixtureClient:
+    """In-memory client decoding the recorded responses, to time parsing alone."""
+
+    def __init__(self) -> None:
+        """Load the recorded responses."""
+        self._payloads = {
+            name: json.dumps(load_fixture(name)) for name in fixture_names()
+        }
+
+    def host(self):
+        """Get the host."""
+        return "fixture"
+
+    async def get_params(self, reg: str):
+        """Get parameters for a given registry."""
+        if reg not in self._payloads:
+            return None
+
+        return json.loads(self._payloads[reg])
+
+
+def _serve(count: int, kwargs: dict, conn: Connection) -> None:
+    """Serve fake controllers until anything is received on the connection."""
+
+    async def serve() -> None:
+        servers = [FakeEconetServer(**kwargs) for _ in range(count)]
+        for server in servers:
+            await server.start()
+
+        conn.send([server.host for server in servers])
+        await asyncio.get_running_loop().run_in_executor(None, conn.recv)
+
+        for server in servers:
+            await server.stop()
+
+    asyncio.run(serve())
+
+
+@contextlib.asynccontextmanager
+async def servers_in_process(count: int, **kwargs) -> AsyncIterator[list[str]]:
+    """Run fake servers in another process, so they do not add to the measured loop lag.
+
+    Yields the hosts of the servers.
+    """
+    conn, child_conn = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=_serve, args=(count, kwargs, child_conn))
+    process.start()
+
+    try:
+        yield await asyncio.get_running_loop().run_in_executor(None, conn.recv)
+    finally:
+        conn.send(None)
+        await asyncio.get_running_loop().run_in_executor(None, process.join)
+
+
+async def measure_loop_lag(
+    workload: Awaitable[None], interval: float = 0.001
+) -> tuple[list[float], float]:
+    """Run the workload while sampling how late the event loop wakes up a sleeper.
+
+    Returns the lags and the elapsed time in seconds.
+    """
+    lags = []
+    done = False
+
+    async def sample() -> None:
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            lags.append(time.perf_counter() - start - interval)
+
+    sampler = asyncio.create_task(sample())
+    start = time.perf_counter()
+    try:
+        await workload
+    finally:
+        elapsed = time.perf_counter() - start
+        done = True
+        await sampler
+
+    return lags, elapsed
+
+
+def make_coordinator() -> EconetCoordinator:
+    """Return a coordinator usable for change tracking without a running hass.
+
+    Only the DataUpdateCoordinator setup is skipped, the state of the
+    coordinator itself comes from its real __init__.
+    """
+    with mock.patch.object(DataUpdateCoordinator, "__init__", return_value=None):
+        coordinator = EconetCoordinator()
+
+    coordinator.name = "benchmark"
+    coordinator.data = None
+    coordinator.last_update_success = True
+    return coordinator
+
+
+@benchmark
+async def bench_fetch_data(args: argparse.Namespace) -> None:
+    """Time a full fetch_data poll and count the bytes it transferred."""
+    async with FakeEconetServer(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        mutation=args.mutate,
+        version_bump_rate=args.version_bump_rate,
+        seed=args.seed,
+    ) as server:
+        for versioned in (False, True):
+            client = EconetClient(server.host, "admin", "admin")
+            api = Econet300Api(client, MemCache(), versioned_refresh=versioned)
+            samples = []
+            failures = 0
+            server.reset_stats()
+
+            try:
+                for _ in range(args.polls):
+                    start = time.perf_counter()
+                    try:
+                        await api.fetch_data()
+                    except Exception:  # noqa: BLE001
+                        failures += 1
+                        continue
+                    samples.append(time.perf_counter() - start)
+            finally:
+                await api.close()
+
+            name = "fetch_data (versioned)" if versioned else "fetch_data"
+            if samples:
+                report(name, samples)
+            print(
+                f"  {'':<32} failures={failures} "
+                f"requests={sum(server.requests.values())} "
+                f"bytes/poll={sum(server.bytes_sent.values()) / args.polls:,.0f} "
+                f"max in flight={server.max_in_flight}"
+            )
+            for reg, sent in sorted(server.bytes_sent.items()):
+                print(f"  {'':<34}{reg:<28} {sent / args.polls:>10,.0f} B/poll")
+            cache = api.cache_stats()
+            print(
+                f"  {'':<32} cache hits={cache['hits']} misses={cache['misses']} "
+                f"evictions={cache['evictions']} expirations={cache['expirations']}"
+            )
+
+
+@benchmark
+async def bench_parse(args: argparse.Namespace) -> None:
+    """Time JSON decoding of every fixture and the registry post-processing."""
+    for name in fixture_names():
+        text = json.dumps(load_fixture(name))
+        samples = []
+        for _ in range(args.iterations):
+            start = time.perf_counter()
+            json.loads(text)
+            samples.append(time.perf_counter() - start)
+        report(f"json.loads {name} ({len(text):,} B)", samples, "us")
+
+    api = Econet300Api(FixtureClient(), MemCache(), versioned_refresh=False)
+
+    for reg, data_key in (
+        (API_REG_PARAMS_URI, None),
+        (API_SYS_PARAMS_URI, None),
+        (API_EDIT_PARAMS_URI, API_EDIT_PARAMS_DATA),
+    ):
+        samples = []
+        for _ in range(args.iterations):
+            start = time.perf_counter()
+            data = await api._fetch_reg_key(reg, data_key)  # noqa: SLF001
+            samples.append(time.perf_counter() - start)
+        report(f"_fetch_reg_key {reg}", samples, "us")
+        print(f"  {'':<32} kept={len(json.dumps(data)):,} B keys={len(data)}")
+
+    samples = []
+    for _ in range(args.iterations):
+        start = time.perf_counter()
+        await api.fetch_data()
+        samples.append(time.perf_counter() - start)
+    report("fetch_data (in memory)", samples, "us")
+
+
+@benchmark
+async def bench_fan_out(args: argparse.Namespace) -> None:
+    """Count how many keys, and so entity updates, every poll fans out to.
+
+    Every key gets a listener standing in for one entity.
+    """
+    async with FakeEconetServer(
+        mutation=args.mutate or 0.05,
+        version_bump_rate=args.version_bump_rate,
+        seed=args.seed,
+    ) as server:
+        client = EconetClient(server.host, "admin", "admin")
+        api = Econet300Api(client, MemCache())
+        coordinator = make_coordinator()
+        changed: list[int] = []
+        called: list[int] = []
+        samples = []
+        dispatch_samples = []
+
+        def listener() -> None:
+            called[-1] += 1
+
+        try:
+            for _ in range(args.polls):
+                data = await api.fetch_data()
+
+                if coordinator.data is None:
+                    for key in data:
+                        coordinator._key_listeners[key] = {  # noqa: SLF001
+                            lambda: listener(): None
+                        }
+
+                start = time.perf_counter()
+                coordinator.data = coordinator._track_changes(data)  # noqa: SLF001
+                samples.append(time.perf_counter() - start)
+
+                called.append(0)
+                start = time.perf_counter()
+                coordinator._dispatch_key_listeners()  # noqa: SLF001
+                dispatch_samples.append(time.perf_counter() - start)
+
+                if coordinator.changed_keys is not None:
+                    changed.append(len(coordinator.changed_keys))
+        finally:
+            await api.close()
+
+    report("change tracking", samples, "us")
+    report("key dispatch", dispatch_samples[1:] or dispatch_samples, "us")
+    if changed:
+        print(
+            f"  {'':<32} keys={len(data)} "
+            f"changed/poll mean={statistics.fmean(changed):.1f} max={max(changed)} "
+            f"listeners called/poll mean={statistics.fmean(called[1:]):.1f}"
+        )
+
+
+@benchmark
+async def bench_device_info(args: argparse.Namespace) -> None:
+    """Time the device info and unique id accesses of one write across ~150 entities."""
+    api = Econet300Api(FixtureClient(), MemCache())
+    await api.init()
+    entities = [(DEVICE_KIND_CONTROLLER, None, f"key{n}") for n in range(90)] + [
+        (kind, idx, f"key{kind}{idx}{n}")
+        for kind in (DEVICE_KIND_MIXER, DEVICE_KIND_ECOSTER)
+        for idx in (1, 2, 3)
+        for n in range(10)
+    ]
+    unique_ids = [f"{api.uid()}-{key}" for _, _, key in entities]
+
+    samples = []
+    for _ in range(args.iterations):
+        start = time.perf_counter()
+        for kind, idx, key in entities:
+            _build_device_info(api, kind, idx)
+            f"{api.uid()}-{key}"  # noqa: B018
+        samples.append(time.perf_counter() - start)
+    report(f"rebuilt ({len(entities)} entities)", samples, "us")
+
+    samples = []
+    for _ in range(args.iterations):
+        start = time.perf_counter()
+        for (kind, idx, _), unique_id in zip(entities, unique_ids, strict=True):
+            device_info(api, kind, idx)
+            unique_id  # noqa: B018
+        samples.append(time.perf_counter() - start)
+    report(f"cached ({len(entities)} entities)", samples, "us")
+
+
+@benchmark
+async def bench_loop_lag(args: argparse.Namespace) -> None:
+    """Measure the event loop lag of JSON decoding by decoder and executor threshold.
+
+    First decoding the recorded payloads alone, then polling several fake
+    controllers served by another process.
+    """
+    decoders = {"json": json.loads}
+    with contextlib.suppress(ImportError):
+        import orjson  # noqa: PLC0415
+
+        decoders["orjson"] = orjson.loads
+
+    modes = [
+        (decoder, loads, threshold)
+        for decoder, loads in decoders.items()
+        for threshold in (sys.maxsize, API_JSON_EXECUTOR_THRESHOLD)
+    ]
+    bodies = [
+        (FIXTURES_DIR / f"{name}.json").read_bytes()
+        for name in (API_SYS_PARAMS_URI, API_EDIT_PARAMS_URI, API_REG_PARAMS_URI)
+    ]
+
+    def mode_name(decoder: str, threshold: int) -> str:
+        if threshold == sys.maxsize:
+            return f"{decoder}, inline"
+        return f"{decoder}, >= {threshold} B in executor"
+
+    print(f"  decoding {', '.join(f'{len(body):,} B' for body in bodies)}:")
+    for decoder, loads, threshold in modes:
+        client = EconetClient("fixture", "admin", "admin", executor_threshold=threshold)
+
+        async def decode(client: EconetClient) -> None:
+            for _ in range(args.iterations):
+                for body in bodies:
+                    await client._decode(body)  # noqa: SLF001
+                    # Lets the sampler run between payloads, like network waits
+                    await asyncio.sleep(0.002)
+
+        with mock.patch.object(api_module, "json_loads", loads):
+            lags, elapsed = await measure_loop_lag(decode(client))
+
+        report(mode_name(decoder, threshold), lags)
+        print(f"  {'':<32} max lag={max(lags) * 1000:.3f} ms in {elapsed:.2f} s")
+
+    async with servers_in_process(
+        args.controllers, latency=args.latency, jitter=args.jitter, seed=args.seed
+    ) as hosts:
+        print(f"  polling {args.controllers} controllers:")
+        for decoder, loads, threshold in modes:
+            apis = [
+                Econet300Api(
+                    EconetClient(host, "admin", "admin", executor_threshold=threshold),
+                    MemCache(),
+                    versioned_refresh=False,
+                )
+                for host in hosts
+            ]
+
+            async def poll(api: Econet300Api) -> None:
+                for _ in range(args.polls):
+                    await api.fetch_data()
+
+            try:
+                with mock.patch.object(api_module, "json_loads", loads):
+                    lags, elapsed = await measure_loop_lag(
+                        asyncio.gather(*(poll(api) for api in apis))
+                    )
+            finally:
+                for api in apis:
+                    await api.close()
+
+            report(mode_name(decoder, threshold), lags)
+            print(
+                f"  {'':<32} max lag={max(lags) * 1000:.3f} ms "
+                f"polls={args.controllers * args.polls} in {elapsed:.2f} s"
+            )
+
+
+@benchmark
+async def bench_fleet(args: argparse.Namespace) -> None:
+    """Poll several controllers at once through a shared scheduler by in-flight cap.
+
+    Every round starts all polls together, the worst case staggering avoids,
+    and reports the queueing delay of each controller.
+    """
+    async with servers_in_process(
+        args.controllers, latency=args.latency, jitter=args.jitter, seed=args.seed
+    ) as hosts:
+        uncapped = args.controllers * API_FETCH_MAX_CONCURRENCY
+        for cap in sorted({uncapped, FLEET_MAX_IN_FLIGHT, 2}, reverse=True):
+            scheduler = FleetScheduler(cap)
+            apis = [
+                Econet300Api(
+                    EconetClient(host, "admin", "admin"),
+                    MemCache(),
+                    versioned_refresh=False,
+                    scheduler=scheduler,
+                )
+                for host in hosts
+            ]
+            for api in apis:
+                scheduler.register(api.host())
+
+            samples: list[float] = []
+
+            async def poll(api: Econet300Api, samples: list[float]) -> None:
+                start = time.perf_counter()
+                await api.fetch_data()
+                samples.append(time.perf_counter() - start)
+
+            try:
+                for _ in range(args.polls):
+                    await asyncio.gather(*(poll(api, samples) for api in apis))
+            finally:
+                for api in apis:
+                    await api.close()
+
+            report(f"fetch_data, {cap} in flight", samples)
+            delays = [scheduler.stats(api.host()) for api in apis]
+            means = [delay["mean_delay"] * 1000 for delay in delays]
+            print(
+                f"  {'':<32} queueing delay per controller: "
+                f"mean {min(means):.3f}..{max(means):.3f} ms "
+                f"max={max(delay['max_delay'] for delay in delays) * 1000:.3f} ms"
+            )
+
+    scheduler = FleetScheduler()
+    for idx in range(args.controllers):
+        scheduler.register(f"controller {idx}")
+    phases = sorted(
+        scheduler.phase(f"controller {idx}") for idx in range(args.controllers)
+    )
+    print(f"  phases: {', '.join(f'{phase:.3f}' for phase in phases)}")
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run the selected benchmarks."""
+    for name in args.benchmarks or BENCHMARKS:
+        print(f"{name}:")
+        await BENCHMARKS[name](args)
+
+
+def main() -> None:
+    """Parse the command line and run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("benchmarks", nargs="*", help=", ".join(BENCHMARKS))
+    parser.add_argument("--polls", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--controllers", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--mutate", type=float, default=0.0, help="noise std dev")
+    parser.add_argument("--version-bump-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    for name in args.benchmarks:
+        if name not in BENCHMARKS:
+            parser.error(f"unknown benchmark: {name}")
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
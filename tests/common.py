@@ -1 +1,37 @@
 """Common helpers contains helper functions."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import json
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+FIXTURES_DIR = Path(__file__).parent / "JSON response"
+
+
+def load_fixture(name: str) -> dict[str, Any]:
+    """Load the recorded ecoNET-300 JSON response of a registry, e.g. regParams."""
+    return json.loads((FIXTURES_DIR / f"{name}.json").read_text(encoding="utf-8"))
+
+
+def fixture_names() -> list[str]:
+    """Return the names of all recorded endpoints."""
+    return sorted(path.stem for path in FIXTURES_DIR.glob("*.json"))
+
+
+def run_with_hass(
+    test: Callable[[HomeAssistant], Awaitable[None]], config_dir: Path
+) -> None:
+    """Run a test coroutine with a Home Assistant instance, stopped afterwards."""
+
+    async def main() -> None:
+        hass = HomeAssistant(str(config_dir))
+
+        try:
+            await test(hass)
+        finally:
+            await hass.async_stop(force=True)
+
+    asyncio.run(main())
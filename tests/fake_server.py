@@ -0,0 +1,192 @@
+"""Local stand-in for the ecoNET-300 web server built from the recorded responses."""
+
+import asyncio
+from collections import Counter
+import copy
+import json
+import random
+from typing import Any
+
+from aiohttp import web
+
+from custom_components.econet300.const import (
+    API_CURRENT_DATA_PARAMS_EDITS_URI,
+    API_EDIT_PARAMS_URI,
+    API_REG_PARAMS_URI,
+    API_SYS_PARAMS_URI,
+    CURRENT_DATA_PARAMS_EDITS_MAPPING_TABLE,
+    VERSIONED_REFRESH_VERSION_KEYS,
+)
+
+from .common import fixture_names, load_fixture
+
+
+class FakeEconetServer:
+    """Serve the recorded /econet/<registry> responses with configurable behaviour.
+
+    latency and jitter are in seconds, error_rate is the probability of a
+    500 response, mutation is the standard deviation of the noise added to
+    every float in regParams and version_bump_rate the probability that a
+    regParams request bumps editableParamsVer and settingsVer.
+
+    Like the controller, a write updates editParams and
+    rmCurrentDataParamsEdits and bumps their version counters in regParams.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        mutation: float = 0.0,
+        version_bump_rate: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the server with the recorded payloads."""
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.mutation = mutation
+        self.version_bump_rate = version_bump_rate
+        self.payloads: dict[str, Any] = {
+            name: load_fixture(name) for name in fixture_names()
+        }
+        self.requests: Counter[str] = Counter()
+        self.bytes_sent: Counter[str] = Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._random = random.Random(seed)
+        self._runner: web.AppRunner | None = None
+        self._port = 0
+
+    @property
+    def host(self) -> str:
+        """Return the host to pass to EconetClient."""
+        return f"127.0.0.1:{self._port}"
+
+    async def start(self) -> None:
+        """Start listening on a free local port."""
+        app = web.Application()
+        app.router.add_get("/econet/newParam", self._handle_new_param)
+        app.router.add_get("/econet/{reg}", self._handle_registry)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self._port = site._server.sockets[0].getsockname()[1]  # noqa: SLF001
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self):
+        """Start the server in an async with block."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Stop the server at the end of an async with block."""
+        await self.stop()
+
+    def reset_stats(self) -> None:
+        """Clear the request and byte counters."""
+        self.requests.clear()
+        self.bytes_sent.clear()
+        self.max_in_flight = 0
+
+    async def _respond(self, name: str, payload: Any) -> web.Response:
+        """Answer after the simulated latency, failing with the error rate."""
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            delay = self.latency + self._random.uniform(-self.jitter, self.jitter)
+            await asyncio.sleep(max(0.0, delay))
+
+            if self._random.random() < self.error_rate:
+                body = "Internal error"
+                status = 500
+            else:
+                body = json.dumps(payload)
+                status = 200
+
+            self.requests[name] += 1
+            self.bytes_sent[name] += len(body)
+
+            return web.Response(
+                text=body, status=status, content_type="application/json"
+            )
+        finally:
+            self.in_flight -= 1
+
+    async def _handle_registry(self, request: web.Request) -> web.Response:
+        reg = request.match_info["reg"]
+
+        if reg not in self.payloads:
+            return web.Response(status=404)
+
+        if reg == "regParams":
+            return await self._respond(reg, self._mutate_reg_params())
+
+        return await self._respond(reg, self.payloads[reg])
+
+    async def _handle_new_param(self, request: web.Request) -> web.Response:
+        name = request.query.get("newParamName")
+
+        try:
+            value = float(request.query["newParamValue"])
+        except (KeyError, ValueError):
+            return web.Response(status=400, text="Missing or invalid newParamValue")
+
+        reg_params = self.payloads[API_REG_PARAMS_URI]
+        edit_params = self.payloads[API_EDIT_PARAMS_URI]
+
+        if name in edit_params["data"]:
+            edit_params["data"][name]["value"] = value
+            reg_params[VERSIONED_REFRESH_VERSION_KEYS[API_EDIT_PARAMS_URI]] += 1
+
+        current_edits = self.payloads.get(API_CURRENT_DATA_PARAMS_EDITS_URI)
+        if current_edits is not None:
+            for param_id, key in CURRENT_DATA_PARAMS_EDITS_MAPPING_TABLE.items():
+                if key == name and param_id in current_edits["data"]:
+                    current_edits["data"][param_id]["value"] = value
+                    reg_params[
+                        VERSIONED_REFRESH_VERSION_KEYS[
+                            API_CURRENT_DATA_PARAMS_EDITS_URI
+                        ]
+                    ] += 1
+
+        self._sync_versions()
+
+        return await self._respond("newParam", {"result": "OK"})
+
+    def _sync_versions(self) -> None:
+        """Copy the version counters of regParams into the registries they version."""
+        reg_params = self.payloads[API_REG_PARAMS_URI]
+
+        for reg, version_key in VERSIONED_REFRESH_VERSION_KEYS.items():
+            if reg in self.payloads and version_key in reg_params:
+                self.payloads[reg][version_key] = reg_params[version_key]
+
+    def _mutate_reg_params(self) -> dict[str, Any]:
+        """Return regParams with noisy live values and possibly bumped versions."""
+        reg_params = self.payloads[API_REG_PARAMS_URI]
+
+        if self._random.random() < self.version_bump_rate:
+            reg_params[VERSIONED_REFRESH_VERSION_KEYS[API_EDIT_PARAMS_URI]] += 1
+            reg_params[VERSIONED_REFRESH_VERSION_KEYS[API_SYS_PARAMS_URI]] += 1
+
+        # Versions of the other registries follow regParams
+        self._sync_versions()
+
+        if not self.mutation:
+            return reg_params
+
+        mutated = copy.deepcopy(reg_params)
+        for key, value in mutated["curr"].items():
+            if isinstance(value, float):
+                mutated["curr"][key] = value + self._random.gauss(0, self.mutation)
+
+        return mutated
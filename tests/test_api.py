@@ -0,0 +1,230 @@
+"""Tests of the api against the fake ecoNET-300 server."""
+
+import asyncio
+from unittest import mock
+
+import aiohttp
+import pytest
+
+from custom_components.econet300.api import (
+    CircuitBreaker,
+    CircuitOpenError,
+    Econet300Api,
+    EconetClient,
+)
+from custom_components.econet300.const import (
+    API_CURRENT_DATA_PARAMS_EDITS_URI,
+    API_EDIT_PARAMS_URI,
+    API_REG_PARAMS_URI,
+    API_RETRY_MAX_ATTEMPTS,
+    API_SYS_PARAMS_URI,
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+)
+from custom_components.econet300.mem_cache import MemCache
+
+from .fake_server import FakeEconetServer
+
+
+def test_config_registries_are_fetched_once_per_version():
+    """The config registries are only fetched again after their version moved."""
+
+    async def main() -> None:
+        async with FakeEconetServer() as server:
+            api = Econet300Api(EconetClient(server.host, "admin", "admin"), MemCache())
+
+            try:
+                await api.fetch_data()
+                await api.fetch_data()
+                assert server.requests[API_REG_PARAMS_URI] == 2
+                assert server.requests[API_SYS_PARAMS_URI] == 1
+                assert server.requests[API_EDIT_PARAMS_URI] == 1
+                assert server.requests[API_CURRENT_DATA_PARAMS_EDITS_URI] == 1
+
+                # The write bumps the versions of editParams and the current edits
+                assert await api.set_param("CO_TEMP_SET", 70)
+                data = await api.fetch_data()
+                assert data["CO_TEMP_SET"] == 70
+                assert server.requests[API_SYS_PARAMS_URI] == 1
+                assert server.requests[API_EDIT_PARAMS_URI] == 2
+                assert server.requests[API_CURRENT_DATA_PARAMS_EDITS_URI] == 2
+            finally:
+                await api.close()
+
+    asyncio.run(main())
+
+
+def test_unversioned_refresh_fetches_every_registry():
+    """Without versioned refresh every poll fetches sysParams and editParams."""
+
+    async def main() -> None:
+        async with FakeEconetServer() as server:
+            client = EconetClient(server.host, "admin", "admin")
+            api = Econet300Api(client, MemCache(), versioned_refresh=False)
+
+            try:
+                await api.fetch_data()
+                await api.fetch_data()
+            finally:
+                await api.close()
+
+            assert server.requests[API_SYS_PARAMS_URI] == 2
+            assert server.requests[API_EDIT_PARAMS_URI] == 2
+
+    asyncio.run(main())
+
+
+def test_config_outdated_after_a_version_bump():
+    """A registry version without a cached copy marks the config data outdated."""
+
+    async def main() -> None:
+        async with FakeEconetServer() as server:
+            api = Econet300Api(EconetClient(server.host, "admin", "admin"), MemCache())
+
+            try:
+                await api.fetch_data()
+                assert not api.config_outdated()
+
+                assert await api.set_param("CO_TEMP_SET", 70)
+                await api.fetch_reg_params()
+                assert api.config_outdated()
+
+                await api.fetch_config_data()
+                assert not api.config_outdated()
+            finally:
+                await api.close()
+
+    asyncio.run(main())
+
+
+def test_circuit_breaker_opens_and_half_opens():
+    """After the reset timeout one trial request decides the circuit state."""
+    with mock.patch("custom_components.econet300.api.time.monotonic") as now:
+        now.return_value = 0.0
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+        breaker.record_failure()
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state() == CircuitBreaker.OPEN
+        assert not breaker.allow_request()
+
+        now.return_value = 61.0
+        assert breaker.allow_request()
+        assert breaker.state() == CircuitBreaker.HALF_OPEN
+        assert breaker.is_open()
+
+        # A failed trial opens the circuit again for a full timeout
+        breaker.record_failure()
+        assert breaker.state() == CircuitBreaker.OPEN
+        now.return_value = 100.0
+        assert not breaker.allow_request()
+
+        now.return_value = 122.0
+        assert breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state() == CircuitBreaker.CLOSED
+        assert not breaker.is_open()
+
+
+def test_server_errors_open_the_circuit():
+    """A controller answering with 500 counts as failing, not as reachable."""
+
+    async def main() -> None:
+        async with FakeEconetServer(error_rate=1.0) as server:
+            client = EconetClient(server.host, "admin", "admin")
+
+            try:
+                for _ in range(CIRCUIT_BREAKER_FAILURE_THRESHOLD):
+                    assert await client.get_params(API_REG_PARAMS_URI) is None
+
+                assert client.circuit_breaker().state() == CircuitBreaker.OPEN
+
+                with pytest.raises(CircuitOpenError):
+                    await client.get_params(API_REG_PARAMS_URI)
+            finally:
+                await client.close()
+
+    asyncio.run(main())
+
+
+@mock.patch("custom_components.econet300.api.API_RETRY_BASE_DELAY", 0)
+def test_broken_responses_are_retried():
+    """A response broken off mid body is retried and fails the request once."""
+    client = EconetClient("127.0.0.1", "admin", "admin")
+    session = mock.MagicMock()
+    session.get = mock.AsyncMock(side_effect=aiohttp.ClientPayloadError())
+
+    with mock.patch.object(client, "_get_session", return_value=session):
+        assert asyncio.run(client.get_params(API_REG_PARAMS_URI)) is None
+
+    assert session.get.await_count == API_RETRY_MAX_ATTEMPTS
+    assert client.circuit_breaker().state() == CircuitBreaker.CLOSED
+
+
+def make_write_api() -> tuple[Econet300Api, list[tuple[str, str]]]:
+    """Return an api with a client recording the writes it sends."""
+    sent: list[tuple[str, str]] = []
+
+    async def set_param(key, value):
+        sent.append((key, value))
+        return {"result": "OK"}
+
+    client = mock.MagicMock(set_param=set_param, close=mock.AsyncMock())
+
+    return Econet300Api(client, MemCache()), sent
+
+
+@mock.patch("custom_components.econet300.api.API_WRITE_DEBOUNCE", 0.01)
+def test_queued_writes_are_coalesced():
+    """Writes to a queued param share one request with the last value."""
+
+    async def run():
+        api, sent = make_write_api()
+        results = await asyncio.gather(
+            api.set_param("CO_TEMP_SET", 60),
+            api.set_param("CWU_SET_TEMP", 50),
+            api.set_param("CO_TEMP_SET", 65.0),
+            api.set_param("unknown", 1),
+        )
+        return results, sent
+
+    results, sent = asyncio.run(run())
+
+    assert results == [True, True, True, False]
+    assert sent == [("CO_TEMP_SET", "65"), ("CWU_SET_TEMP", "50")]
+
+
+def test_close_sends_the_queued_writes():
+    """Closing the api sends the queued writes without waiting for the debounce."""
+
+    async def run():
+        api, sent = make_write_api()
+        write = api.enqueue_param("CO_TEMP_SET", 70)
+        await api.close()
+        return write.result(), sent
+
+    assert asyncio.run(run()) == (True, [("CO_TEMP_SET", "70")])
+
+
+def test_current_edits_limits_replace_edit_params_limits():
+    """The limits of the current edits overlay win over the editParams ones."""
+
+    async def main():
+        async with FakeEconetServer() as server:
+            current = server.payloads[API_CURRENT_DATA_PARAMS_EDITS_URI]["data"]
+            current["1280"].update(value=62, min=50, max=90)
+            api = Econet300Api(EconetClient(server.host, "admin", "admin"), MemCache())
+
+            try:
+                data = await api.fetch_data()
+            finally:
+                await api.close()
+
+        return data, api.param_limits("CO_TEMP_SET"), api.param_limits("FUEL_KG_H")
+
+    data, limits, fallback = asyncio.run(main())
+
+    assert data["CO_TEMP_SET"] == 62
+    assert (limits.minv, limits.maxv, limits.step) == (50, 90, None)
+    # Without a current edit, editParams limits and a fractional mult as step
+    assert (fallback.minv, fallback.maxv, fallback.step) == (0.1, 25.0, 0.1)
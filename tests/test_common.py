@@ -0,0 +1,348 @@
+"""Tests of the coordinators."""
+
+import asyncio
+from datetime import timedelta
+import time
+from unittest import mock
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+
+from custom_components.econet300.api import CircuitBreaker, Econet300Api
+from custom_components.econet300.common import (
+    EconetConfigCoordinator,
+    EconetDataCoordinator,
+)
+from custom_components.econet300.const import (
+    UPDATE_INTERVAL,
+    UPDATE_INTERVAL_FAST,
+    UPDATE_INTERVAL_FAST_AFTER_WRITE,
+    UPDATE_INTERVAL_SLOW,
+)
+from custom_components.econet300.mem_cache import MemCache
+from custom_components.econet300.registry import RegistryLayer, RegistrySnapshot
+from custom_components.econet300.transforms import round_to
+
+from .common import run_with_hass
+
+
+def make_coordinators(
+    hass: HomeAssistant, api=None
+) -> tuple[EconetDataCoordinator, EconetConfigCoordinator]:
+    """Return the live and config coordinators of an api."""
+    api = api or mock.MagicMock()
+    config = EconetConfigCoordinator(hass, api)
+    coordinator = EconetDataCoordinator(hass, api, config)
+
+    return coordinator, config
+
+
+def make_api() -> Econet300Api:
+    """Return an api whose writes succeed."""
+    client = mock.MagicMock(set_param=mock.AsyncMock(return_value={"result": "OK"}))
+    client.circuit_breaker.return_value = CircuitBreaker()
+
+    return Econet300Api(client, MemCache())
+
+
+def record(value: int, minv: int = 0, maxv: int = 90) -> dict:
+    """Return an editParams record."""
+    return {"value": value, "minv": minv, "maxv": maxv}
+
+
+async def refresh(
+    api: Econet300Api,
+    coordinator: EconetDataCoordinator,
+    config: EconetConfigCoordinator,
+    live: dict,
+    edit_params: dict,
+) -> None:
+    """Refresh both tiers with the given regParams and editParams data."""
+    with (
+        mock.patch.object(
+            api,
+            "fetch_reg_params",
+            mock.AsyncMock(return_value=RegistrySnapshot.of("regParams", live)),
+        ),
+        mock.patch.object(
+            api,
+            "fetch_config_data",
+            mock.AsyncMock(
+                return_value=RegistrySnapshot(
+                    (RegistryLayer("editParams", edit_params, "value"),)
+                )
+            ),
+        ),
+    ):
+        await config.async_refresh()
+        await coordinator.async_refresh()
+
+
+def test_config_changes_reach_live_tier_listeners(tmp_path):
+    """Live tier entities watching a config key are called when it changed."""
+
+    async def test(hass: HomeAssistant) -> None:
+        coordinator, config = make_coordinators(hass)
+        coordinator.async_set_updated_data(
+            RegistrySnapshot.of("regParams", {"mode": 1})
+        )
+        config.async_set_updated_data(
+            RegistrySnapshot.of("editParams", {"STER_TEMP_DAY_1": 21, "other": 1})
+        )
+
+        watching = mock.Mock()
+        other = mock.Mock()
+        coordinator.async_add_listener(watching, frozenset({"mode", "STER_TEMP_DAY_1"}))
+        coordinator.async_add_listener(other, frozenset({"mode"}))
+
+        config.async_merge_data({"STER_TEMP_DAY_1": 22})
+
+        assert coordinator.data["STER_TEMP_DAY_1"] == 22
+        watching.assert_called_once()
+        other.assert_not_called()
+
+    run_with_hass(test, tmp_path)
+
+
+def test_restored_snapshot_restores_the_limits(tmp_path):
+    """Numbers keep the editParams limits of a restored snapshot until the first refresh."""
+
+    async def test(hass: HomeAssistant) -> None:
+        api = Econet300Api(mock.MagicMock(), MemCache())
+        coordinator, config = make_coordinators(hass, api)
+        edit_params = {
+            "CO_TEMP_SET": {"value": 65, "minv": 60, "maxv": 85, "mult": 1.0}
+        }
+
+        coordinator.async_restore_snapshot(
+            RegistrySnapshot.of("regParams", {"mode": 1}),
+            RegistrySnapshot((RegistryLayer("editParams", edit_params, "value"),)),
+        )
+
+        assert coordinator.stale and config.stale
+        assert coordinator.data["CO_TEMP_SET"] == 65
+        limits = api.param_limits("CO_TEMP_SET")
+        assert (limits.minv, limits.maxv) == (60, 85)
+
+    run_with_hass(test, tmp_path)
+
+
+@mock.patch("custom_components.econet300.api.API_WRITE_DEBOUNCE", 0)
+def test_write_through_updates_the_tier_of_each_key(tmp_path):
+    """A write shows at once in the live key of the entity and in its editParams key."""
+
+    async def test(hass: HomeAssistant) -> None:
+        api = make_api()
+        coordinator, config = make_coordinators(hass, api)
+        await refresh(
+            api,
+            coordinator,
+            config,
+            {"mode": 0, "tempCO": 50},
+            {"BOILER_CONTROL": record(0)},
+        )
+        switch = mock.Mock()
+        other = mock.Mock()
+        coordinator.async_add_listener(switch, frozenset({"mode"}))
+        coordinator.async_add_listener(other, frozenset({"tempCO"}))
+
+        assert await api.set_param("mode", 1)
+
+        assert coordinator.data["mode"] == 1
+        assert config.data["BOILER_CONTROL"] == 1
+        assert config.data.layer("editParams")["BOILER_CONTROL"] == record(1)
+        switch.assert_called_once()
+        other.assert_not_called()
+
+        # Not reverted by the config tier merged in again before the next poll
+        config.async_merge_data({"BOILER_CONTROL": 1})
+        assert coordinator.data["mode"] == 1
+
+        await coordinator.async_shutdown()
+
+    run_with_hass(test, tmp_path)
+
+
+@mock.patch("custom_components.econet300.api.API_WRITE_DEBOUNCE", 0)
+@mock.patch("custom_components.econet300.common.API_WRITE_CONFIRM_DELAY", 0)
+def test_written_setpoint_is_confirmed_from_the_current_edits(tmp_path):
+    """The confirm read replaces the written value with the one the controller kept."""
+
+    async def test(hass: HomeAssistant) -> None:
+        api = make_api()
+        coordinator, config = make_coordinators(hass, api)
+        await refresh(
+            api, coordinator, config, {"mode": 3}, {"CO_TEMP_SET": record(60)}
+        )
+        current_edits = RegistrySnapshot(
+            (
+                RegistryLayer(
+                    "rmCurrentDataParamsEdits",
+                    {"CO_TEMP_SET": {"value": 85, "min": 60, "max": 85}},
+                    "value",
+                    True,
+                ),
+            )
+        )
+
+        with (
+            mock.patch.object(
+                api, "fetch_current_edits", mock.AsyncMock(return_value=current_edits)
+            ),
+            mock.patch.object(api, "fetch_edit_params") as fetch_edit_params,
+        ):
+            assert await api.set_param("CO_TEMP_SET", 90)
+            assert coordinator.data["CO_TEMP_SET"] == 90
+
+            await asyncio.sleep(0)
+            await hass.async_block_till_done()
+
+        assert config.data["CO_TEMP_SET"] == 85
+        assert coordinator.data["CO_TEMP_SET"] == 85
+        fetch_edit_params.assert_not_called()
+
+    run_with_hass(test, tmp_path)
+
+
+@mock.patch("custom_components.econet300.api.API_WRITE_DEBOUNCE", 0)
+@mock.patch("custom_components.econet300.common.API_WRITE_CONFIRM_DELAY", 0)
+def test_failed_confirm_read_keeps_the_written_value(tmp_path):
+    """A connection error of the confirm read is left to the next poll."""
+
+    async def test(hass: HomeAssistant) -> None:
+        api = make_api()
+        coordinator, config = make_coordinators(hass, api)
+        await refresh(
+            api, coordinator, config, {"mode": 3}, {"CWU_SET_TEMP": record(50)}
+        )
+        failure = mock.AsyncMock(side_effect=aiohttp.ServerDisconnectedError())
+
+        with (
+            mock.patch.object(api, "fetch_current_edits", failure),
+            mock.patch.object(api, "fetch_edit_params", failure),
+            mock.patch.object(hass, "async_create_task") as create_task,
+        ):
+            assert await api.set_param("CWU_SET_TEMP", 55)
+            await asyncio.sleep(0)
+            await create_task.call_args.args[0]
+
+        assert failure.await_count == 1
+        assert coordinator.data["CWU_SET_TEMP"] == 55
+
+    run_with_hass(test, tmp_path)
+
+
+@mock.patch("custom_components.econet300.api.API_WRITE_DEBOUNCE", 0)
+def test_shutdown_stops_listening_to_writes(tmp_path):
+    """A coordinator shut down on unload is not called by the api any more."""
+
+    async def test(hass: HomeAssistant) -> None:
+        api = make_api()
+        coordinator, _ = make_coordinators(hass, api)
+        await coordinator.async_shutdown()
+
+        assert await api.set_param("CO_TEMP_SET", 60)
+
+        # Not switched to fast polling by the write
+        assert coordinator.update_interval == timedelta(seconds=UPDATE_INTERVAL)
+
+    run_with_hass(test, tmp_path)
+
+
+def test_shutdown_stops_listening_to_the_config_tier(tmp_path):
+    """The config coordinator keeps no listener of a coordinator shut down on unload."""
+
+    async def test(hass: HomeAssistant) -> None:
+        api = make_api()
+        coordinator, config = make_coordinators(hass, api)
+        await refresh(
+            api, coordinator, config, {"mode": 3}, {"CO_TEMP_SET": record(60)}
+        )
+        await coordinator.async_shutdown()
+
+        await refresh(
+            api, coordinator, config, {"mode": 3}, {"CO_TEMP_SET": record(61)}
+        )
+
+        assert config.data["CO_TEMP_SET"] == 61
+        assert coordinator.data["CO_TEMP_SET"] == 60
+
+    run_with_hass(test, tmp_path)
+
+
+def test_transformed_values_follow_the_data(tmp_path):
+    """A transformed value is dropped when its key leaves the data."""
+
+    async def test(hass: HomeAssistant) -> None:
+        api = make_api()
+        coordinator, config = make_coordinators(hass, api)
+        await refresh(api, coordinator, config, {"tempCO": 55.55, "tempCWU": 40.04}, {})
+        coordinator.async_add_transforms(
+            {"tempCO": round_to(1), "tempCWU": round_to(1)}
+        )
+
+        assert coordinator.transformed == {"tempCO": 55.5, "tempCWU": 40.0}
+
+        await refresh(api, coordinator, config, {"tempCWU": 41.06}, {})
+        assert coordinator.transformed == {"tempCWU": 41.1}
+
+        coordinator.async_restore_snapshot(
+            RegistrySnapshot.of("regParams", {"tempCO": 50.01}), RegistrySnapshot()
+        )
+        assert coordinator.transformed == {"tempCO": 50.0}
+
+    run_with_hass(test, tmp_path)
+
+
+def test_polling_follows_the_operation_mode(tmp_path):
+    """Active modes poll fast, a steady idle mode slow and a mode change normally."""
+
+    async def test(hass: HomeAssistant) -> None:
+        api = make_api()
+        coordinator, config = make_coordinators(hass, api)
+
+        async def interval(live: dict) -> int:
+            await refresh(api, coordinator, config, live, {})
+            return coordinator.update_interval.total_seconds()
+
+        assert await interval({"mode": 3}) == UPDATE_INTERVAL_FAST
+        # The controller refresh hint is a lower bound of the fast interval
+        assert await interval({"mode": 8, "regRefresh": 30}) == 30
+        assert await interval({"mode": 2, "regRefresh": 5}) == UPDATE_INTERVAL_FAST
+
+        assert await interval({"mode": 4}) == UPDATE_INTERVAL
+        assert await interval({"mode": 4}) == UPDATE_INTERVAL_SLOW
+        assert await interval({"mode": 0}) == UPDATE_INTERVAL
+        assert await interval({"mode": 0}) == UPDATE_INTERVAL_SLOW
+
+        await coordinator.async_shutdown()
+
+    run_with_hass(test, tmp_path)
+
+
+def test_polling_is_fast_after_a_write(tmp_path):
+    """A write switches to fast polling until the write is long enough ago."""
+
+    async def test(hass: HomeAssistant) -> None:
+        api = make_api()
+        coordinator, config = make_coordinators(hass, api)
+        await refresh(api, coordinator, config, {"mode": 0}, {})
+        await refresh(api, coordinator, config, {"mode": 0}, {})
+        assert coordinator.update_interval == timedelta(seconds=UPDATE_INTERVAL_SLOW)
+
+        assert await api.set_param("CO_TEMP_SET", 60)
+        assert coordinator.update_interval == timedelta(seconds=UPDATE_INTERVAL_FAST)
+
+        await refresh(api, coordinator, config, {"mode": 0}, {})
+        assert coordinator.update_interval == timedelta(seconds=UPDATE_INTERVAL_FAST)
+
+        later = time.monotonic() + UPDATE_INTERVAL_FAST_AFTER_WRITE
+        with mock.patch("custom_components.econet300.common.time") as clock:
+            clock.monotonic.return_value = later
+            await refresh(api, coordinator, config, {"mode": 0}, {})
+
+        assert coordinator.update_interval == timedelta(seconds=UPDATE_INTERVAL_SLOW)
+
+        await coordinator.async_shutdown()
+
+    run_with_hass(test, tmp_path)
@@ -0,0 +1,41 @@
+"""Tests of the shared entity helpers."""
+
+from unittest import mock
+
+from custom_components.econet300.api import Econet300Api
+from custom_components.econet300.entity import (
+    DEVICE_KIND_CONTROLLER,
+    DEVICE_KIND_MIXER,
+    device_info,
+    forget_device_info,
+)
+
+
+def make_api(host: str = "http://10.0.0.2", sw_rev: str = "3.2.3879") -> Econet300Api:
+    """Return an api with the given identity."""
+    api = mock.Mock(spec=Econet300Api)
+    api.uid.return_value = "uid"
+    api.host.return_value = host
+    api.sw_rev.return_value = sw_rev
+    api.hw_ver.return_value = "hw"
+    api.model_id.return_value = "ecoMAX"
+
+    return api
+
+
+def test_device_info_is_shared_until_the_identity_changes():
+    """Entities of a device share one DeviceInfo, rebuilt when e.g. the host changed."""
+    api = make_api()
+    info = device_info(api, DEVICE_KIND_CONTROLLER)
+
+    assert device_info(api, DEVICE_KIND_CONTROLLER) is info
+    assert device_info(api, DEVICE_KIND_MIXER, 1) is not info
+
+    api.host.return_value = "http://10.0.0.3"
+    moved = device_info(api, DEVICE_KIND_CONTROLLER)
+
+    assert moved["configuration_url"] == "http://10.0.0.3"
+    assert moved["sw_version"] == "3.2.3879"
+
+    forget_device_info(api)
+    assert device_info(api, DEVICE_KIND_CONTROLLER) is not moved
@@ -0,0 +1,67 @@
+"""Tests of the memory cache."""
+
+import asyncio
+from unittest import mock
+
+from custom_components.econet300.mem_cache import MemCache
+
+
+def test_least_recently_used_entry_is_evicted():
+    """A read keeps an entry, the oldest unread one is evicted."""
+    cache = MemCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_expired_entries_are_missed_and_swept():
+    """Entries expire after their duration and the sweep drops them."""
+    with mock.patch("custom_components.econet300.mem_cache.time.monotonic") as now:
+        now.return_value = 100.0
+        cache = MemCache(sweep_interval=60)
+        cache.set("short", 1, duration=5)
+        cache.set("long", 2, duration=50)
+
+        now.return_value = 110.0
+        assert cache.get("short", "missing") == "missing"
+        assert cache.get("long") == 2
+
+        now.return_value = 200.0
+        assert cache.sweep() == 1
+        assert len(cache) == 0
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["expirations"]) == (1, 1, 2)
+
+
+def test_exists_checks_the_entry_not_the_value():
+    """A cached None exists, an expired entry does not."""
+    with mock.patch("custom_components.econet300.mem_cache.time.monotonic") as now:
+        now.return_value = 0.0
+        cache = MemCache()
+        cache.set("none", None, duration=10)
+
+        assert cache.exists("none")
+        assert not cache.exists("missing")
+
+        now.return_value = 10.0
+        assert not cache.exists("none")
+
+
+def test_get_or_fetch_fetches_misses_only():
+    """A hit is served from the cache, a miss is fetched and cached, also when None."""
+    fetch = mock.AsyncMock(return_value=None)
+
+    async def run(cache: MemCache) -> list:
+        return [await cache.get_or_fetch("key", fetch, 10) for _ in range(2)]
+
+    cache = MemCache()
+
+    assert asyncio.run(run(cache)) == [None, None]
+    assert fetch.await_count == 1
+    assert cache.stats()["hits"] == 1
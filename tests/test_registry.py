@@ -0,0 +1,88 @@
+"""Tests of the layered registry snapshot."""
+
+from custom_components.econet300.registry import RegistryLayer, RegistrySnapshot
+
+
+def edit_params(value: int, minv: int = 40, maxv: int = 80) -> dict:
+    """Return an editParams record."""
+    return {"value": value, "minv": minv, "maxv": maxv}
+
+
+def current_edit(value: int, low: int = 40, high: int = 80) -> dict:
+    """Return a rmCurrentDataParamsEdits record."""
+    return {"value": value, "min": low, "max": high}
+
+
+def snapshot(reg: dict, edits: dict, current: dict | None = None) -> RegistrySnapshot:
+    """Build a snapshot layered like the one fetched from the controller."""
+    layers = [
+        RegistryLayer("regParams", reg),
+        RegistryLayer("editParams", edits, "value"),
+    ]
+
+    if current is not None:
+        layers.append(RegistryLayer("rmCurrentDataParamsEdits", current, "value", True))
+
+    return RegistrySnapshot(layers)
+
+
+def test_lookup_takes_the_top_layer():
+    """A key of several layers takes the value of the last one."""
+    data = snapshot(
+        {"tempCO": 55.5},
+        {"CO_TEMP_SET": edit_params(60)},
+        {"CO_TEMP_SET": current_edit(65)},
+    )
+
+    assert data["tempCO"] == 55.5
+    assert data["CO_TEMP_SET"] == 65
+    assert len(data) == 2
+    assert data.collisions() == {}
+
+
+def test_changed_keys_reports_values():
+    """Only keys with a new value, new keys and removed keys are reported."""
+    old = snapshot({"tempCO": 55.5, "fanPower": 10}, {"CO_TEMP_SET": edit_params(60)})
+    new = snapshot({"tempCO": 56.0, "mode": 2}, {"CO_TEMP_SET": edit_params(60)})
+
+    assert new.changed_keys(old) == {"tempCO", "fanPower", "mode"}
+    assert new.changed_keys(new) == set()
+
+
+def test_changed_keys_reports_limits():
+    """A changed record is reported even if its value is the same."""
+    old = snapshot({}, {"CO_TEMP_SET": edit_params(60)})
+    new = snapshot({}, {"CO_TEMP_SET": edit_params(60, maxv=75)})
+
+    assert new.changed_keys(old) == {"CO_TEMP_SET"}
+
+
+def test_changed_keys_reports_overlay_limits():
+    """A change of the overlay limits is reported, values of both layers unchanged."""
+    edits = {"CO_TEMP_SET": edit_params(60)}
+    old = snapshot({}, edits, {"CO_TEMP_SET": current_edit(60)})
+    new = snapshot({}, edits, {"CO_TEMP_SET": current_edit(60, low=50)})
+
+    assert new.changed_keys(old) == {"CO_TEMP_SET"}
+
+
+def test_changed_keys_compares_the_effective_value():
+    """Swapping which layer holds the same value is not a change."""
+    old = snapshot({"CO_TEMP_SET": 60}, {})
+    new = RegistrySnapshot(
+        [RegistryLayer("regParams", {}), RegistryLayer("other", {"CO_TEMP_SET": 60})]
+    )
+
+    assert new.changed_keys(old) == set()
+    assert new.changed_keys({"CO_TEMP_SET": 61}) == {"CO_TEMP_SET"}
+
+
+def test_with_values_keeps_the_records():
+    """Replaced values keep the rest of their record and the old snapshot."""
+    old = snapshot({"tempCO": 55.5}, {"CO_TEMP_SET": edit_params(60)})
+    new = old.with_values({"CO_TEMP_SET": 62})
+
+    assert new["CO_TEMP_SET"] == 62
+    assert new.layer("editParams")["CO_TEMP_SET"] == edit_params(62)
+    assert old["CO_TEMP_SET"] == 60
+    assert new.changed_keys(old) == {"CO_TEMP_SET"}
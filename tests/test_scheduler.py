@@ -0,0 +1,96 @@
+"""Tests of the fleet poll scheduler."""
+
+import asyncio
+
+from custom_components.econet300.scheduler import FleetScheduler
+
+
+async def _queue(scheduler: FleetScheduler, order: list[str], controller: str) -> None:
+    async with scheduler.slot(controller):
+        order.append(controller)
+
+
+def test_phases_fill_the_largest_gap():
+    """New controllers take the middle of the largest free gap."""
+    scheduler = FleetScheduler()
+
+    for host in ("a", "b", "c"):
+        scheduler.register(host)
+
+    assert scheduler.phase("a") == 0.0
+    assert scheduler.phase("b") == 0.5
+    assert scheduler.phase("c") == 0.25
+
+
+def test_unregister_frees_the_phase():
+    """An unregistered controller has no phase and polls at the interval."""
+    scheduler = FleetScheduler()
+    unregister = scheduler.register("a")
+    unregister()
+
+    assert scheduler.phase("a") is None
+    assert scheduler.next_delay("a", 30) == 30
+
+
+def test_waiting_controllers_are_served_round_robin():
+    """A controller with many queued requests does not hold back the others."""
+
+    async def run() -> list[str]:
+        scheduler = FleetScheduler(max_in_flight=1)
+        order: list[str] = []
+
+        async with scheduler.slot("busy"):
+            tasks = [
+                asyncio.create_task(_queue(scheduler, order, host))
+                for host in ("busy", "busy", "busy", "idle")
+            ]
+            await asyncio.sleep(0)
+            assert scheduler.in_flight() == 1
+
+        await asyncio.gather(*tasks)
+        assert scheduler.in_flight() == 0
+        return order
+
+    assert asyncio.run(run()) == ["busy", "idle", "busy", "busy"]
+
+
+def test_cancelled_waiter_gives_up_its_turn():
+    """A request cancelled while waiting is removed from the queue."""
+
+    async def run() -> list[str]:
+        scheduler = FleetScheduler(max_in_flight=1)
+        order: list[str] = []
+
+        async with scheduler.slot("a"):
+            cancelled = asyncio.create_task(_queue(scheduler, order, "b"))
+            waiting = asyncio.create_task(_queue(scheduler, order, "c"))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            await asyncio.sleep(0)
+
+        await waiting
+        assert cancelled.cancelled()
+        assert scheduler.in_flight() == 0
+        return order
+
+    assert asyncio.run(run()) == ["c"]
+
+
+def test_queue_delay_stats():
+    """Only requests that waited for a slot count as queued."""
+
+    async def run(scheduler: FleetScheduler) -> None:
+        async with scheduler.slot("a"):
+            waiting = asyncio.create_task(_queue(scheduler, [], "a"))
+            await asyncio.sleep(0.01)
+
+        await waiting
+
+    scheduler = FleetScheduler(max_in_flight=1)
+    scheduler.register("a")
+    asyncio.run(run(scheduler))
+    stats = scheduler.stats("a")
+
+    assert stats["requests"] == 2
+    assert stats["queued"] == 1
+    assert stats["max_delay"] > 0
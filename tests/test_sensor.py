@@ -0,0 +1,91 @@
+"""Tests of the sensors."""
+
+import time
+from unittest import mock
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.econet300.sensor import (
+    ControllerSensor,
+    EconetSensorEntityDescription,
+)
+
+from .common import run_with_hass
+from .test_common import make_api, make_coordinators, refresh
+
+
+def test_deadband_filters_small_changes(tmp_path):
+    """A change below the deadband is published only after max_silence seconds."""
+
+    async def test(hass: HomeAssistant) -> None:
+        api = make_api()
+        coordinator, config = make_coordinators(hass, api)
+
+        async def publish(live: dict) -> float:
+            await refresh(api, coordinator, config, live, {})
+            return sensor.native_value
+
+        await refresh(api, coordinator, config, {"tempCO": 50.0}, {})
+        sensor = ControllerSensor(
+            EconetSensorEntityDescription(
+                key="tempCO", name="tempCO", deadband=0.5, max_silence=600
+            ),
+            coordinator,
+            api,
+        )
+        sensor.hass = hass
+
+        with mock.patch.object(sensor, "async_write_ha_state") as write:
+            await sensor.async_added_to_hass()
+
+            assert await publish({"tempCO": 50.3}) == 50.0
+            assert await publish({"tempCO": 49.6}) == 50.0
+            assert await publish({"tempCO": 50.5}) == 50.5
+            assert write.call_count == 2
+
+            later = time.monotonic() + 600
+            with mock.patch("custom_components.econet300.sensor.time") as clock:
+                clock.monotonic.return_value = later
+                assert await publish({"tempCO": 50.6}) == 50.6
+
+        await coordinator.async_shutdown()
+
+    run_with_hass(test, tmp_path)
+
+
+def test_relative_deadband_scales_with_the_value(tmp_path):
+    """The relative deadband applies when larger than the absolute one."""
+
+    async def test(hass: HomeAssistant) -> None:
+        api = make_api()
+        coordinator, config = make_coordinators(hass, api)
+
+        async def publish(value: float) -> float:
+            await refresh(api, coordinator, config, {"fuelStream": value}, {})
+            return sensor.native_value
+
+        await refresh(api, coordinator, config, {"fuelStream": 20.0}, {})
+        sensor = ControllerSensor(
+            EconetSensorEntityDescription(
+                key="fuelStream",
+                name="fuelStream",
+                deadband=0.5,
+                deadband_relative=0.1,
+            ),
+            coordinator,
+            api,
+        )
+        sensor.hass = hass
+
+        with mock.patch.object(sensor, "async_write_ha_state"):
+            await sensor.async_added_to_hass()
+
+            assert await publish(21.5) == 20.0
+            assert await publish(22.0) == 22.0
+            assert await publish(2.0) == 2.0
+            assert await publish(2.4) == 2.0
+            assert await publish(2.5) == 2.5
+
+        await coordinator.async_shutdown()
+
+    run_with_hass(test, tmp_path)
@@ -0,0 +1,75 @@
+"""Tests of the warm start snapshot."""
+
+import time
+from unittest import mock
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from custom_components.econet300.const import DOMAIN, SNAPSHOT_MAX_AGE
+from custom_components.econet300.registry import RegistryLayer, RegistrySnapshot
+from custom_components.econet300.snapshot import EconetSnapshot
+
+from .common import run_with_hass
+
+LIVE = RegistrySnapshot.of("regParams", {"tempCO": 55.5, "mode": 1})
+CONFIG = RegistrySnapshot(
+    (
+        RegistryLayer("sysParams", {"uid": "uid"}),
+        RegistryLayer(
+            "editParams",
+            {"CO_TEMP_SET": {"value": 65, "minv": 60, "maxv": 85, "mult": 1.0}},
+            "value",
+        ),
+    )
+)
+
+
+async def save(hass: HomeAssistant, snapshot: EconetSnapshot) -> None:
+    """Save the snapshot at once instead of after the save delay."""
+    snapshot.async_schedule_save(LIVE, CONFIG)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+
+
+def test_snapshot_keeps_the_registry_layers(tmp_path):
+    """A loaded snapshot has the saved values and the full editParams records."""
+
+    async def test(hass: HomeAssistant) -> None:
+        await save(hass, EconetSnapshot(hass, "entry", "uid"))
+        live, config = await EconetSnapshot(hass, "entry", "uid").async_load()
+
+        assert dict(live) == dict(LIVE)
+        assert config["CO_TEMP_SET"] == 65
+        assert config.layer("editParams") == CONFIG.layer("editParams")
+
+    run_with_hass(test, tmp_path)
+
+
+def test_snapshot_of_another_controller_or_too_old_is_ignored(tmp_path):
+    """Only a recent snapshot of the same controller is loaded."""
+
+    async def test(hass: HomeAssistant) -> None:
+        await save(hass, EconetSnapshot(hass, "entry", "uid"))
+
+        assert await EconetSnapshot(hass, "entry", "other").async_load() is None
+
+        with mock.patch("custom_components.econet300.snapshot.time.time") as now:
+            now.return_value = 10**10 + SNAPSHOT_MAX_AGE
+            assert await EconetSnapshot(hass, "entry", "uid").async_load() is None
+
+    run_with_hass(test, tmp_path)
+
+
+def test_snapshot_of_an_older_version_is_ignored(tmp_path):
+    """A snapshot with flattened values would restore numbers without limits."""
+
+    async def test(hass: HomeAssistant) -> None:
+        await Store(hass, 1, f"{DOMAIN}.entry.snapshot").async_save(
+            {"uid": "uid", "saved_at": time.time(), "live": {}, "config": {}}
+        )
+
+        assert await EconetSnapshot(hass, "entry", "uid").async_load() is None
+
+    run_with_hass(test, tmp_path)
@@ -0,0 +1,68 @@
+"""Tests of the value transforms."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.econet300.transforms import (
+    TransformTable,
+    bool_map,
+    compile_transforms,
+    enum_lookup,
+    round_to,
+    scale,
+)
+
+
+def test_apply_transforms_present_keys():
+    """Every key is transformed by its operation, missing keys are skipped."""
+    table = TransformTable(
+        {
+            "tempCO": round_to(1),
+            "fuelLevel": round_to(),
+            "power": scale(10),
+            "mode": enum_lookup({1: "on"}),
+            "pump": bool_map(True, False),
+            "missing": round_to(),
+        }
+    )
+
+    values = table.apply(
+        {"tempCO": 55.55, "fuelLevel": 42.7, "power": 125, "mode": 3, "pump": " 1"}
+    )
+
+    assert values == {
+        "tempCO": 55.5,
+        "fuelLevel": 43,
+        "power": 12.5,
+        "mode": "Unknown",
+        "pump": True,
+    }
+    assert table.apply({"tempCO": None, "power": 1}, keys=["tempCO"]) == {
+        "tempCO": None
+    }
+
+
+def test_merge_keeps_the_table():
+    """Merging returns a new table with both sets of keys."""
+    table = TransformTable({"power": scale(10)})
+    merged = table.merge({"tempCO": round_to(1)})
+
+    assert set(merged.keys()) == {"power", "tempCO"}
+    assert "tempCO" not in table
+
+
+def test_compile_transforms_rejects_conflicts():
+    """One key may only have one transform across the descriptions."""
+    descriptions = [
+        SimpleNamespace(key="tempCO", transform=round_to(1)),
+        SimpleNamespace(key="tempCO", transform=round_to(1)),
+        SimpleNamespace(key="mode", transform=None),
+    ]
+
+    assert compile_transforms(descriptions) == {"tempCO": round_to(1)}
+
+    with pytest.raises(ValueError, match="tempCO"):
+        compile_transforms(
+            [*descriptions, SimpleNamespace(key="tempCO", transform=scale(10))]
+        )